@@ -0,0 +1,195 @@
+"""Compare scan storage before and after moving payloads to a compressed side table.
+
+Builds a database in the pre-compression layout (JSON payload inline in `scans`),
+copies it, upgrades the copy with `ScanStore` migrations, then reports file size
+and query latency for both. A third database records the same scans through
+`save_scan`, where rescans are deduplicated or stored as deltas.
+
+    python benchmarks/payload_storage.py --scans 20000 --handles 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from reputation_pulse.storage import ScanStore
+
+LEGACY_SCHEMA = """
+CREATE TABLE scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    handle TEXT NOT NULL,
+    normalized_score REAL NOT NULL,
+    rating TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    scanned_at TEXT NOT NULL
+);
+CREATE INDEX idx_scans_handle_id ON scans (handle, id DESC, normalized_score, rating, scanned_at);
+CREATE INDEX idx_scans_scanned_at ON scans (scanned_at);
+PRAGMA user_version = 2;
+"""
+
+QUERIES = {
+    "latest 100 scans": "SELECT handle, normalized_score, rating, scanned_at "
+    "FROM scans ORDER BY id DESC LIMIT 100",
+    "score average (full scan)": "SELECT AVG(normalized_score) FROM scans",
+    "scans in last day": "SELECT COUNT(*) FROM scans WHERE scanned_at >= ?",
+}
+
+
+def _result(handle: str, rng: random.Random) -> dict[str, object]:
+    # Profile and repos are stable per handle, like real rescans; counters drift a little.
+    profile = random.Random(handle)
+    repos = [
+        {"name": f"repo-{index}", "pushed_at": "2026-01-01T00:00:00Z", "stargazers": index}
+        for index in range(profile.randint(0, 30))
+    ]
+    score = round(profile.uniform(0, 90) + rng.choice((0, 0, 0, 0.5)), 2)
+    return {
+        "handle": handle,
+        "github": {
+            "handle": handle,
+            "followers": profile.randint(0, 5000) + rng.randint(0, 2),
+            "following": profile.randint(0, 500),
+            "public_repos": len(repos),
+            "blog_url": f"https://{handle}.example.com",
+            "stars": profile.randint(0, 10000) + rng.randint(0, 3),
+            "recent_repos": repos,
+        },
+        "web": {"blog_url": f"https://{handle}.example.com", "recent_entries_30d": 2},
+        "score": {"normalized": score},
+        "summary": {
+            "rating": "Stable",
+            "normalized": score,
+            "recommendations": ["Push a recent change to demonstrate active work."],
+        },
+        "trend": {"direction": "flat", "delta": 0.0},
+    }
+
+
+def scan_results(scans: int, handles: int, seed: int) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    return [_result(f"user-{rng.randrange(handles)}", rng) for _ in range(scans)]
+
+
+def build_legacy(path: Path, results: list[dict[str, object]]) -> None:
+    start = datetime.now(timezone.utc) - timedelta(minutes=15 * len(results))
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO scans (handle, normalized_score, rating, payload, scanned_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                result["handle"],
+                result["score"]["normalized"],
+                "Stable",
+                json.dumps(result),
+                (start + timedelta(minutes=15 * index)).isoformat(),
+            )
+            for index, result in enumerate(results)
+        ],
+    )
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+
+def compact(store: ScanStore) -> None:
+    with store._connect() as conn:  # noqa: SLF001 - benchmark reaches into the store
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+    store.close()
+
+
+def _timed(repeat: int, run, *args: object) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run(*args)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def _fetch_all(conn: sqlite3.Connection, sql: str, params: tuple[object, ...]) -> list[tuple]:
+    return conn.execute(sql, params).fetchall()
+
+
+def measure(path: Path, latest_result, repeat: int) -> dict[str, float]:
+    since = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    conn = sqlite3.connect(path)
+    timings = {}
+    for name, sql in QUERIES.items():
+        timings[name] = _timed(repeat, _fetch_all, conn, sql, (since,) * sql.count("?"))
+    conn.close()
+    timings["latest result (decoded)"] = _timed(repeat, latest_result)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scans", type=int, default=20_000)
+    parser.add_argument("--handles", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        legacy = Path(workdir) / "legacy.db"
+        upgraded = Path(workdir) / "upgraded.db"
+        saved = Path(workdir) / "saved.db"
+        results = scan_results(args.scans, args.handles, args.seed)
+        build_legacy(legacy, results)
+        shutil.copy(legacy, upgraded)
+
+        migrate_started = time.perf_counter()
+        compact(ScanStore(db_path=str(upgraded)))
+        migrate_seconds = time.perf_counter() - migrate_started
+        save_started = time.perf_counter()
+        writer = ScanStore(db_path=str(saved))
+        for result in results:
+            writer.save_scan(result)
+        save_ms = (time.perf_counter() - save_started) / len(results) * 1000
+        compact(writer)
+
+        legacy_conn = sqlite3.connect(legacy)
+
+        def legacy_latest() -> object:
+            row = legacy_conn.execute(
+                "SELECT payload FROM scans WHERE handle = ? ORDER BY id DESC LIMIT 1",
+                ("user-1",),
+            ).fetchone()
+            return json.loads(row[0])
+
+        columns = {"inline JSON": measure(legacy, legacy_latest, args.repeat)}
+        sizes = {"inline JSON": legacy.stat().st_size}
+        for label, path in (("migrated", upgraded), ("saved", saved)):
+            store = ScanStore(db_path=str(path))
+            columns[label] = measure(
+                path,
+                lambda store=store: store.latest_result_for_handle("user-1"),
+                args.repeat,
+            )
+            store.close()
+            sizes[label] = path.stat().st_size
+        legacy_conn.close()
+
+        print(
+            f"{args.scans} scans over {args.handles} handles "
+            f"(migration {migrate_seconds:.2f}s, save_scan {save_ms:.3f} ms/scan)"
+        )
+        print(f"{'':<28}" + "".join(f"{label:>14}" for label in columns))
+        size_cells = "".join(f"{size / 1e6:>11.2f} MB" for size in sizes.values())
+        print(f"{'database size':<28}{size_cells}")
+        for name in columns["inline JSON"]:
+            timings = "".join(f"{column[name]:>11.3f} ms" for column in columns.values())
+            print(f"{name:<28}{timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,147 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Iterable, Mapping
+from typing import Any, TypeVar
 
+from reputation_pulse.async_storage import AsyncScanStore
+from reputation_pulse.batch import BatchResult, run_bounded
 from reputation_pulse.collectors.github import GitHubCollector
+from reputation_pulse.collectors.github_graphql import GitHubGraphQLCollector
 from reputation_pulse.collectors.rss import RssCollector
+from reputation_pulse.errors import CollectorError
 from reputation_pulse.handles import normalize_handle
 from reputation_pulse.reports import build_summary
 from reputation_pulse.scoring import calculate_score
+from reputation_pulse.settings import settings
+
+T = TypeVar("T")
+
+
+def _discard(task: asyncio.Future[Any]) -> None:
+    task.cancel()
+    # Consume the outcome so an already-failed speculative fetch is not reported as lost.
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
+async def _within(awaitable: Awaitable[T], until: float) -> T:
+    """Await until the loop time `until`; the awaitable is cancelled if it runs over."""
+    remaining = until - asyncio.get_running_loop().time()
+    return await asyncio.wait_for(awaitable, timeout=max(remaining, 0))
+
+
+def _missing_web(blog_url: str) -> dict[str, Any]:
+    return {"blog_url": blog_url, "feed_url": "", "recent_entries_30d": 0, "last_post_at": None}
 
 
 class ReputationAnalyzer:
     def __init__(
         self,
-        github_collector: GitHubCollector | None = None,
+        github_collector: GitHubCollector | GitHubGraphQLCollector | None = None,
         rss_collector: RssCollector | None = None,
+        store: AsyncScanStore | None = None,
     ) -> None:
         self.github_collector = github_collector or GitHubCollector()
         self.rss_collector = rss_collector or RssCollector()
+        self.store = store
+
+    async def run(
+        self,
+        handle: str,
+        deadline_seconds: float | None = None,
+        budgets: Mapping[str, float] | None = None,
+    ) -> dict[str, Any]:
+        """Analyze a handle within `deadline_seconds`, each collector within its budget.
 
-    async def run(self, handle: str) -> dict[str, Any]:
+        `budgets` maps "github" and "web" to seconds and defaults to the settings. A
+        collector that runs over is cancelled and its signal is taken from the last
+        stored scan ("stale") or left empty ("missing"); the result lists those under
+        `degraded`. GitHub drives the score, so it is an error only when it overruns
+        and there is no earlier scan to fall back on.
+        """
         normalized_handle = normalize_handle(handle)
-        github_data = await self.github_collector.collect(normalized_handle)
-        web_data = await self.rss_collector.collect(str(github_data.get("blog_url", "")))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline_at = started + (
+            settings.scan_deadline_seconds if deadline_seconds is None else deadline_seconds
+        )
+        limits = {
+            "github": settings.github_budget_seconds,
+            "web": settings.rss_budget_seconds,
+            **(budgets or {}),
+        }
+        previous = await self._previous_result(normalized_handle)
+        degraded: dict[str, str] = {}
+
+        # The blog URL normally comes from GitHub; guess it from the last scan so the
+        # feed can be read while GitHub is still answering.
+        guessed_blog_url = str(previous.get("github", {}).get("blog_url") or "")
+        web_task = (
+            asyncio.ensure_future(self.rss_collector.collect(guessed_blog_url))
+            if guessed_blog_url
+            else None
+        )
+        try:
+            github_data = await _within(
+                self.github_collector.collect(normalized_handle),
+                min(started + limits["github"], deadline_at),
+            )
+        except asyncio.TimeoutError as exc:
+            if not previous.get("github"):
+                if web_task is not None:
+                    _discard(web_task)
+                raise CollectorError(
+                    f"GitHub did not answer within {limits['github']:g}s "
+                    f"and '{normalized_handle}' has no earlier scan"
+                ) from exc
+            github_data = previous["github"]
+            degraded["github"] = "stale"
+        except BaseException:
+            if web_task is not None:
+                _discard(web_task)
+            raise
+
+        blog_url = str(github_data.get("blog_url", ""))
+        web_started = started
+        if web_task is None or blog_url != guessed_blog_url:
+            if web_task is not None:
+                _discard(web_task)
+            web_started = loop.time()
+            web_task = asyncio.ensure_future(self.rss_collector.collect(blog_url))
+        try:
+            web_data = await _within(web_task, min(web_started + limits["web"], deadline_at))
+        except asyncio.TimeoutError:
+            previous_web = previous.get("web")
+            if isinstance(previous_web, dict) and previous_web.get("blog_url") == blog_url:
+                web_data = previous_web
+                degraded["web"] = "stale"
+            else:
+                web_data = _missing_web(blog_url)
+                degraded["web"] = "missing"
+
         score = calculate_score(github_data)
-        summary = build_summary(github_data, score, web_data=web_data)
+        summary = build_summary(github_data, score, web_data=web_data, degraded=degraded)
         return {
             "handle": normalized_handle,
             "github": github_data,
             "web": web_data,
             "score": score.to_dict(),
             "summary": summary,
+            "degraded": degraded,
         }
+
+    def run_many(
+        self,
+        handles: Iterable[str],
+        concurrency: int | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Analyze many handles concurrently, yielding each result as it completes."""
+        return run_bounded(handles, self.run, concurrency)
+
+    async def _previous_result(self, handle: str) -> dict[str, Any]:
+        if self.store is None:
+            return {}
+        previous = await self.store.latest_result_for_handle(handle) or {}
+        if not isinstance(previous.get("github"), dict):
+            return {}
+        return previous
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 
 from reputation_pulse.errors import (
     CollectorError,
@@ -12,14 +16,29 @@ from reputation_pulse.errors import (
 from reputation_pulse.exporters import insights_to_csv, insights_to_json
 from reputation_pulse.handles import normalize_handle
 from reputation_pulse.html_report import render_html_report
-from reputation_pulse.models import ScanRequest
+from reputation_pulse.models import BatchScanRequest, ScanRequest
 from reputation_pulse.runtime import build_runtime
 
-app = FastAPI(title="Reputation Pulse API", version="0.1.0")
 runtime = build_runtime()
 store = runtime.store
+async_store = runtime.async_store
 scan_service = runtime.scan_service
+jobs = runtime.jobs
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    async with runtime.http, async_store:
+        await jobs.start()
+        try:
+            yield
+        finally:
+            await jobs.stop()
+
+
+app = FastAPI(title="Reputation Pulse API", version="0.1.0", lifespan=lifespan)
 NO_SCAN_HISTORY_DETAIL = "No scan history for this handle"
+NO_JOB_DETAIL = "No job with this id"
 
 
 def _normalize_or_400(handle: str) -> str:
@@ -56,23 +75,49 @@ async def scan(request: ScanRequest) -> dict[str, object]:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@app.post("/scans/batch", status_code=202, summary="Queue a batch scan job")
+async def scan_batch(request: BatchScanRequest) -> dict[str, object]:
+    return await jobs.submit(request.handles)
+
+
+@app.get("/jobs/{job_id}", summary="Get progress of a batch scan job")
+async def job_status(job_id: str) -> dict[str, object]:
+    # Progress only: a job can hold thousands of results, so they stay on /results.
+    job = await jobs.async_store.job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=NO_JOB_DETAIL)
+    return job
+
+
+@app.get("/jobs/{job_id}/results", summary="Stream batch scan job results as NDJSON")
+async def job_results(job_id: str, follow: bool = False) -> StreamingResponse:
+    if await jobs.async_store.job(job_id) is None:
+        raise HTTPException(status_code=404, detail=NO_JOB_DETAIL)
+
+    async def lines() -> AsyncIterator[str]:
+        async for record in jobs.results(job_id, follow=follow):
+            yield json.dumps(record) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @app.get("/history", summary="Get latest scans")
 async def history(limit: int = Query(default=10, ge=1, le=100)) -> dict[str, object]:
-    return {"items": store.latest_scans(limit=limit)}
+    return {"items": await async_store.latest_scans(limit=limit)}
 
 
 @app.get("/report/{handle}", response_class=HTMLResponse, summary="Get latest scan as HTML report")
 async def report(handle: str) -> HTMLResponse:
     normalized = _normalize_or_400(handle)
-    latest = _or_404(store.latest_result_for_handle(normalized))
-    series = store.score_series(normalized, limit=30)
+    latest = _or_404(await async_store.latest_result_for_handle(normalized))
+    series = await async_store.score_series(normalized, limit=30)
     return HTMLResponse(content=render_html_report(latest, score_series=series))
 
 
 @app.get("/insights/{handle}", summary="Get aggregated insights for a handle")
 async def insights(handle: str) -> dict[str, object]:
     normalized = _normalize_or_400(handle)
-    return _or_404(store.handle_insights(normalized))
+    return _or_404(await async_store.handle_insights(normalized))
 
 
 @app.get("/series/{handle}", summary="Get score time series for a handle")
@@ -81,7 +126,7 @@ async def series(
     limit: int = Query(default=30, ge=1, le=365),
 ) -> dict[str, object]:
     normalized = _normalize_or_400(handle)
-    points = store.score_series(normalized, limit=limit)
+    points = await async_store.score_series(normalized, limit=limit)
     if not points:
         raise HTTPException(status_code=404, detail=NO_SCAN_HISTORY_DETAIL)
     return {"handle": normalized, "items": points}
@@ -93,7 +138,7 @@ async def insights_export(
     format: str = Query(default="json", pattern="^(json|csv)$"),
 ) -> Response:
     normalized = _normalize_or_400(handle)
-    insight = _or_404(store.handle_insights(normalized))
+    insight = _or_404(await async_store.handle_insights(normalized))
     if format == "csv":
         return Response(
             content=insights_to_csv(insight),
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+
+class AsyncScanStore:
+    """Awaitable view of a `ScanStore` for code running on the event loop.
+
+    Every call runs on a dedicated pool of `Settings.storage_threads` threads, each
+    with its own SQLite connection, so a slow query or a write waiting for the lock
+    only holds up its own caller. The wrapped store's method is looked up on each
+    call, so patching the store itself still takes effect. The pool starts with the
+    first call and can be reopened after `aclose`, like `SharedHttpClient`.
+    """
+
+    def __init__(self, store: ScanStore, max_workers: int | None = None) -> None:
+        self.store = store
+        self.max_workers = max_workers or settings.storage_threads
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="scan-store",
+            )
+        return self._executor
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(getattr(self.store, method), *args, **kwargs)
+        return await loop.run_in_executor(self.executor, call)
+
+    async def aclose(self) -> None:
+        """Let queued calls finish, then stop the pool's threads and close their connections."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+            self.store.close_exited_threads()
+
+    async def __aenter__(self) -> AsyncScanStore:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def save_scan(self, result: dict[str, object]) -> None:
+        await self._call("save_scan", result)
+
+    async def latest_scans(self, limit: int = 10) -> list[dict[str, object]]:
+        return await self._call("latest_scans", limit=limit)
+
+    async def latest_scan_for_handle(self, handle: str) -> dict[str, object] | None:
+        return await self._call("latest_scan_for_handle", handle)
+
+    async def latest_result_for_handle(self, handle: str) -> dict[str, object] | None:
+        return await self._call("latest_result_for_handle", handle)
+
+    async def handle_insights(self, handle: str) -> dict[str, object] | None:
+        return await self._call("handle_insights", handle)
+
+    async def score_series(self, handle: str, limit: int = 30) -> list[dict[str, object]]:
+        return await self._call("score_series", handle, limit=limit)
+
+    async def create_job(self, job_id: str, handles: list[str]) -> None:
+        await self._call("create_job", job_id, handles)
+
+    async def job(self, job_id: str) -> dict[str, object] | None:
+        return await self._call("job", job_id)
+
+    async def unfinished_jobs(self) -> list[str]:
+        return await self._call("unfinished_jobs")
+
+    async def pending_job_handles(self, job_id: str) -> list[str]:
+        return await self._call("pending_job_handles", job_id)
+
+    async def save_job_result(self, job_id: str, record: dict[str, object]) -> None:
+        await self._call("save_job_result", job_id, record)
+
+    async def job_results(
+        self,
+        job_id: str,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[tuple[int, dict[str, object]]]:
+        return await self._call("job_results", job_id, after_id=after_id, limit=limit)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from reputation_pulse.errors import InvalidHandleError
+from reputation_pulse.handles import normalize_handle
+from reputation_pulse.settings import settings
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    handle: str
+    result: dict[str, Any] | None = None
+    error_type: str | None = None
+    error_message: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error_type is None
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.ok:
+            return {"handle": self.handle, "status": "ok", "result": self.result}
+        return {
+            "handle": self.handle,
+            "status": "error",
+            "error": {"type": self.error_type, "message": self.error_message},
+        }
+
+
+def unique_handles(handles: Iterable[str]) -> Iterator[str]:
+    """Yield each handle once by its normalized form; invalid handles pass through as given."""
+    seen: set[str] = set()
+    for raw in handles:
+        try:
+            handle = normalize_handle(raw)
+        except InvalidHandleError:
+            handle = raw
+        if handle in seen:
+            continue
+        seen.add(handle)
+        yield handle
+
+
+async def run_bounded(
+    handles: Iterable[str],
+    scan: Callable[[str], Awaitable[dict[str, Any]]],
+    concurrency: int | None = None,
+) -> AsyncIterator[BatchResult]:
+    """Scan handles with at most `concurrency` in flight, yielding results as they finish.
+
+    Workers hand results over through a queue no larger than the worker pool, so a
+    slow consumer stops new scans from starting instead of buffering the batch. A
+    failing handle becomes an error record; closing the iterator cancels the rest.
+    """
+    limit = max(1, settings.batch_concurrency if concurrency is None else concurrency)
+    source = unique_handles(handles)
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=limit)
+
+    async def worker() -> None:
+        for handle in source:
+            await queue.put(await scan_one(handle, scan))
+        await queue.put(_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(limit)]
+    try:
+        finished = 0
+        while finished < len(workers):
+            item = await queue.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            yield item  # type: ignore[misc]
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+async def scan_one(
+    handle: str,
+    scan: Callable[[str], Awaitable[dict[str, Any]]],
+) -> BatchResult:
+    """Run one scan, turning a failure into an error record."""
+    try:
+        result = await scan(handle)
+    except Exception as exc:
+        return BatchResult(handle=handle, error_type=type(exc).__name__, error_message=str(exc))
+    return BatchResult(handle=handle, result=result)
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from reputation_pulse.settings import settings
 
 
+@dataclass(frozen=True)
+class CacheEntry:
+    data: dict[str, object]
+    stored_at: datetime
+    meta: dict[str, object] = field(default_factory=dict)
+
+    def is_fresh(self, ttl_seconds: int) -> bool:
+        return datetime.now(timezone.utc) - self.stored_at <= timedelta(seconds=ttl_seconds)
+
+
 class CacheStore:
     def __init__(self, base_dir: str | None = None) -> None:
         self.base_dir = Path(base_dir or settings.cache_dir)
@@ -17,6 +28,13 @@ class CacheStore:
         return self.base_dir / f"{safe_key}.json"
 
     def get(self, key: str, ttl_seconds: int) -> dict[str, object] | None:
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_fresh(ttl_seconds):
+            return None
+        return entry.data
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Return the stored entry regardless of its age, e.g. to revalidate it."""
         path = self._file(key)
         if not path.exists():
             return None
@@ -24,15 +42,31 @@ class CacheStore:
             payload = json.loads(path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
             return None
-        stored_at = datetime.fromisoformat(payload["stored_at"])
-        if datetime.now(timezone.utc) - stored_at > timedelta(seconds=ttl_seconds):
-            return None
-        return payload["data"]
+        return CacheEntry(
+            data=payload["data"],
+            stored_at=datetime.fromisoformat(payload["stored_at"]),
+            meta=payload.get("meta") or {},
+        )
 
-    def set(self, key: str, data: dict[str, object]) -> None:
+    def set(
+        self,
+        key: str,
+        data: dict[str, object],
+        meta: dict[str, object] | None = None,
+    ) -> None:
         path = self._file(key)
-        payload = {
+        payload: dict[str, object] = {
             "stored_at": datetime.now(timezone.utc).isoformat(),
             "data": data,
         }
+        if meta:
+            payload["meta"] = meta
         path.write_text(json.dumps(payload), encoding="utf-8")
+
+    def touch(self, key: str) -> bool:
+        """Restart the TTL of an existing entry without rewriting its data."""
+        entry = self.get_entry(key)
+        if entry is None:
+            return False
+        self.set(key, entry.data, meta=entry.meta)
+        return True
@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import TypeVar
+import sys
+from typing import TextIO, TypeVar
 
 import typer
 import uvicorn
 from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.table import Table
 
+from reputation_pulse.batch import unique_handles
 from reputation_pulse.errors import (
     CollectorError,
     InvalidHandleError,
@@ -18,14 +27,21 @@ from reputation_pulse.errors import (
 from reputation_pulse.exporters import insights_to_csv, insights_to_json, write_export
 from reputation_pulse.handles import normalize_handle
 from reputation_pulse.html_report import default_report_path, write_html_report
+from reputation_pulse.retention import compact as compact_history
 from reputation_pulse.runtime import build_runtime
+from reputation_pulse.scheduler import RescanScheduler
+from reputation_pulse.settings import settings
+from reputation_pulse.worker import QueueWorker
 
 app = typer.Typer(help="Reputation Pulse CLI")
 console = Console()
+# Progress goes to stderr so NDJSON on stdout stays machine-readable.
+progress_console = Console(stderr=True)
 runtime = build_runtime()
 store = runtime.store
 scan_service = runtime.scan_service
 T = TypeVar("T")
+TRACK_HANDLES_ARGUMENT = typer.Argument(None, help="Handles to start tracking")
 
 
 def _not_found_message(handle: str) -> str:
@@ -47,6 +63,45 @@ def _require_or_exit(payload: T | None, handle: str) -> T:
     return payload
 
 
+async def _run_scan(handle: str) -> dict[str, object]:
+    async with runtime.http, runtime.async_store:
+        return await scan_service.run_and_store(handle)
+
+
+async def _run_batch(
+    handles: list[str],
+    stream: TextIO,
+    concurrency: int,
+    progress: Progress,
+) -> tuple[int, int]:
+    task = progress.add_task("Scanning", total=len(handles), rate="0.0", errors=0)
+    completed = errors = 0
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with runtime.http, runtime.async_store:
+        async for record in scan_service.run_many(handles, concurrency=concurrency):
+            stream.write(json.dumps(record.to_dict()) + "\n")
+            stream.flush()
+            completed += 1
+            errors += 0 if record.ok else 1
+            rate = completed / max(loop.time() - started, 1e-9)
+            progress.update(task, advance=1, rate=f"{rate:.1f}", errors=errors)
+    return completed, errors
+
+
+def _read_handles(source: str) -> list[str]:
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            with open(source, encoding="utf-8") as handle_file:
+                lines = handle_file.read().splitlines()
+        except OSError as exc:
+            console.print(f"[red]Cannot read handles:[/red] {exc}")
+            raise typer.Exit(code=2) from exc
+    return [line for line in lines if line.strip()]
+
+
 def _display_summary(result: dict[str, object]) -> None:
     score = result["score"]
     summary = result["summary"]
@@ -58,6 +113,8 @@ def _display_summary(result: dict[str, object]) -> None:
     table.add_row("Stars", str(result["github"]["stars"]))
     table.add_row("Recent repos", str(score["recent_repos"]))
     table.add_row("Recent web posts (30d)", str(result["web"]["recent_entries_30d"]))
+    for signal, state in sorted((result.get("degraded") or {}).items()):
+        table.add_row("Partial result", f"[yellow]{signal} {state}[/yellow]")
 
     console.print(table)
     if summary["recommendations"]:
@@ -73,7 +130,7 @@ def scan(
 ) -> None:
     """Scan a public handle and report its reputation score."""
     try:
-        result = asyncio.run(scan_service.run_and_store(handle))
+        result = asyncio.run(_run_scan(handle))
     except InvalidHandleError as exc:
         console.print(f"[red]Invalid handle:[/red] {exc}")
         raise typer.Exit(code=2) from exc
@@ -93,6 +150,140 @@ def scan(
     _display_summary(result)
 
 
+@app.command("scan-batch")
+def scan_batch(
+    source: str = typer.Argument("-", help="File with one handle per line, or - for stdin"),
+    output: str = typer.Option("", "--output", help="Write NDJSON here instead of stdout"),
+    concurrency: int = typer.Option(
+        settings.batch_concurrency,
+        "--concurrency",
+        min=1,
+        help="Scans in flight",
+    ),
+    skip_scanned_within: int = typer.Option(
+        0,
+        "--skip-scanned-within",
+        min=0,
+        help="Skip handles already scanned in the last N seconds (resume a batch)",
+    ),
+) -> None:
+    """Scan many handles concurrently and stream one JSON line per result."""
+    handles = list(unique_handles(_read_handles(source)))
+    skipped = 0
+    if skip_scanned_within:
+        pending = [
+            handle
+            for handle in handles
+            if not scan_service.scanned_within(handle, skip_scanned_within)
+        ]
+        skipped = len(handles) - len(pending)
+        handles = pending
+
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("{task.fields[rate]} handles/s"),
+        TextColumn("[red]{task.fields[errors]} errors"),
+        TimeElapsedColumn(),
+        console=progress_console,
+    )
+    stream = open(output, "w", encoding="utf-8") if output else sys.stdout
+    try:
+        with progress:
+            completed, errors = asyncio.run(_run_batch(handles, stream, concurrency, progress))
+    finally:
+        if output:
+            stream.close()
+    progress_console.print(
+        f"Scanned {completed} handles ({errors} errors, {skipped} skipped as recent)"
+    )
+
+
+async def _run_scheduler(rescan_scheduler: RescanScheduler, max_scans: int | None) -> int:
+    async with runtime.http, runtime.async_store:
+        return await rescan_scheduler.run(max_scans=max_scans)
+
+
+@app.command()
+def scheduler(
+    handles: list[str] = TRACK_HANDLES_ARGUMENT,
+    concurrency: int = typer.Option(
+        settings.scheduler_concurrency,
+        "--concurrency",
+        min=1,
+        help="Scans in flight",
+    ),
+    scans_per_minute: float = typer.Option(
+        settings.scheduler_scans_per_minute,
+        "--scans-per-minute",
+        min=0.1,
+        help="Rate at which new scans may start",
+    ),
+    max_scans: int = typer.Option(0, "--max-scans", min=0, help="Stop after N scans (0: never)"),
+) -> None:
+    """Keep tracked handles fresh, rescanning active handles more often than dormant ones."""
+    handles = [_normalize_or_exit(handle) for handle in handles or []]
+    rescan_scheduler = RescanScheduler(
+        scan_service,
+        store,
+        concurrency=concurrency,
+        scans_per_minute=scans_per_minute,
+    )
+    if handles:
+        added = rescan_scheduler.track(handles)
+        console.print(f"Tracking {added} new handles")
+    try:
+        scanned = asyncio.run(_run_scheduler(rescan_scheduler, max_scans or None))
+    except KeyboardInterrupt:
+        console.print("Scheduler stopped")
+        return
+    console.print(f"Scheduler stopped after {scanned} scans")
+
+
+@app.command()
+def enqueue(
+    source: str = typer.Argument("-", help="File with one handle per line, or - for stdin"),
+) -> None:
+    """Add handles to the shared work queue consumed by `worker` processes."""
+    handles = list(unique_handles(_read_handles(source)))
+    added = store.enqueue_handles(handles)
+    console.print(f"Queued {added} handles ({len(handles) - added} already pending)")
+
+
+async def _run_worker(queue_worker: QueueWorker, until_empty: bool) -> int:
+    async with runtime.http, runtime.async_store:
+        return await queue_worker.run(until_empty=until_empty)
+
+
+@app.command()
+def worker(
+    concurrency: int = typer.Option(
+        settings.worker_concurrency,
+        "--concurrency",
+        min=1,
+        help="Scans in flight in this process",
+    ),
+    until_empty: bool = typer.Option(
+        False,
+        "--until-empty",
+        help="Exit once no queued handle is ready instead of waiting for more",
+    ),
+) -> None:
+    """Scan handles from the shared work queue; run one per core to scale out."""
+    queue_worker = QueueWorker(scan_service, store, concurrency=concurrency)
+    console.print(f"Worker {queue_worker.worker_id} started")
+    try:
+        asyncio.run(_run_worker(queue_worker, until_empty))
+    except KeyboardInterrupt:
+        pass
+    stats = store.queue_stats()
+    console.print(
+        f"Worker stopped: {queue_worker.processed} scanned, {queue_worker.failed} failed; "
+        f"queue has {stats['ready']} ready, {stats['retrying']} retrying, {stats['dead']} dead"
+    )
+
+
 @app.command()
 def api(host: str = "127.0.0.1", port: int = 8000, reload: bool = False) -> None:
     """Start the Reputation Pulse API."""
@@ -155,6 +346,32 @@ def insights(handle: str) -> None:
     console.print(table)
 
 
+@app.command("rebuild-stats")
+def rebuild_stats() -> None:
+    """Recompute per-handle insight aggregates from the stored scan history."""
+    handles = store.rebuild_handle_stats()
+    console.print(f"Rebuilt insights for {handles} handles")
+
+
+@app.command()
+def compact(
+    batch_size: int = typer.Option(
+        settings.compaction_batch_size, "--batch-size", min=1, help="Rows per transaction"
+    ),
+    max_batches: int = typer.Option(
+        0, "--max-batches", min=0, help="Stop after this many batches (0 for no limit)"
+    ),
+) -> None:
+    """Roll old scans up into daily and weekly buckets and drop unreferenced payloads."""
+    report = compact_history(store, batch_size=batch_size, max_batches=max_batches or None)
+    console.print(
+        f"Rolled up {report.scans_rolled_up} scans into days and "
+        f"{report.days_rolled_up} days into weeks; removed {report.payloads_removed} payloads"
+    )
+    if not report.complete:
+        console.print("Stopped at --max-batches; run again to continue")
+
+
 @app.command("insights-export")
 def insights_export(
     handle: str,
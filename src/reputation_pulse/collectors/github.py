@@ -1,49 +1,133 @@
 from __future__ import annotations
 
+import asyncio
+import math
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
 
 from reputation_pulse.cache import CacheStore
+from reputation_pulse.collectors.rate_limit import GitHubRateLimiter
 from reputation_pulse.errors import CollectorError, UpstreamNotFoundError, UpstreamRateLimitError
+from reputation_pulse.http_client import (
+    SharedHttpClient,
+    conditional_headers,
+    response_validators,
+)
 from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+USER_FIELDS = ("followers", "following", "public_repos", "created_at", "updated_at", "blog")
+REPO_FIELDS = ("name", "pushed_at", "stargazers_count")
+
+
+def _ledger_rows(repos: list[dict[str, Any]]) -> dict[str, dict[str, object]]:
+    return {
+        str(repo.get("name")): {
+            "stars": repo.get("stargazers_count", 0),
+            "pushed_at": repo.get("pushed_at"),
+        }
+        for repo in repos
+    }
+
+
+class _Revalidation:
+    """Validators and trimmed bodies from the previous scan, plus what changed since."""
+
+    def __init__(self, meta: dict[str, Any] | None = None) -> None:
+        meta = meta or {}
+        self.validators: dict[str, dict[str, str]] = dict(meta.get("validators") or {})
+        self.user: dict[str, Any] | None = meta.get("user")
+        self.pages: dict[str, list[dict[str, Any]]] = dict(meta.get("repo_pages") or {})
+        self.seen_pages: set[str] = set()
+        self.changed = False
+
+    def cached_validators(self, key: str, has_body: bool) -> dict[str, str] | None:
+        # Only send validators when we can still serve the body a 304 refers to.
+        return self.validators.get(key) if has_body else None
+
+    def to_meta(self) -> dict[str, Any]:
+        pages = {key: self.pages[key] for key in sorted(self.seen_pages, key=int)}
+        validators = {
+            key: value
+            for key, value in self.validators.items()
+            if not key.startswith("repos:") or key.split(":", 1)[1] in pages
+        }
+        return {"validators": validators, "user": self.user, "repo_pages": pages}
 
 
 class GitHubCollector:
-    def __init__(self, cache: CacheStore | None = None) -> None:
+    def __init__(
+        self,
+        cache: CacheStore | None = None,
+        http: SharedHttpClient | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+        ledger: ScanStore | None = None,
+    ) -> None:
         self.cache = cache or CacheStore()
+        self.http = http or SharedHttpClient()
+        self.rate_limiter = rate_limiter or GitHubRateLimiter(settings.github_tokens)
+        self.ledger = ledger
 
     def _headers(self) -> dict[str, str]:
-        headers = {"Accept": "application/vnd.github+json", "User-Agent": "reputation-pulse/0.1.0"}
-        if settings.github_token:
-            headers["Authorization"] = f"Bearer {settings.github_token}"
-        return headers
+        return {"Accept": "application/vnd.github+json", "User-Agent": "reputation-pulse/0.1.0"}
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, object] | None = None,
+    ) -> httpx.Response:
+        # Rate-limited answers are retried on whichever credential has budget left.
+        for _ in range(settings.github_rate_limit_retries + 1):
+            credential = await self.rate_limiter.acquire()
+            response = await client.get(
+                url,
+                params=params,
+                headers={**headers, **credential.auth_headers()},
+            )
+            if not self.rate_limiter.observe(credential, response):
+                break
+        return response
 
     async def collect(self, handle: str) -> dict[str, Any]:
         cache_key = f"github:{handle}"
-        cached = self.cache.get(cache_key, settings.github_cache_ttl_seconds)
-        if cached is not None:
-            return cached
+        # Cache files and the ledger are read off the event loop.
+        entry = await asyncio.to_thread(self.cache.get_entry, cache_key)
+        if entry is not None and entry.is_fresh(settings.github_cache_ttl_seconds):
+            return entry.data
 
+        state = _Revalidation(entry.meta if entry is not None else None)
         headers = self._headers()
-        async with httpx.AsyncClient(timeout=settings.default_timeout) as client:
-            try:
-                user_resp = await client.get(
-                    settings.github_user_url.format(handle=handle),
-                    headers=headers,
+        client = self.http.client
+        user_data = await self._fetch_user(handle, headers, client, state)
+        public_repos = int(user_data.get("public_repos") or 0)
+        repo_data = None
+        ledger = await asyncio.to_thread(self._usable_ledger, handle)
+        if ledger is not None:
+            repo_data = await self._refresh_from_ledger(
+                handle, headers, client, public_repos, state, ledger
+            )
+        if repo_data is None:
+            repo_data = await self._collect_all_repos(
+                handle,
+                headers,
+                client,
+                public_repos=public_repos,
+                state=state,
+            )
+            if self.ledger is not None:
+                await asyncio.to_thread(
+                    self.ledger.replace_repo_ledger, handle, _ledger_rows(repo_data)
                 )
-                repo_data = await self._collect_all_repos(handle, headers, client)
-            except httpx.HTTPError as exc:
-                raise CollectorError(f"GitHub request failed: {exc}") from exc
 
-        if user_resp.status_code == 404:
-            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
-        if user_resp.status_code in (403, 429):
-            raise UpstreamRateLimitError("GitHub rate limit reached")
-        if user_resp.status_code >= 400:
-            raise CollectorError(f"GitHub user lookup failed with status {user_resp.status_code}")
+        if entry is not None and not state.changed:
+            # Everything answered 304: keep the cached result and just restart its TTL.
+            await asyncio.to_thread(self.cache.touch, cache_key)
+            return entry.data
 
-        user_data = user_resp.json()
         stars = sum(repo.get("stargazers_count", 0) for repo in repo_data)
         recent_repos = [
             {
@@ -69,41 +153,217 @@ class GitHubCollector:
             "stars": stars,
             "recent_repos": recent_repos,
         }
-        self.cache.set(cache_key, result)
+        await asyncio.to_thread(self.cache.set, cache_key, result, meta=state.to_meta())
         return result
 
+    async def _fetch_user(
+        self,
+        handle: str,
+        headers: dict[str, str],
+        client: httpx.AsyncClient,
+        state: _Revalidation,
+    ) -> dict[str, Any]:
+        try:
+            user_resp = await self._get(
+                client,
+                settings.github_user_url.format(handle=handle),
+                conditional_headers(
+                    headers,
+                    state.cached_validators("user", state.user is not None),
+                ),
+            )
+        except httpx.HTTPError as exc:
+            raise CollectorError(f"GitHub request failed: {exc}") from exc
+
+        if user_resp.status_code == 304 and state.user is not None:
+            return state.user
+        if user_resp.status_code == 404:
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        if user_resp.status_code in (403, 429):
+            raise UpstreamRateLimitError("GitHub rate limit reached")
+        if user_resp.status_code >= 400:
+            raise CollectorError(f"GitHub user lookup failed with status {user_resp.status_code}")
+
+        user_data = user_resp.json()
+        state.changed = True
+        state.user = {key: user_data.get(key) for key in USER_FIELDS}
+        state.validators["user"] = response_validators(user_resp)
+        return user_data
+
     async def _collect_all_repos(
         self,
         handle: str,
         headers: dict[str, str],
         client: httpx.AsyncClient,
+        public_repos: int = 0,
+        state: _Revalidation | None = None,
     ) -> list[dict[str, Any]]:
-        repos: list[dict[str, Any]] = []
-        for page in range(1, settings.github_max_repo_pages + 1):
-            try:
-                repos_resp = await client.get(
-                    settings.github_repos_url.format(handle=handle),
-                    params={"per_page": settings.github_repos_per_page, "page": page},
-                    headers=headers,
-                )
-            except httpx.HTTPError as exc:
-                raise CollectorError(f"GitHub repos request failed: {exc}") from exc
-
-            if repos_resp.status_code == 404:
-                raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
-            if repos_resp.status_code in (403, 429):
-                raise UpstreamRateLimitError("GitHub rate limit reached")
-            if repos_resp.status_code >= 400:
-                raise CollectorError(
-                    f"GitHub repos lookup failed with status {repos_resp.status_code}"
-                )
+        state = state or _Revalidation()
+        per_page = settings.github_repos_per_page
+        max_pages = settings.github_max_repo_pages
+        expected_pages = min(max(1, math.ceil(public_repos / per_page)), max_pages)
+        semaphore = asyncio.Semaphore(settings.github_page_concurrency)
+
+        async def fetch(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_repo_page(handle, page, headers, client, state)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(1, expected_pages + 1)]
+        try:
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
-            payload = repos_resp.json()
-            if not isinstance(payload, list):
-                raise CollectorError("GitHub repos payload is invalid")
+        repos: list[dict[str, Any]] = []
+        for payload in pages:
+            repos.extend(payload)
+            if len(payload) < per_page:
+                return repos
 
+        # Every expected page was full, so `public_repos` was stale: keep paging.
+        for page in range(expected_pages + 1, max_pages + 1):
+            payload = await self._fetch_repo_page(handle, page, headers, client, state)
             repos.extend(payload)
-            if len(payload) < settings.github_repos_per_page:
+            if len(payload) < per_page:
                 break
-
         return repos
+
+    async def _fetch_repo_page(
+        self,
+        handle: str,
+        page: int,
+        headers: dict[str, str],
+        client: httpx.AsyncClient,
+        state: _Revalidation,
+    ) -> list[dict[str, Any]]:
+        page_key = str(page)
+        cached_page = state.pages.get(page_key)
+        state.seen_pages.add(page_key)
+        try:
+            repos_resp = await self._get(
+                client,
+                settings.github_repos_url.format(handle=handle),
+                conditional_headers(
+                    headers,
+                    state.cached_validators(f"repos:{page}", cached_page is not None),
+                ),
+                params={"per_page": settings.github_repos_per_page, "page": page},
+            )
+        except httpx.HTTPError as exc:
+            raise CollectorError(f"GitHub repos request failed: {exc}") from exc
+
+        if repos_resp.status_code == 304 and cached_page is not None:
+            return cached_page
+        payload = self._repos_payload(handle, repos_resp)
+        state.changed = True
+        state.pages[page_key] = [{key: repo.get(key) for key in REPO_FIELDS} for repo in payload]
+        state.validators[f"repos:{page}"] = response_validators(repos_resp)
+        return payload
+
+    def _repos_payload(self, handle: str, repos_resp: httpx.Response) -> list[dict[str, Any]]:
+        if repos_resp.status_code == 404:
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        if repos_resp.status_code in (403, 429):
+            raise UpstreamRateLimitError("GitHub rate limit reached")
+        if repos_resp.status_code >= 400:
+            raise CollectorError(f"GitHub repos lookup failed with status {repos_resp.status_code}")
+
+        payload = repos_resp.json()
+        if not isinstance(payload, list):
+            raise CollectorError("GitHub repos payload is invalid")
+        return payload
+
+    def _usable_ledger(self, handle: str) -> dict[str, Any] | None:
+        if self.ledger is None:
+            return None
+        ledger = self.ledger.repo_ledger(handle)
+        if ledger is None:
+            return None
+        refreshed_at = datetime.fromisoformat(str(ledger["full_refresh_at"]))
+        max_age = timedelta(seconds=settings.github_ledger_full_refresh_seconds)
+        if datetime.now(timezone.utc) - refreshed_at > max_age:
+            return None
+        return ledger
+
+    async def _refresh_from_ledger(
+        self,
+        handle: str,
+        headers: dict[str, str],
+        client: httpx.AsyncClient,
+        public_repos: int,
+        state: _Revalidation,
+        ledger: dict[str, Any],
+    ) -> list[dict[str, Any]] | None:
+        """Page through repos newest-push first until reaching ones the ledger already has.
+
+        Returns None when the merged ledger no longer matches the user's repo count
+        (deleted or renamed repos), so the caller falls back to a full listing. Past
+        the listing cap neither path sees every repo, so the ledger only has to be full.
+        """
+        repos: dict[str, dict[str, object]] = dict(ledger["repos"])
+        changed: dict[str, dict[str, object]] = {}
+        for page in range(1, settings.github_max_repo_pages + 1):
+            payload = await self._fetch_pushed_page(handle, page, headers, client, state)
+            if payload is None:
+                break
+            reached_known = False
+            for repo in payload:
+                name = str(repo.get("name"))
+                known = repos.get(name)
+                if known is not None and known.get("pushed_at") == repo.get("pushed_at"):
+                    reached_known = True
+                changed[name] = {
+                    "stars": repo.get("stargazers_count", 0),
+                    "pushed_at": repo.get("pushed_at"),
+                }
+            if reached_known or len(payload) < settings.github_repos_per_page:
+                break
+
+        repos.update(changed)
+        listing_cap = settings.github_max_repo_pages * settings.github_repos_per_page
+        if public_repos > listing_cap:
+            if len(repos) < listing_cap:
+                return None
+        elif len(repos) != public_repos:
+            return None
+        if changed:
+            await asyncio.to_thread(self.ledger.update_repo_ledger, handle, changed)
+        return [
+            {"name": name, "pushed_at": repo["pushed_at"], "stargazers_count": repo["stars"]}
+            for name, repo in repos.items()
+        ]
+
+    async def _fetch_pushed_page(
+        self,
+        handle: str,
+        page: int,
+        headers: dict[str, str],
+        client: httpx.AsyncClient,
+        state: _Revalidation,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch one page sorted by push date; None means page 1 is unchanged (304)."""
+        validator_key = f"pushed:{page}"
+        try:
+            repos_resp = await self._get(
+                client,
+                settings.github_repos_url.format(handle=handle),
+                conditional_headers(headers, state.validators.get(validator_key)),
+                params={
+                    "per_page": settings.github_repos_per_page,
+                    "page": page,
+                    "sort": "pushed",
+                    "direction": "desc",
+                },
+            )
+        except httpx.HTTPError as exc:
+            raise CollectorError(f"GitHub repos request failed: {exc}") from exc
+
+        if repos_resp.status_code == 304:
+            return None
+        payload = self._repos_payload(handle, repos_resp)
+        state.changed = True
+        if page == 1:
+            state.validators[validator_key] = response_validators(repos_resp)
+        return payload
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+
+from reputation_pulse.cache import CacheStore
+from reputation_pulse.collectors.rate_limit import GitHubRateLimiter
+from reputation_pulse.errors import CollectorError, UpstreamNotFoundError, UpstreamRateLimitError
+from reputation_pulse.http_client import SharedHttpClient
+from reputation_pulse.settings import settings
+
+REPOSITORY_FILTER = "ownerAffiliations: OWNER, privacy: PUBLIC"
+
+USER_QUERY = f"""
+query($login: String!, $recent: Int!, $pageSize: Int!) {{
+  user(login: $login) {{
+    createdAt
+    updatedAt
+    websiteUrl
+    followers {{ totalCount }}
+    following {{ totalCount }}
+    recent: repositories(
+      first: $recent, {REPOSITORY_FILTER}, orderBy: {{field: PUSHED_AT, direction: DESC}}
+    ) {{
+      nodes {{ name pushedAt stargazerCount }}
+    }}
+    repositories(first: $pageSize, {REPOSITORY_FILTER}) {{
+      totalCount
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{ stargazerCount }}
+    }}
+  }}
+}}
+"""
+
+STARS_PAGE_QUERY = f"""
+query($login: String!, $pageSize: Int!, $cursor: String!) {{
+  user(login: $login) {{
+    repositories(first: $pageSize, after: $cursor, {REPOSITORY_FILTER}) {{
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{ stargazerCount }}
+    }}
+  }}
+}}
+"""
+
+
+class GitHubGraphQLCollector:
+    """Collects the same payload as `GitHubCollector` from the GraphQL API.
+
+    The first query returns the profile counters, the most recently pushed repos and
+    the first page of star counts; further pages are only requested when the account
+    has more repositories than fit in one page.
+    """
+
+    def __init__(
+        self,
+        cache: CacheStore | None = None,
+        http: SharedHttpClient | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ) -> None:
+        self.cache = cache or CacheStore()
+        self.http = http or SharedHttpClient()
+        self.rate_limiter = rate_limiter or GitHubRateLimiter(settings.github_tokens)
+
+    def _headers(self) -> dict[str, str]:
+        return {"Accept": "application/vnd.github+json", "User-Agent": "reputation-pulse/0.1.0"}
+
+    async def collect(self, handle: str) -> dict[str, Any]:
+        cache_key = f"github:{handle}"
+        cached = await asyncio.to_thread(
+            self.cache.get, cache_key, settings.github_cache_ttl_seconds
+        )
+        if cached is not None:
+            return cached
+
+        page_size = settings.github_repos_per_page
+        user = await self._query(
+            handle,
+            USER_QUERY,
+            {"login": handle, "recent": settings.max_recent_repos, "pageSize": page_size},
+        )
+        repositories = user["repositories"]
+        stars = sum(node.get("stargazerCount", 0) for node in repositories["nodes"])
+        page_info = repositories["pageInfo"]
+        pages = 1
+        while page_info["hasNextPage"] and pages < settings.github_max_repo_pages:
+            next_page = (
+                await self._query(
+                    handle,
+                    STARS_PAGE_QUERY,
+                    {"login": handle, "pageSize": page_size, "cursor": page_info["endCursor"]},
+                )
+            )["repositories"]
+            stars += sum(node.get("stargazerCount", 0) for node in next_page["nodes"])
+            page_info = next_page["pageInfo"]
+            pages += 1
+
+        result = {
+            "handle": handle,
+            "followers": user["followers"]["totalCount"],
+            "following": user["following"]["totalCount"],
+            "public_repos": repositories["totalCount"],
+            "created_at": user.get("createdAt"),
+            "updated_at": user.get("updatedAt"),
+            "blog_url": user.get("websiteUrl") or "",
+            "stars": stars,
+            "recent_repos": [
+                {
+                    "name": node.get("name"),
+                    "pushed_at": node.get("pushedAt"),
+                    "stargazers": node.get("stargazerCount", 0),
+                }
+                for node in user["recent"]["nodes"]
+            ],
+        }
+        await asyncio.to_thread(self.cache.set, cache_key, result)
+        return result
+
+    async def _query(
+        self,
+        handle: str,
+        query: str,
+        variables: dict[str, object],
+    ) -> dict[str, Any]:
+        if not self.rate_limiter.authenticated:
+            raise CollectorError("GitHub GraphQL API requires GITHUB_TOKEN to be set")
+        try:
+            for _ in range(settings.github_rate_limit_retries + 1):
+                credential = await self.rate_limiter.acquire()
+                response = await self.http.client.post(
+                    settings.github_graphql_url,
+                    json={"query": query, "variables": variables},
+                    headers={**self._headers(), **credential.auth_headers()},
+                )
+                if not self.rate_limiter.observe(credential, response):
+                    break
+        except httpx.HTTPError as exc:
+            raise CollectorError(f"GitHub GraphQL request failed: {exc}") from exc
+
+        if response.status_code in (403, 429):
+            raise UpstreamRateLimitError("GitHub rate limit reached")
+        if response.status_code >= 400:
+            raise CollectorError(f"GitHub GraphQL query failed with status {response.status_code}")
+
+        payload = response.json()
+        errors = payload.get("errors") or []
+        error_types = {error.get("type") for error in errors}
+        if "RATE_LIMITED" in error_types:
+            raise UpstreamRateLimitError("GitHub rate limit reached")
+        if "NOT_FOUND" in error_types:
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        if errors:
+            raise CollectorError(f"GitHub GraphQL query failed: {errors[0].get('message')}")
+
+        user = (payload.get("data") or {}).get("user")
+        if not isinstance(user, dict):
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        return user
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+import httpx
+
+from reputation_pulse.errors import UpstreamRateLimitError
+from reputation_pulse.settings import settings
+
+ANONYMOUS_LIMIT = 60
+AUTHENTICATED_LIMIT = 5000
+
+
+@dataclass
+class TokenBudget:
+    """Token bucket for one credential, refilled when GitHub's window resets."""
+
+    token: str
+    limit: int
+    remaining: int
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+    last_used: float = 0.0
+
+    def auth_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    def refill(self, now: float) -> None:
+        if self.reset_at and now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0.0
+
+    def available_at(self, now: float, reserve: int) -> float:
+        """Earliest time this credential may be used again."""
+        ready = self.blocked_until
+        if self.remaining <= reserve:
+            ready = max(ready, self.reset_at or now)
+        return ready
+
+
+def _header_number(response: httpx.Response, name: str) -> float | None:
+    value = response.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class GitHubRateLimiter:
+    """Schedules GitHub requests across a pool of credentials before quota runs out.
+
+    Each request acquires the credential with the most budget left. When every
+    credential is at its reserve, callers wait for the earliest reset instead of
+    spending the last requests and failing; waits longer than `max_wait_seconds`
+    raise `UpstreamRateLimitError` right away.
+    """
+
+    def __init__(
+        self,
+        tokens: Sequence[str] = (),
+        reserve: int | None = None,
+        max_wait_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        unique_tokens = list(dict.fromkeys(token for token in tokens if token))
+        if unique_tokens:
+            self.budgets = [
+                TokenBudget(token=token, limit=AUTHENTICATED_LIMIT, remaining=AUTHENTICATED_LIMIT)
+                for token in unique_tokens
+            ]
+        else:
+            self.budgets = [TokenBudget(token="", limit=ANONYMOUS_LIMIT, remaining=ANONYMOUS_LIMIT)]
+        self.reserve = settings.github_rate_limit_reserve if reserve is None else reserve
+        self.max_wait_seconds = (
+            settings.github_rate_limit_max_wait_seconds
+            if max_wait_seconds is None
+            else max_wait_seconds
+        )
+        self._clock = clock
+        self._sleep = sleep
+
+    @property
+    def authenticated(self) -> bool:
+        return any(budget.token for budget in self.budgets)
+
+    async def acquire(self) -> TokenBudget:
+        while True:
+            now = self._clock()
+            for budget in self.budgets:
+                budget.refill(now)
+            ready = [
+                budget
+                for budget in self.budgets
+                if budget.available_at(now, self.reserve) <= now
+            ]
+            if ready:
+                budget = max(ready, key=lambda item: (item.remaining, -item.last_used))
+                budget.remaining -= 1
+                budget.last_used = now
+                return budget
+
+            wake_at = min(budget.available_at(now, self.reserve) for budget in self.budgets)
+            wait = wake_at - now
+            if wait > self.max_wait_seconds:
+                raise UpstreamRateLimitError(
+                    f"GitHub rate limit reached; quota resets in {int(wait)}s"
+                )
+            await self._sleep(max(wait, 0.05))
+
+    def observe(self, budget: TokenBudget, response: httpx.Response) -> bool:
+        """Update the budget from response headers; return True when worth retrying."""
+        now = self._clock()
+        limit = _header_number(response, "X-RateLimit-Limit")
+        remaining = _header_number(response, "X-RateLimit-Remaining")
+        reset_at = _header_number(response, "X-RateLimit-Reset")
+        retry_after = _header_number(response, "Retry-After")
+
+        if limit is not None:
+            budget.limit = int(limit)
+        if remaining is not None:
+            same_window = reset_at is None or reset_at == budget.reset_at
+            # Concurrent requests already took their share locally; never hand it back.
+            budget.remaining = (
+                min(budget.remaining, int(remaining)) if same_window else int(remaining)
+            )
+        if reset_at is not None:
+            budget.reset_at = reset_at
+
+        if response.status_code not in (403, 429):
+            return False
+        if retry_after is not None:
+            budget.blocked_until = now + retry_after
+            return True
+        if remaining == 0:
+            budget.remaining = 0
+            budget.blocked_until = budget.reset_at or now + 60
+            return True
+        return False
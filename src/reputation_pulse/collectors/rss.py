@@ -1,89 +1,421 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from xml.etree import ElementTree
 
 import httpx
 
+from reputation_pulse.cache import CacheStore
+from reputation_pulse.http_client import (
+    SharedHttpClient,
+    conditional_headers,
+    response_validators,
+)
 from reputation_pulse.settings import settings
 
+FEED_LINK_TYPES = {"application/rss+xml", "application/atom+xml"}
+WELL_KNOWN_FEED_PATHS = ("/feed", "/rss", "/rss.xml", "/atom.xml")
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+ENTRY_DATE_TAGS = {"item": ("pubDate", "date"), "entry": ("updated", "published")}
+# Statuses that say for sure there is nothing at a URL; other errors may be temporary.
+DEFINITE_MISS_STATUSES = {404, 410}
+
+
+class _Unreachable(Exception):
+    """A URL could not be read (transport error, 5xx, ...), so its absence proves nothing."""
+
+
+def _feed_or_none(task: asyncio.Future[_FeedSnapshot | None]) -> _FeedSnapshot | None:
+    return None if task.exception() is not None else task.result()
+
+
+def _known_encoding(name: str | None) -> str:
+    try:
+        return codecs.lookup(name or "utf-8").name
+    except LookupError:
+        return "utf-8"
+
+
+def _blog_key(blog_url: str) -> str:
+    parsed = urlparse(blog_url)
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
+
+
+@dataclass
+class _FeedSnapshot:
+    """What a feed said when last read; the 30-day count is derived at read time."""
+
+    feed_url: str
+    recent_entries: list[str] = field(default_factory=list)
+    last_post_at: str | None = None
+    validators: dict[str, str] = field(default_factory=dict)
+    not_modified: bool = False
+
+    @classmethod
+    def from_cache(cls, data: dict[str, Any], meta: dict[str, Any]) -> _FeedSnapshot:
+        return cls(
+            feed_url=str(data.get("feed_url") or ""),
+            recent_entries=list(data.get("recent_entries") or []),
+            last_post_at=data.get("last_post_at"),
+            validators=dict(meta.get("validators") or {}),
+        )
+
+    def to_cache(self) -> dict[str, Any]:
+        return {
+            "feed_url": self.feed_url,
+            "recent_entries": self.recent_entries,
+            "last_post_at": self.last_post_at,
+        }
+
+    def to_result(self, blog_url: str) -> dict[str, Any]:
+        threshold = datetime.now(timezone.utc) - timedelta(days=30)
+        recent_count = sum(
+            1 for raw in self.recent_entries if datetime.fromisoformat(raw) >= threshold
+        )
+        return {
+            "blog_url": blog_url,
+            "feed_url": self.feed_url,
+            "recent_entries_30d": recent_count,
+            "last_post_at": self.last_post_at,
+        }
+
+
+class _FeedLinkParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag != "link":
+            return
+        values = {name.lower(): (value or "").strip() for name, value in attrs}
+        rels = values.get("rel", "").lower().split()
+        link_type = values.get("type", "").lower().split(";")[0].strip()
+        if "alternate" in rels and link_type in FEED_LINK_TYPES and values.get("href"):
+            self.hrefs.append(values["href"])
+
+
+class _FeedScanner:
+    """Single-pass, incremental equivalent of the old `findall` date extraction.
+
+    Dates are `pubDate`/`date` children of `item`, `updated`/`published` children of
+    `entry`, and any Dublin Core `date`. Entries are cleared once read, and `done` is
+    set when a feed that lists newest entries first has produced enough consecutive
+    entries older than the recent window that nothing newer can follow.
+    """
+
+    def __init__(
+        self,
+        recent_threshold: datetime,
+        parse_datetime: Callable[[str], datetime | None],
+    ) -> None:
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._path: list[str] = []
+        self._parse_datetime = parse_datetime
+        self.recent_threshold = recent_threshold
+        self.datetimes: list[datetime] = []
+        self._entry_newest: datetime | None = None
+        self._previous_entry: datetime | None = None
+        self._stale_streak = 0
+        self._newest_first = True
+        self.done = False
+
+    def feed(self, chunk: bytes) -> None:
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> None:
+        self._parser.close()
+        self._drain()
+
+    def _drain(self) -> None:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._path.append(element.tag)
+                continue
+            self._path.pop()
+            self._on_end(element)
+            if self.done:
+                return
+
+    def _on_end(self, element: ElementTree.Element) -> None:
+        parent = self._path[-1] if self._path else None
+        if element.tag == DC_DATE or element.tag in ENTRY_DATE_TAGS.get(parent, ()):
+            parsed = self._parse_datetime(element.text.strip()) if element.text else None
+            if parsed is not None:
+                self.datetimes.append(parsed)
+                if self._entry_newest is None or parsed > self._entry_newest:
+                    self._entry_newest = parsed
+        if element.tag in ENTRY_DATE_TAGS:
+            self._finish_entry()
+            element.clear()
+
+    def _finish_entry(self) -> None:
+        newest, self._entry_newest = self._entry_newest, None
+        if newest is None:
+            return
+        if self._previous_entry is not None and newest > self._previous_entry:
+            self._newest_first = False
+        self._previous_entry = newest
+        self._stale_streak = self._stale_streak + 1 if newest < self.recent_threshold else 0
+        if self._newest_first and self._stale_streak >= settings.rss_stale_entries_before_stop:
+            self.done = True
+
+
+def discover_feed_links(html: str, base_url: str) -> list[str]:
+    """Return feed URLs advertised by `<link rel="alternate">` tags, in document order."""
+    parser = _FeedLinkParser()
+    parser.feed(html)
+    return list(dict.fromkeys(urljoin(base_url, href) for href in parser.hrefs))
+
 
 class RssCollector:
+    def __init__(
+        self,
+        http: SharedHttpClient | None = None,
+        cache: CacheStore | None = None,
+    ) -> None:
+        self.http = http or SharedHttpClient()
+        self.cache = cache or CacheStore()
+
     async def collect(self, website_url: str) -> dict[str, Any]:
         normalized_url = website_url.strip()
         if not normalized_url:
-            return {"blog_url": "", "feed_url": "", "recent_entries_30d": 0, "last_post_at": None}
+            return self._empty_result("")
         if normalized_url.startswith("www."):
             normalized_url = f"https://{normalized_url}"
         if not normalized_url.startswith(("http://", "https://")):
             normalized_url = f"https://{normalized_url}"
 
-        feed_candidates = [
-            normalized_url,
-            urljoin(normalized_url, "/feed"),
-            urljoin(normalized_url, "/rss"),
-            urljoin(normalized_url, "/rss.xml"),
-            urljoin(normalized_url, "/atom.xml"),
-        ]
-        for candidate in feed_candidates:
-            parsed = await self._parse_feed(candidate)
-            if parsed is not None:
-                parsed["blog_url"] = normalized_url
-                return parsed
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.rss_scan_deadline_seconds
+        result_key = f"rss:{_blog_key(normalized_url)}"
+        cached = await asyncio.to_thread(self.cache.get_entry, result_key)
+        previous = None
+        if cached is not None:
+            previous = _FeedSnapshot.from_cache(cached.data, cached.meta)
+            if cached.is_fresh(settings.rss_cache_ttl_seconds):
+                return previous.to_result(normalized_url)
+            if previous.feed_url:
+                try:
+                    revalidated = await asyncio.wait_for(
+                        self._parse_feed(previous.feed_url, previous.validators),
+                        timeout=max(deadline - loop.time(), 0),
+                    )
+                except (asyncio.TimeoutError, _Unreachable):
+                    # Keep serving the stale result untouched; the next scan asks again.
+                    return previous.to_result(normalized_url)
+                if revalidated is not None and revalidated.not_modified:
+                    await asyncio.to_thread(self.cache.touch, result_key)
+                    return previous.to_result(normalized_url)
+                if revalidated is not None:
+                    return await self._store(result_key, revalidated, normalized_url)
 
+        snapshot, complete = await self._locate_feed(normalized_url, deadline)
+        if snapshot is None and not complete:
+            # Not finding a feed in time (or past errors) says nothing about the blog.
+            return (previous or _FeedSnapshot(feed_url="")).to_result(normalized_url)
+        return await self._store(result_key, snapshot or _FeedSnapshot(feed_url=""), normalized_url)
+
+    async def _store(self, key: str, snapshot: _FeedSnapshot, blog_url: str) -> dict[str, Any]:
+        await asyncio.to_thread(
+            self.cache.set, key, snapshot.to_cache(), meta={"validators": snapshot.validators}
+        )
+        return snapshot.to_result(blog_url)
+
+    async def _locate_feed(
+        self,
+        blog_url: str,
+        deadline: float,
+    ) -> tuple[_FeedSnapshot | None, bool]:
+        """Find and read the blog's feed; the flag is False when "no feed" is not certain."""
+        # Per blog, not per host: medium.com/@a and medium.com/@b have different feeds.
+        blog_key = _blog_key(blog_url)
+        known_feed = await asyncio.to_thread(self._known_feed_url, blog_key)
+        if known_feed == "":
+            return None, True
+
+        if known_feed:
+            snapshot, _ = await self._probe_candidates([known_feed], deadline)
+            if snapshot is not None:
+                return snapshot, True
+        snapshot, complete = await self._discover(blog_url, deadline)
+        if snapshot is not None or complete:
+            await asyncio.to_thread(
+                self._remember_feed_url, blog_key, snapshot.feed_url if snapshot else ""
+            )
+        return snapshot, snapshot is not None or complete
+
+    def _empty_result(self, blog_url: str) -> dict[str, Any]:
         return {
-            "blog_url": normalized_url,
+            "blog_url": blog_url,
             "feed_url": "",
             "recent_entries_30d": 0,
             "last_post_at": None,
         }
 
-    async def _parse_feed(self, feed_url: str) -> dict[str, Any] | None:
-        async with httpx.AsyncClient(
-            timeout=settings.default_timeout,
-            follow_redirects=True,
-        ) as client:
-            try:
-                response = await client.get(feed_url)
-            except httpx.HTTPError:
-                return None
-        if response.status_code >= 400:
+    def _known_feed_url(self, blog_key: str) -> str | None:
+        """Return the cached feed URL for a blog, "" for a cached miss, None if unknown."""
+        entry = self.cache.get_entry(f"rss-location:{blog_key}")
+        if entry is None:
             return None
+        feed_url = str(entry.data.get("feed_url") or "")
+        ttl = (
+            settings.rss_feed_location_ttl_seconds
+            if feed_url
+            else settings.rss_no_feed_ttl_seconds
+        )
+        return feed_url if entry.is_fresh(ttl) else None
+
+    def _remember_feed_url(self, blog_key: str, feed_url: str) -> None:
+        self.cache.set(f"rss-location:{blog_key}", {"feed_url": feed_url})
+
+    async def _discover(
+        self,
+        homepage_url: str,
+        deadline: float,
+    ) -> tuple[_FeedSnapshot | None, bool]:
+        """Find the feed for a blog.
+
+        The flag tells whether every probe gave a definite answer in time, i.e. whether
+        finding no feed means the blog has none.
+        """
+        loop = asyncio.get_running_loop()
+        homepage_complete = True
         try:
-            root = ElementTree.fromstring(response.text)
-        except ElementTree.ParseError:
-            return None
+            parsed, html = await asyncio.wait_for(
+                self._stream_document(homepage_url, keep_html=True),
+                timeout=max(deadline - loop.time(), 0),
+            )
+        except (asyncio.TimeoutError, _Unreachable):
+            parsed, html = None, ""
+            homepage_complete = False
+
+        if parsed is not None:
+            return parsed, True
+        advertised = discover_feed_links(html, homepage_url) if html else []
+        if advertised:
+            parsed, _ = await self._probe_candidates(advertised, deadline)
+            if parsed is not None:
+                return parsed, True
+
+        well_known = [urljoin(homepage_url, path) for path in WELL_KNOWN_FEED_PATHS]
+        parsed, complete = await self._probe_candidates(well_known, deadline)
+        return parsed, complete and homepage_complete
+
+    async def _probe_candidates(
+        self,
+        candidates: list[str],
+        deadline: float,
+    ) -> tuple[_FeedSnapshot | None, bool]:
+        """Probe every candidate at once and keep the first valid feed in priority order.
+
+        Lower-priority answers are held until every higher-priority candidate has
+        failed. Once the deadline passes, the best feed that already answered wins;
+        everything still pending is cancelled. The flag is False when the deadline cut
+        the probing short or a candidate could not be reached.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.ensure_future(self._parse_feed(candidate)) for candidate in candidates]
+        try:
+            for task in tasks:
+                done, _ = await asyncio.wait({task}, timeout=max(deadline - loop.time(), 0))
+                if not done:
+                    break
+                if _feed_or_none(task) is not None:
+                    return task.result(), True
+            for task in tasks:
+                if task.done() and _feed_or_none(task) is not None:
+                    return task.result(), True
+            return None, all(task.done() and task.exception() is None for task in tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        datetimes = self._extract_entry_datetimes(root)
+    async def _parse_feed(
+        self,
+        feed_url: str,
+        validators: dict[str, str] | None = None,
+    ) -> _FeedSnapshot | None:
+        parsed, _ = await self._stream_document(feed_url, validators=validators)
+        return parsed
+
+    async def _stream_document(
+        self,
+        url: str,
+        keep_html: bool = False,
+        validators: dict[str, str] | None = None,
+    ) -> tuple[_FeedSnapshot | None, str]:
+        """Parse a feed while it downloads, reading at most `rss_max_feed_bytes`.
+
+        Returns the parsed feed (None when the document is not a feed) and, when
+        `keep_html` is set, the text read so far so a homepage can be searched for
+        feed links. With `validators` the request is conditional and a 304 comes
+        back as a snapshot flagged `not_modified`. Raises `_Unreachable` unless the
+        server answered definitively: a document, or a 404/410.
+        """
         recent_threshold = datetime.now(timezone.utc) - timedelta(days=30)
-        recent_count = sum(1 for dt in datetimes if dt >= recent_threshold)
-        last_post = max(datetimes).isoformat() if datetimes else None
-        return {
-            "feed_url": feed_url,
-            "recent_entries_30d": recent_count,
-            "last_post_at": last_post,
-        }
+        scanner = _FeedScanner(recent_threshold, self._parse_datetime)
+        is_feed = True
+        received = bytearray()
+        size = 0
+        try:
+            async with self.http.client.stream(
+                "GET",
+                url,
+                headers=conditional_headers({}, validators),
+                follow_redirects=True,
+            ) as response:
+                if response.status_code == 304 and validators:
+                    return _FeedSnapshot(feed_url=url, not_modified=True), ""
+                if response.status_code in DEFINITE_MISS_STATUSES:
+                    return None, ""
+                if not response.is_success:
+                    raise _Unreachable(f"{url} answered {response.status_code}")
+                fresh_validators = response_validators(response)
+                encoding = _known_encoding(response.encoding)
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if keep_html:
+                        received.extend(chunk)
+                    if is_feed:
+                        try:
+                            scanner.feed(chunk)
+                        except ElementTree.ParseError:
+                            is_feed = False
+                    stop_reading = scanner.done or not (is_feed or keep_html)
+                    if stop_reading or size >= settings.rss_max_feed_bytes:
+                        break
+                else:
+                    if is_feed:
+                        try:
+                            scanner.close()
+                        except ElementTree.ParseError:
+                            is_feed = False
+        except httpx.HTTPError as exc:
+            raise _Unreachable(f"{url} could not be read: {exc}") from exc
+
+        html = received.decode(encoding, errors="replace") if keep_html else ""
+        if not is_feed:
+            return None, html
 
-    def _extract_entry_datetimes(self, root: ElementTree.Element) -> list[datetime]:
-        tags = (
-            ".//item/pubDate",
-            ".//item/date",
-            ".//entry/updated",
-            ".//entry/published",
-            ".//{http://purl.org/dc/elements/1.1/}date",
+        datetimes = scanner.datetimes
+        snapshot = _FeedSnapshot(
+            feed_url=url,
+            # Older entries can never re-enter the window, so only recent ones are kept.
+            recent_entries=[dt.isoformat() for dt in datetimes if dt >= recent_threshold],
+            last_post_at=max(datetimes).isoformat() if datetimes else None,
+            validators=fresh_validators,
         )
-        values: list[datetime] = []
-        for tag in tags:
-            for node in root.findall(tag):
-                if not node.text:
-                    continue
-                parsed = self._parse_datetime(node.text.strip())
-                if parsed is not None:
-                    values.append(parsed)
-        return values
+        return snapshot, html
 
     def _parse_datetime(self, raw: str) -> datetime | None:
         try:
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import re
+
 from reputation_pulse.errors import InvalidHandleError
 
+# GitHub logins: letters, digits and hyphens, starting with a letter or digit, at most 39 long.
+HANDLE_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9-]{0,38}")
+
 
 def normalize_handle(raw: str) -> str:
     normalized = raw.strip().lstrip("@")
     if not normalized:
         raise InvalidHandleError("Handle cannot be empty")
+    if not HANDLE_PATTERN.fullmatch(normalized):
+        raise InvalidHandleError(f"'{normalized}' is not a valid GitHub handle")
     return normalized
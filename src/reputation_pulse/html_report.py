@@ -6,6 +6,23 @@ from pathlib import Path
 
 from reputation_pulse.charts import sparkline_svg
 
+SIGNAL_LABELS = {"github": "GitHub", "web": "Blog/RSS"}
+DEGRADED_LABELS = {
+    "stale": "did not answer in time; showing the last stored value",
+    "missing": "did not answer in time and has no stored value",
+}
+
+
+def _degraded_notice(degraded: dict[str, str]) -> str:
+    if not degraded:
+        return ""
+    items = "".join(
+        f"<li>{escape(SIGNAL_LABELS.get(signal, signal))}: "
+        f"{escape(DEGRADED_LABELS.get(state, state))}</li>"
+        for signal, state in sorted(degraded.items())
+    )
+    return f'<div class="degraded"><strong>Partial result</strong><ul>{items}</ul></div>'
+
 
 def render_html_report(
     result: dict[str, object],
@@ -18,6 +35,7 @@ def render_html_report(
     followers = escape(str(result["github"]["followers"]))
     stars = escape(str(result["github"]["stars"]))
     recommendations = result["summary"]["recommendations"]
+    degraded_notice = _degraded_notice(result.get("degraded") or {})
 
     trend_direction = escape(str(trend["direction"]))
     trend_delta = escape(f"{float(trend['delta']):+}")
@@ -49,11 +67,18 @@ def render_html_report(
       .meta {{ display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: .5rem; }}
       .k {{ color: #6b7280; }}
       ul {{ margin-bottom: 0; }}
+      .degraded {{
+        background: #fef3c7;
+        border-radius: 8px;
+        padding: .5rem .75rem;
+        margin-bottom: 1rem;
+      }}
     </style>
   </head>
   <body>
     <div class="card">
       <h1>Reputation Pulse Report: {handle}</h1>
+      {degraded_notice}
       <div class="meta">
         <div><span class="k">Score</span>: {score}</div>
         <div><span class="k">Rating</span>: {rating}</div>
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import httpx
+
+from reputation_pulse.settings import settings
+
+
+def response_validators(response: httpx.Response) -> dict[str, str]:
+    """The cache validators (`etag`, `last_modified`) a response came with."""
+    validators = {}
+    if response.headers.get("ETag"):
+        validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        validators["last_modified"] = response.headers["Last-Modified"]
+    return validators
+
+
+def conditional_headers(
+    headers: dict[str, str],
+    validators: dict[str, str] | None,
+) -> dict[str, str]:
+    """`headers` plus the `If-None-Match`/`If-Modified-Since` matching `validators`."""
+    if not validators:
+        return headers
+    conditional = dict(headers)
+    if validators.get("etag"):
+        conditional["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        conditional["If-Modified-Since"] = validators["last_modified"]
+    return conditional
+
+
+def build_http_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    kwargs: dict[str, object] = {
+        "timeout": settings.default_timeout,
+        "limits": limits,
+        "http2": settings.http2_enabled,
+    }
+    if transport is not None:
+        kwargs["transport"] = transport
+    return httpx.AsyncClient(**kwargs)
+
+
+class SharedHttpClient:
+    """Lazily opened, connection-pooled client shared by every collector."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = build_http_client(self._transport)
+        return self._client
+
+    async def open(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> SharedHttpClient:
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
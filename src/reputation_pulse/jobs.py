@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import uuid
+from collections.abc import AsyncIterator
+
+from reputation_pulse.async_storage import AsyncScanStore
+from reputation_pulse.batch import scan_one, unique_handles
+from reputation_pulse.scan_service import ScanService
+from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+logger = logging.getLogger(__name__)
+
+
+class JobManager:
+    """Runs batch scan jobs on a pool of in-process workers.
+
+    Jobs and their per-handle results live in the store, so a restarted process
+    picks up every unfinished job where it stopped (`start`). The in-memory queue
+    is created by `start`, on the loop that serves it, never at import time.
+    """
+
+    def __init__(
+        self,
+        scan_service: ScanService,
+        store: ScanStore,
+        workers: int | None = None,
+        async_store: AsyncScanStore | None = None,
+    ) -> None:
+        self.scan_service = scan_service
+        self.store = store
+        self.async_store = async_store or AsyncScanStore(store)
+        self.workers = workers or settings.job_workers
+        self._queue: asyncio.Queue[tuple[str, str]] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        self._queue = queue = asyncio.Queue()
+        for job_id in await self.async_store.unfinished_jobs():
+            for handle in await self.async_store.pending_job_handles(job_id):
+                queue.put_nowait((job_id, handle))
+        self._tasks = [asyncio.ensure_future(self._work(queue)) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Whatever is still queued stays pending in the store for the next start.
+        self._queue = None
+
+    async def submit(self, handles: list[str]) -> dict[str, object]:
+        job_id = uuid.uuid4().hex
+        unique = list(unique_handles(handles))
+        await self.async_store.create_job(job_id, unique)
+        # Before `start`, the stored job is enough: `start` queues its pending handles.
+        if self._queue is not None:
+            for handle in unique:
+                self._queue.put_nowait((job_id, handle))
+        return await self.async_store.job(job_id) or {}
+
+    async def results(self, job_id: str, follow: bool = False) -> AsyncIterator[dict[str, object]]:
+        """Yield a job's result records; with `follow`, keep going until the job is done."""
+        last_id = 0
+        while True:
+            # Read the status first: a job seen as done has all of its results stored.
+            job = await self.async_store.job(job_id)
+            page = await self.async_store.job_results(job_id, after_id=last_id)
+            for record_id, record in page:
+                last_id = record_id
+                yield record
+            if page:
+                continue
+            if not follow or job is None or job["status"] == "done":
+                return
+            await asyncio.sleep(settings.job_results_poll_seconds)
+
+    async def _work(self, queue: asyncio.Queue[tuple[str, str]]) -> None:
+        while True:
+            job_id, handle = await queue.get()
+            record = await scan_one(handle, self.scan_service.run_and_store)
+            await self._save_result(job_id, record.to_dict())
+
+    async def _save_result(self, job_id: str, record: dict[str, object]) -> None:
+        """Store one result, retrying storage errors: a dropped record leaves the job open."""
+        while True:
+            try:
+                await self.async_store.save_job_result(job_id, record)
+                return
+            except sqlite3.Error:
+                logger.exception(
+                    "Could not store the result for %s in job %s; retrying",
+                    record["handle"],
+                    job_id,
+                )
+            await asyncio.sleep(settings.job_save_retry_seconds)
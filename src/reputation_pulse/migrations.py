@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable
+
+from reputation_pulse.payloads import (
+    canonical_json,
+    compress_payload,
+    decode_payload,
+    encode_payload,
+    payload_digest,
+)
+
+Migration = Callable[[sqlite3.Connection], None]
+
+
+def _baseline(conn: sqlite3.Connection) -> None:
+    # Databases created before versioning already have some of these tables.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            handle TEXT NOT NULL,
+            normalized_score REAL NOT NULL,
+            rating TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            scanned_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS repo_ledger (
+            handle TEXT NOT NULL,
+            name TEXT NOT NULL,
+            stars INTEGER NOT NULL,
+            pushed_at TEXT,
+            PRIMARY KEY (handle, name)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS repo_ledger_state (
+            handle TEXT PRIMARY KEY,
+            full_refresh_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scan_schedule (
+            handle TEXT PRIMARY KEY,
+            next_scan_at TEXT NOT NULL,
+            interval_seconds REAL NOT NULL,
+            last_score REAL,
+            last_pushed_at TEXT,
+            failures INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            total INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            finished_at TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_handles (
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            handle TEXT NOT NULL,
+            PRIMARY KEY (job_id, handle)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            handle TEXT NOT NULL,
+            status TEXT NOT NULL,
+            record TEXT NOT NULL,
+            UNIQUE (job_id, handle)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS work_queue (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            handle TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            visible_at REAL NOT NULL,
+            lease_owner TEXT,
+            last_error TEXT,
+            enqueued_at TEXT NOT NULL,
+            finished_at TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_work_queue_ready
+        ON work_queue (status, visible_at)
+        """
+    )
+
+
+def _scan_history_indexes(conn: sqlite3.Connection) -> None:
+    # Covers every per-handle history query except the payload lookup, newest first.
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_scans_handle_id
+        ON scans (handle, id DESC, normalized_score, rating, scanned_at)
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scans_scanned_at ON scans (scanned_at)")
+
+
+def _handle_stats(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS handle_stats (
+            handle TEXT PRIMARY KEY,
+            scans_count INTEGER NOT NULL,
+            score_sum REAL NOT NULL,
+            min_score REAL NOT NULL,
+            max_score REAL NOT NULL,
+            first_scan_at TEXT NOT NULL,
+            last_scan_at TEXT NOT NULL,
+            latest_score REAL NOT NULL,
+            latest_rating TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO handle_stats
+        SELECT
+            handle,
+            COUNT(*),
+            SUM(normalized_score),
+            MIN(normalized_score),
+            MAX(normalized_score),
+            MIN(scanned_at),
+            MAX(scanned_at),
+            (SELECT normalized_score FROM scans AS latest
+             WHERE latest.handle = scans.handle ORDER BY id DESC LIMIT 1),
+            (SELECT rating FROM scans AS latest
+             WHERE latest.handle = scans.handle ORDER BY id DESC LIMIT 1)
+        FROM scans
+        GROUP BY handle
+        """
+    )
+
+
+def _compressed_payloads(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE scan_payloads (
+            scan_id INTEGER PRIMARY KEY,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL
+        )
+        """
+    )
+    rows = conn.execute("SELECT id, payload FROM scans")
+    while batch := rows.fetchmany(500):
+        converted = []
+        for scan_id, payload in batch:
+            try:
+                result = json.loads(payload)
+            except json.JSONDecodeError:
+                # Unreadable payloads already read back as missing; leave them out.
+                continue
+            if isinstance(result, dict):
+                converted.append((scan_id, *encode_payload(result)))
+        conn.executemany(
+            "INSERT INTO scan_payloads (scan_id, codec, data) VALUES (?, ?, ?)",
+            converted,
+        )
+
+    # Rebuild `scans` without the payload so history queries only touch the hot columns.
+    conn.execute(
+        """
+        CREATE TABLE scans_compact (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            handle TEXT NOT NULL,
+            normalized_score REAL NOT NULL,
+            rating TEXT NOT NULL,
+            scanned_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO scans_compact (id, handle, normalized_score, rating, scanned_at)
+        SELECT id, handle, normalized_score, rating, scanned_at FROM scans
+        """
+    )
+    conn.execute("DROP TABLE scans")
+    conn.execute("ALTER TABLE scans_compact RENAME TO scans")
+    _scan_history_indexes(conn)
+
+
+def _content_addressed_payloads(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE payload_blobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            digest BLOB NOT NULL UNIQUE,
+            codec TEXT NOT NULL,
+            data BLOB NOT NULL,
+            base_id INTEGER REFERENCES payload_blobs (id),
+            depth INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE scan_payload_refs (
+            scan_id INTEGER PRIMARY KEY,
+            blob_id INTEGER NOT NULL REFERENCES payload_blobs (id)
+        )
+        """
+    )
+    # Existing payloads are stored whole; deltas only start with new scans.
+    rows = conn.execute("SELECT scan_id, codec, data FROM scan_payloads ORDER BY scan_id")
+    while batch := rows.fetchmany(500):
+        for scan_id, codec, data in batch:
+            result = decode_payload(codec, data)
+            if result is None:
+                continue
+            raw = canonical_json(result)
+            digest = payload_digest(raw)
+            conn.execute(
+                "INSERT OR IGNORE INTO payload_blobs (digest, codec, data) VALUES (?, ?, ?)",
+                (digest, *compress_payload(raw)),
+            )
+            conn.execute(
+                """
+                INSERT INTO scan_payload_refs (scan_id, blob_id)
+                SELECT ?, id FROM payload_blobs WHERE digest = ?
+                """,
+                (scan_id, digest),
+            )
+    conn.execute("DROP TABLE scan_payloads")
+    conn.execute("ALTER TABLE scan_payload_refs RENAME TO scan_payloads")
+    conn.execute("CREATE INDEX idx_scan_payloads_blob ON scan_payloads (blob_id)")
+    conn.execute("CREATE INDEX idx_payload_blobs_base ON payload_blobs (base_id)")
+
+
+def _scan_rollups(conn: sqlite3.Connection) -> None:
+    # `bucket` is 'day' or 'week'; `bucket_start` is the UTC date the bucket begins on.
+    conn.execute(
+        """
+        CREATE TABLE scan_rollups (
+            handle TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            bucket_start TEXT NOT NULL,
+            scans_count INTEGER NOT NULL,
+            score_sum REAL NOT NULL,
+            min_score REAL NOT NULL,
+            max_score REAL NOT NULL,
+            first_scan_at TEXT NOT NULL,
+            last_scan_at TEXT NOT NULL,
+            last_score REAL NOT NULL,
+            last_rating TEXT NOT NULL,
+            PRIMARY KEY (handle, bucket, bucket_start)
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX idx_scan_rollups_handle_last ON scan_rollups (handle, last_scan_at DESC)"
+    )
+
+
+MIGRATIONS: list[tuple[int, str, Migration]] = [
+    (1, "baseline schema", _baseline),
+    (2, "scan history indexes", _scan_history_indexes),
+    (3, "per-handle aggregates", _handle_stats),
+    (4, "compressed payload side table", _compressed_payloads),
+    (5, "content-addressed payloads with deltas", _content_addressed_payloads),
+    (6, "daily and weekly scan rollups", _scan_rollups),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Bring the database up to `LATEST_VERSION`, one transaction per migration.
+
+    The version lives in `PRAGMA user_version`. Each step takes the write lock and
+    re-reads the version first, so processes starting together apply it only once.
+    """
+    if schema_version(conn) >= LATEST_VERSION:
+        return LATEST_VERSION
+    for version, _description, apply in MIGRATIONS:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    return schema_version(conn)
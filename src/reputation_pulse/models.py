@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from reputation_pulse.errors import InvalidHandleError
 from reputation_pulse.handles import normalize_handle
+from reputation_pulse.settings import settings
 
 
 class ScanRequest(BaseModel):
@@ -16,3 +17,15 @@ class ScanRequest(BaseModel):
             return normalize_handle(value)
         except InvalidHandleError as exc:
             raise ValueError(str(exc)) from exc
+
+
+class BatchScanRequest(BaseModel):
+    handles: list[str] = Field(min_length=1, max_length=settings.job_max_handles)
+
+    @field_validator("handles")
+    @classmethod
+    def normalize_handles(cls, values: list[str]) -> list[str]:
+        try:
+            return [normalize_handle(value) for value in values]
+        except InvalidHandleError as exc:
+            raise ValueError(str(exc)) from exc
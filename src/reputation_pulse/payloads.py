@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+
+from reputation_pulse.settings import settings
+
+# Preset dictionary for scan payloads: the keys and stock phrases every result repeats.
+# Stored rows name the dictionary they were written with, so this text must never change;
+# add a new codec instead.
+DICTIONARY_V1 = json.dumps(
+    {
+        "handle": "",
+        "github": {
+            "handle": "",
+            "followers": 0,
+            "following": 0,
+            "public_repos": 0,
+            "created_at": "T00:00:00Z",
+            "updated_at": "T00:00:00Z",
+            "blog_url": "https://",
+            "stars": 0,
+            "recent_repos": [{"name": "", "pushed_at": "T00:00:00Z", "stargazers": 0}],
+        },
+        "web": {
+            "blog_url": "https://",
+            "feed_url": "https://",
+            "recent_entries_30d": 0,
+            "last_post_at": None,
+        },
+        "score": {"followers": 0, "stars": 0, "recent_repos": 0, "normalized": 0.0},
+        "summary": {
+            "rating": "Needs Attention",
+            "normalized": 0.0,
+            "recommendations": [
+                "Publish at least 2-3 public projects to show momentum.",
+                "Engage with communities (issues/comments) to grow followers.",
+                "Push a recent change to demonstrate active work.",
+                "Aim for a few high-quality repos to attract more stars.",
+                "Publish a technical update on your blog or RSS to keep visibility active.",
+            ],
+            "degraded": {},
+        },
+        "degraded": {},
+        "trend": {"direction": "new", "delta": 0.0},
+    }
+).encode("utf-8")
+
+CODEC_ZLIB = "zlib"
+CODEC_ZLIB_DICT_V1 = "zlib-d1"
+# Compressed with the base payload's bytes as the preset dictionary: a rescan that
+# barely changed shrinks to a few dozen bytes of back-references into its base.
+CODEC_ZLIB_DELTA = "zlib-delta"
+_DICTIONARIES = {CODEC_ZLIB: b"", CODEC_ZLIB_DICT_V1: DICTIONARY_V1}
+
+
+def canonical_json(result: dict[str, object]) -> bytes:
+    return json.dumps(result, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def payload_digest(raw: bytes) -> bytes:
+    return hashlib.sha256(raw).digest()
+
+
+def compress_payload(raw: bytes, base: bytes | None = None) -> tuple[str, bytes]:
+    """Compress canonical payload bytes, as a delta against `base` when one is given."""
+    if base is not None:
+        codec, dictionary = CODEC_ZLIB_DELTA, base
+    else:
+        codec = CODEC_ZLIB_DICT_V1 if settings.payload_shared_dictionary else CODEC_ZLIB
+        dictionary = _DICTIONARIES[codec]
+    compressor = zlib.compressobj(settings.payload_compression_level, zdict=dictionary)
+    return codec, compressor.compress(raw) + compressor.flush()
+
+
+def decompress_payload(codec: str, data: bytes, base: bytes | None = None) -> bytes | None:
+    """Inverse of `compress_payload`; None for unknown codecs or unreadable data."""
+    dictionary = base if codec == CODEC_ZLIB_DELTA else _DICTIONARIES.get(codec)
+    if dictionary is None:
+        return None
+    try:
+        decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+        return decompressor.decompress(data) + decompressor.flush()
+    except zlib.error:
+        return None
+
+
+def parse_payload(raw: bytes | None) -> dict[str, object] | None:
+    if raw is None:
+        return None
+    try:
+        payload = json.loads(raw)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def encode_payload(result: dict[str, object]) -> tuple[str, bytes]:
+    """Compress a scan result on its own; returns the codec name to store with the bytes."""
+    return compress_payload(canonical_json(result))
+
+
+def decode_payload(codec: str, data: bytes) -> dict[str, object] | None:
+    return parse_payload(decompress_payload(codec, data))
@@ -15,7 +15,9 @@ def build_summary(
     github_data: dict[str, object],
     score: ReputationScore,
     web_data: dict[str, object] | None = None,
+    degraded: dict[str, str] | None = None,
 ) -> dict[str, object]:
+    degraded = degraded or {}
     recommendations: list[str] = []
 
     if github_data.get("public_repos", 0) < 3:
@@ -30,7 +32,8 @@ def build_summary(
     if score.stars < 100:
         recommendations.append("Aim for a few high-quality repos to attract more stars.")
 
-    if web_data and web_data.get("blog_url"):
+    # A feed that did not answer in time says nothing about how often the blog posts.
+    if web_data and web_data.get("blog_url") and degraded.get("web") != "missing":
         if int(web_data.get("recent_entries_30d", 0)) == 0:
             recommendations.append(
                 "Publish a technical update on your blog or RSS to keep visibility active."
@@ -40,4 +43,5 @@ def build_summary(
         "rating": _rating_label(score.normalized),
         "normalized": score.normalized,
         "recommendations": recommendations,
+        "degraded": dict(degraded),
     }
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+
+@dataclass(frozen=True)
+class CompactionReport:
+    scans_rolled_up: int
+    days_rolled_up: int
+    payloads_removed: int
+    complete: bool
+
+
+def retention_cutoffs(now: datetime) -> tuple[str, str]:
+    """(raw_before, daily_before): the scan timestamp and daily bucket date to compact before.
+
+    Both fall on bucket boundaries, so a day or week is always rolled up whole.
+    """
+    raw_day = (now - timedelta(days=settings.retention_raw_days)).astimezone(timezone.utc).date()
+    raw_before = datetime(raw_day.year, raw_day.month, raw_day.day, tzinfo=timezone.utc)
+    daily_day = (now - timedelta(days=settings.retention_daily_days)).astimezone(timezone.utc)
+    week_start = daily_day.date() - timedelta(days=daily_day.weekday())
+    return raw_before.isoformat(), week_start.isoformat()
+
+
+def compact(
+    store: ScanStore,
+    now: datetime | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+    sleep: Callable[[float], object] = time.sleep,
+) -> CompactionReport:
+    """Downsample old scan history and drop the payloads nobody refers to anymore.
+
+    Raw scans older than `retention_raw_days` become daily rollups, and daily rollups
+    older than `retention_daily_days` become weekly ones. Work happens in batches of
+    `batch_size` rows, one short transaction each with a pause in between, so scans
+    being saved meanwhile only ever wait for a single batch. `max_batches` bounds a
+    run; the next run carries on where it stopped.
+    """
+    raw_before, daily_before = retention_cutoffs(now or datetime.now(timezone.utc))
+    size = batch_size or settings.compaction_batch_size
+    steps = (
+        lambda: store.roll_up_scans(raw_before, size),
+        lambda: store.roll_up_days(daily_before, size),
+        lambda: store.collect_orphan_payloads(size),
+    )
+    totals = [0, 0, 0]
+    batches = 0
+    for index, step in enumerate(steps):
+        while True:
+            if max_batches is not None and batches >= max_batches:
+                return CompactionReport(*totals, complete=False)
+            done = step()
+            if not done:
+                break
+            totals[index] += done
+            batches += 1
+            sleep(settings.compaction_pause_seconds)
+    return CompactionReport(*totals, complete=True)
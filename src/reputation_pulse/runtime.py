@@ -3,19 +3,55 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from reputation_pulse.analyzer import ReputationAnalyzer
+from reputation_pulse.async_storage import AsyncScanStore
+from reputation_pulse.collectors.github import GitHubCollector
+from reputation_pulse.collectors.github_graphql import GitHubGraphQLCollector
+from reputation_pulse.collectors.rss import RssCollector
+from reputation_pulse.http_client import SharedHttpClient
+from reputation_pulse.jobs import JobManager
 from reputation_pulse.scan_service import ScanService
+from reputation_pulse.settings import settings
 from reputation_pulse.storage import ScanStore
 
 
 @dataclass(frozen=True)
 class RuntimeContainer:
+    http: SharedHttpClient
     analyzer: ReputationAnalyzer
     store: ScanStore
+    async_store: AsyncScanStore
     scan_service: ScanService
+    jobs: JobManager
+
+
+def build_github_collector(
+    http: SharedHttpClient,
+    backend: str | None = None,
+    ledger: ScanStore | None = None,
+) -> GitHubCollector | GitHubGraphQLCollector:
+    selected = (backend or settings.github_collector_backend).strip().lower()
+    if selected == "graphql":
+        return GitHubGraphQLCollector(http=http)
+    if selected == "rest":
+        return GitHubCollector(http=http, ledger=ledger)
+    raise ValueError(f"Unknown GitHub collector backend: {selected!r}")
 
 
 def build_runtime() -> RuntimeContainer:
-    analyzer = ReputationAnalyzer()
+    http = SharedHttpClient()
     store = ScanStore()
-    scan_service = ScanService(analyzer=analyzer, store=store)
-    return RuntimeContainer(analyzer=analyzer, store=store, scan_service=scan_service)
+    async_store = AsyncScanStore(store)
+    analyzer = ReputationAnalyzer(
+        github_collector=build_github_collector(http, ledger=store),
+        rss_collector=RssCollector(http=http),
+        store=async_store,
+    )
+    scan_service = ScanService(analyzer=analyzer, store=store, async_store=async_store)
+    return RuntimeContainer(
+        http=http,
+        analyzer=analyzer,
+        store=store,
+        async_store=async_store,
+        scan_service=scan_service,
+        jobs=JobManager(scan_service, store, async_store=async_store),
+    )
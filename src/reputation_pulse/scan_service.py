@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime, timedelta, timezone
+
 from reputation_pulse.analyzer import ReputationAnalyzer
+from reputation_pulse.async_storage import AsyncScanStore
+from reputation_pulse.batch import BatchResult, run_bounded
+from reputation_pulse.handles import normalize_handle
+from reputation_pulse.settings import settings
 from reputation_pulse.storage import ScanStore
 from reputation_pulse.trends import build_trend
 
@@ -10,14 +19,70 @@ class ScanService:
         self,
         analyzer: ReputationAnalyzer | None = None,
         store: ScanStore | None = None,
+        recent_scan_window_seconds: int | None = None,
+        async_store: AsyncScanStore | None = None,
     ) -> None:
         self.analyzer = analyzer or ReputationAnalyzer()
         self.store = store or ScanStore()
+        self.async_store = async_store or AsyncScanStore(self.store)
+        self.recent_scan_window_seconds = (
+            settings.recent_scan_window_seconds
+            if recent_scan_window_seconds is None
+            else recent_scan_window_seconds
+        )
+        self._in_flight: dict[str, asyncio.Future[dict[str, object]]] = {}
 
     async def run_and_store(self, handle: str) -> dict[str, object]:
+        """Scan and persist a handle, sharing one analysis between concurrent callers."""
+        normalized = normalize_handle(handle)
+        recent = await self._recent_result(normalized)
+        if recent is not None:
+            return recent
+
+        in_flight = self._in_flight.get(normalized)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._scan_and_store(normalized))
+            self._in_flight[normalized] = in_flight
+            in_flight.add_done_callback(lambda done: self._forget(normalized, done))
+        # Shielded so one caller going away does not cancel the scan for the others.
+        result = await asyncio.shield(in_flight)
+        return copy.deepcopy(result)
+
+    def run_many(
+        self,
+        handles: Iterable[str],
+        concurrency: int | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Scan and persist many handles concurrently, yielding results as they complete."""
+        return run_bounded(handles, self.run_and_store, concurrency)
+
+    async def _scan_and_store(self, handle: str) -> dict[str, object]:
         result = await self.analyzer.run(handle)
-        previous = self.store.latest_scan_for_handle(str(result["handle"]))
+        previous = await self.async_store.latest_scan_for_handle(str(result["handle"]))
         previous_score = None if previous is None else float(previous["normalized_score"])
         result["trend"] = build_trend(float(result["score"]["normalized"]), previous_score)
-        self.store.save_scan(result)
+        await self.async_store.save_scan(result)
         return result
+
+    def _forget(self, handle: str, done: asyncio.Future[dict[str, object]]) -> None:
+        if self._in_flight.get(handle) is done:
+            del self._in_flight[handle]
+
+    def scanned_within(self, handle: str, seconds: float) -> bool:
+        """Whether the stored history has a scan of `handle` from the last `seconds`."""
+        return _is_within(self.store.latest_scan_for_handle(handle), seconds)
+
+    async def _recent_result(self, handle: str) -> dict[str, object] | None:
+        if self.recent_scan_window_seconds <= 0:
+            return None
+        latest = await self.async_store.latest_scan_for_handle(handle)
+        if not _is_within(latest, self.recent_scan_window_seconds):
+            return None
+        return await self.async_store.latest_result_for_handle(handle)
+
+
+def _is_within(latest: dict[str, object] | None, seconds: float) -> bool:
+    if latest is None:
+        return False
+    scanned_at = datetime.fromisoformat(str(latest["scanned_at"]))
+    return datetime.now(timezone.utc) - scanned_at <= timedelta(seconds=seconds)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from reputation_pulse.batch import unique_handles
+from reputation_pulse.handles import normalize_handle
+from reputation_pulse.scan_service import ScanService
+from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+
+@dataclass(order=True)
+class ScheduledHandle:
+    """One tracked handle; the heap orders them by when they are due."""
+
+    next_scan_at: float
+    handle: str = field(compare=False)
+    interval_seconds: float = field(compare=False)
+    last_score: float | None = field(default=None, compare=False)
+    last_pushed_at: str | None = field(default=None, compare=False)
+    failures: int = field(default=0, compare=False)
+
+
+def _latest_push(result: dict[str, Any]) -> str | None:
+    github_data = result.get("github") or {}
+    pushed = [repo.get("pushed_at") for repo in github_data.get("recent_repos") or []]
+    return max((value for value in pushed if value), default=None)
+
+
+def next_interval(entry: ScheduledHandle, result: dict[str, Any]) -> float:
+    """Halve the interval when the score moved or new pushes landed; double it otherwise."""
+    interval = entry.interval_seconds
+    if entry.last_score is not None:
+        score = float(result["score"]["normalized"])
+        score_moved = abs(score - entry.last_score) >= settings.scheduler_score_change_threshold
+        pushed = _latest_push(result) != entry.last_pushed_at
+        interval = interval / 2 if score_moved or pushed else interval * 2
+    return min(
+        max(interval, settings.scheduler_min_interval_seconds),
+        settings.scheduler_max_interval_seconds,
+    )
+
+
+class RescanScheduler:
+    """Keeps tracked handles fresh, rescanning active ones sooner than dormant ones.
+
+    Handles sit in a heap keyed by their next due time. Each finished scan moves the
+    handle's interval up or down (`next_interval`) and writes the schedule back to the
+    store, so a restarted scheduler resumes from the same plan. Handles tracked while
+    it runs are picked up on the next idle poll. At most `concurrency` scans run at
+    once and new scans start no faster than `scans_per_minute`.
+    """
+
+    def __init__(
+        self,
+        scan_service: ScanService,
+        store: ScanStore,
+        concurrency: int | None = None,
+        scans_per_minute: float | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        self.scan_service = scan_service
+        self.store = store
+        self.concurrency = concurrency or settings.scheduler_concurrency
+        self.scans_per_minute = scans_per_minute or settings.scheduler_scans_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._heap: list[ScheduledHandle] = []
+        self._scheduled: set[str] = set()
+        self._loaded_at = 0.0
+        self._next_start = 0.0
+
+    def track(self, handles: Iterable[str]) -> int:
+        """Add handles to the schedule; a handle already scanned is due one interval later.
+
+        Raises `InvalidHandleError` before anything is stored if a handle is malformed,
+        since its rescans could only ever fail.
+        """
+        normalized = [normalize_handle(handle) for handle in handles]
+        interval = settings.scheduler_initial_interval_seconds
+        now = self._clock()
+        entries = []
+        for handle in unique_handles(normalized):
+            latest = self.store.latest_scan_for_handle(handle)
+            due = now
+            if latest is not None:
+                scanned_at = datetime.fromisoformat(str(latest["scanned_at"])).timestamp()
+                due = min(scanned_at + interval, now + interval)
+            entries.append((handle, _iso(due), interval))
+        return self.store.track_handles(entries)
+
+    def load(self) -> None:
+        self._heap = [_scheduled_handle(row) for row in self.store.scan_schedule()]
+        heapq.heapify(self._heap)
+        self._scheduled = {entry.handle for entry in self._heap}
+        self._loaded_at = self._clock()
+
+    def _load_new(self) -> None:
+        """Add handles tracked since the last load; known ones keep their in-memory entry."""
+        if self._clock() - self._loaded_at < settings.scheduler_idle_poll_seconds:
+            return
+        for row in self.store.scan_schedule():
+            if row["handle"] not in self._scheduled:
+                entry = _scheduled_handle(row)
+                heapq.heappush(self._heap, entry)
+                self._scheduled.add(entry.handle)
+        self._loaded_at = self._clock()
+
+    async def run(self, max_scans: int | None = None) -> int:
+        """Run until cancelled, or until `max_scans` scans have finished."""
+        self.load()
+        slots = asyncio.Semaphore(self.concurrency)
+        running: set[asyncio.Task[None]] = set()
+        started = 0
+
+        def finished(task: asyncio.Task[None]) -> None:
+            running.discard(task)
+            slots.release()
+
+        try:
+            while max_scans is None or started < max_scans:
+                if not self._heap:
+                    await self._sleep(settings.scheduler_idle_poll_seconds)
+                    self._load_new()
+                    continue
+                now = self._clock()
+                wait = max(self._heap[0].next_scan_at, self._next_start) - now
+                if wait > 0:
+                    await self._sleep(min(wait, settings.scheduler_idle_poll_seconds))
+                    self._load_new()
+                    continue
+
+                await slots.acquire()
+                entry = heapq.heappop(self._heap)
+                self._next_start = max(now, self._next_start) + 60 / self.scans_per_minute
+                task = asyncio.ensure_future(self._rescan(entry))
+                running.add(task)
+                task.add_done_callback(finished)
+                started += 1
+            if running:
+                await asyncio.gather(*running)
+        finally:
+            for task in running:
+                task.cancel()
+        return started
+
+    async def _rescan(self, entry: ScheduledHandle) -> None:
+        try:
+            result = await self.scan_service.run_and_store(entry.handle)
+        except Exception:
+            # Failing handles back off like dormant ones instead of being retried hot.
+            entry.failures += 1
+            entry.interval_seconds = min(
+                entry.interval_seconds * 2,
+                settings.scheduler_max_interval_seconds,
+            )
+        else:
+            entry.interval_seconds = next_interval(entry, result)
+            entry.last_score = float(result["score"]["normalized"])
+            entry.last_pushed_at = _latest_push(result)
+            entry.failures = 0
+        entry.next_scan_at = self._clock() + entry.interval_seconds
+        self.store.update_schedule(
+            entry.handle,
+            next_scan_at=_iso(entry.next_scan_at),
+            interval_seconds=entry.interval_seconds,
+            last_score=entry.last_score,
+            last_pushed_at=entry.last_pushed_at,
+            failures=entry.failures,
+        )
+        heapq.heappush(self._heap, entry)
+
+
+def _scheduled_handle(row: dict[str, Any]) -> ScheduledHandle:
+    return ScheduledHandle(
+        next_scan_at=datetime.fromisoformat(str(row["next_scan_at"])).timestamp(),
+        handle=str(row["handle"]),
+        interval_seconds=float(row["interval_seconds"]),
+        last_score=row["last_score"],
+        last_pushed_at=row["last_pushed_at"],
+        failures=int(row["failures"]),
+    )
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
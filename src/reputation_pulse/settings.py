@@ -6,17 +6,77 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env_list(*names: str) -> tuple[str, ...]:
+    values: list[str] = []
+    for name in names:
+        values.extend(item.strip() for item in os.getenv(name, "").split(","))
+    return tuple(dict.fromkeys(value for value in values if value))
+
+
 @dataclass(frozen=True)
 class Settings:
     github_user_url: str = "https://api.github.com/users/{handle}"
     github_repos_url: str = "https://api.github.com/users/{handle}/repos"
+    github_graphql_url: str = "https://api.github.com/graphql"
+    github_collector_backend: str = os.getenv("GITHUB_COLLECTOR_BACKEND", "rest")
     github_repos_per_page: int = 100
     github_max_repo_pages: int = 10
+    github_page_concurrency: int = 4
+    github_ledger_full_refresh_seconds: int = 86400
     max_recent_repos: int = 3
     default_timeout: float = 15.0
+    scan_deadline_seconds: float = 20.0
+    github_budget_seconds: float = 15.0
+    rss_budget_seconds: float = 8.0
+    rss_scan_deadline_seconds: float = 10.0
+    rss_cache_ttl_seconds: int = 3600
+    rss_feed_location_ttl_seconds: int = 7 * 86400
+    rss_no_feed_ttl_seconds: int = 86400
+    rss_max_feed_bytes: int = 2_000_000
+    rss_stale_entries_before_stop: int = 5
+    http2_enabled: bool = True
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
     db_path: str = "reputation_pulse.db"
+    sqlite_busy_timeout_ms: int = 5000
+    payload_compression_level: int = 6
+    payload_shared_dictionary: bool = True
+    payload_max_delta_depth: int = 8
+    sqlite_cache_size_kib: int = 16 * 1024
+    sqlite_mmap_size_bytes: int = 64 * 1024 * 1024
+    storage_threads: int = 4
+    retention_raw_days: int = 30
+    retention_daily_days: int = 365
+    compaction_batch_size: int = 500
+    compaction_pause_seconds: float = 0.05
     cache_dir: str = ".cache/reputation-pulse"
     github_cache_ttl_seconds: int = 900
+    recent_scan_window_seconds: int = 0
+    batch_concurrency: int = 8
+    job_workers: int = 4
+    job_max_handles: int = 10_000
+    job_results_poll_seconds: float = 0.5
+    job_save_retry_seconds: float = 1.0
+    worker_concurrency: int = 4
+    queue_lease_seconds: float = 120.0
+    queue_max_attempts: int = 5
+    queue_retry_delay_seconds: float = 30.0
+    queue_poll_seconds: float = 2.0
+    scheduler_concurrency: int = 4
+    scheduler_scans_per_minute: float = 30.0
+    scheduler_initial_interval_seconds: float = 86400
+    scheduler_min_interval_seconds: float = 900
+    scheduler_max_interval_seconds: float = 14 * 86400
+    scheduler_score_change_threshold: float = 0.5
+    scheduler_idle_poll_seconds: float = 30.0
     github_token: str = os.getenv("GITHUB_TOKEN", "")
+    github_tokens: tuple[str, ...] = _env_list("GITHUB_TOKEN", "GITHUB_TOKENS")
+    github_rate_limit_reserve: int = 5
+    github_rate_limit_retries: int = 2
+    github_rate_limit_max_wait_seconds: float = float(
+        os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT_SECONDS", "60")
+    )
+
 
 settings = Settings()
@@ -1,61 +1,132 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
+from reputation_pulse.migrations import migrate
+from reputation_pulse.payloads import (
+    canonical_json,
+    compress_payload,
+    decompress_payload,
+    parse_payload,
+    payload_digest,
+)
 from reputation_pulse.settings import settings
 
 
 class ScanStore:
+    """SQLite-backed history, schedules and queues.
+
+    Each thread keeps one open connection per store (reopened after a fork), in WAL
+    mode so readers never wait for a scan being saved.
+    """
+
     def __init__(self, db_path: str | None = None) -> None:
         self.db_path = db_path or settings.db_path
+        self._local = threading.local()
+        # Each connection with the thread it belongs to, so dead threads' ones can be closed.
+        self._connections: list[tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
         self._ensure_schema()
 
     @contextmanager
     def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(self.db_path)
+        conn = self._thread_connection()
         try:
             yield conn
         finally:
+            # Same outcome as closing a short-lived connection: uncommitted work is dropped.
+            if conn.in_transaction:
+                conn.rollback()
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=settings.sqlite_busy_timeout_ms / 1000,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size_bytes)}")
+        conn.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        with self._connections_lock:
+            self._connections.append((threading.current_thread(), conn))
+        return conn
+
+    def close(self) -> None:
+        """Close every connection this store opened, in any thread."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for _thread, conn in connections:
             conn.close()
+        self._local = threading.local()
+
+    def close_exited_threads(self) -> int:
+        """Close the connections of threads that have finished, e.g. a retired pool's."""
+        with self._connections_lock:
+            exited = [conn for thread, conn in self._connections if not thread.is_alive()]
+            self._connections = [pair for pair in self._connections if pair[0].is_alive()]
+        for conn in exited:
+            conn.close()
+        return len(exited)
 
     def _ensure_schema(self) -> None:
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS scans (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    handle TEXT NOT NULL,
-                    normalized_score REAL NOT NULL,
-                    rating TEXT NOT NULL,
-                    payload TEXT NOT NULL,
-                    scanned_at TEXT NOT NULL
-                )
-                """
-            )
-            conn.commit()
+            migrate(conn)
 
     def save_scan(self, result: dict[str, object]) -> None:
         scanned_at = datetime.now(timezone.utc).isoformat()
-        payload = json.dumps(result)
+        handle = str(result["handle"])
+        score = float(result["score"]["normalized"])
+        rating = str(result["summary"]["rating"])
         with self._connect() as conn:
+            # Lock first: the digest lookup and insert below must not race another writer.
+            conn.execute("BEGIN IMMEDIATE")
+            # Before the scan row exists, so the handle's previous payload can be the delta base.
+            blob_id = self._store_payload(conn, handle, result)
+            cursor = conn.execute(
+                """
+                INSERT INTO scans (handle, normalized_score, rating, scanned_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (handle, score, rating, scanned_at),
+            )
+            conn.execute(
+                "INSERT INTO scan_payloads (scan_id, blob_id) VALUES (?, ?)",
+                (cursor.lastrowid, blob_id),
+            )
             conn.execute(
                 """
-                INSERT INTO scans (handle, normalized_score, rating, payload, scanned_at)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO handle_stats (
+                    handle, scans_count, score_sum, min_score, max_score,
+                    first_scan_at, last_scan_at, latest_score, latest_rating
+                )
+                VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(handle) DO UPDATE SET
+                    scans_count = scans_count + 1,
+                    score_sum = score_sum + excluded.score_sum,
+                    min_score = MIN(min_score, excluded.min_score),
+                    max_score = MAX(max_score, excluded.max_score),
+                    first_scan_at = MIN(first_scan_at, excluded.first_scan_at),
+                    last_scan_at = MAX(last_scan_at, excluded.last_scan_at),
+                    latest_score = excluded.latest_score,
+                    latest_rating = excluded.latest_rating
                 """,
-                (
-                    str(result["handle"]),
-                    float(result["score"]["normalized"]),
-                    str(result["summary"]["rating"]),
-                    payload,
-                    scanned_at,
-                ),
+                (handle, score, score, score, scanned_at, scanned_at, score, rating),
             )
             conn.commit()
 
@@ -106,83 +177,732 @@ class ScanStore:
 
     def latest_result_for_handle(self, handle: str) -> dict[str, object] | None:
         with self._connect() as conn:
+            blob_id = self._latest_blob_id(conn, handle)
+            raw = None if blob_id is None else self._blob_bytes(conn, blob_id)
+        return parse_payload(raw)
+
+    def _store_payload(
+        self,
+        conn: sqlite3.Connection,
+        handle: str,
+        result: dict[str, object],
+    ) -> int:
+        """Return the blob holding `result`, storing it once per distinct content.
+
+        New content is stored as a delta against the handle's previous payload when
+        that is smaller, as long as the chain stays within `payload_max_delta_depth`.
+        """
+        raw = canonical_json(result)
+        digest = payload_digest(raw)
+        existing = conn.execute(
+            "SELECT id FROM payload_blobs WHERE digest = ?",
+            (digest,),
+        ).fetchone()
+        if existing is not None:
+            return int(existing[0])
+
+        codec, data = compress_payload(raw)
+        base_id, depth = None, 0
+        previous_id = self._latest_blob_id(conn, handle)
+        if previous_id is not None:
+            previous_depth = conn.execute(
+                "SELECT depth FROM payload_blobs WHERE id = ?",
+                (previous_id,),
+            ).fetchone()[0]
+            base = self._blob_bytes(conn, previous_id)
+            if base is not None and previous_depth < settings.payload_max_delta_depth:
+                delta_codec, delta = compress_payload(raw, base=base)
+                if len(delta) < len(data):
+                    codec, data = delta_codec, delta
+                    base_id, depth = previous_id, previous_depth + 1
+
+        cursor = conn.execute(
+            """
+            INSERT INTO payload_blobs (digest, codec, data, base_id, depth)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (digest, codec, data, base_id, depth),
+        )
+        return int(cursor.lastrowid)
+
+    def _latest_blob_id(self, conn: sqlite3.Connection, handle: str) -> int | None:
+        row = conn.execute(
+            """
+            SELECT scan_payloads.blob_id
+            FROM (
+                SELECT id FROM scans WHERE handle = ? ORDER BY id DESC LIMIT 1
+            ) AS latest
+            LEFT JOIN scan_payloads ON scan_payloads.scan_id = latest.id
+            """,
+            (handle,),
+        ).fetchone()
+        return None if row is None or row[0] is None else int(row[0])
+
+    def _blob_bytes(self, conn: sqlite3.Connection, blob_id: int) -> bytes | None:
+        """Rebuild a payload's canonical bytes by replaying its delta chain from the root."""
+        chain = []
+        next_id: int | None = blob_id
+        while next_id is not None:
             row = conn.execute(
-                """
-                SELECT payload
-                FROM scans
-                WHERE handle = ?
-                ORDER BY id DESC
-                LIMIT 1
-                """,
-                (handle,),
+                "SELECT codec, data, base_id FROM payload_blobs WHERE id = ?",
+                (next_id,),
             ).fetchone()
-        if row is None:
-            return None
-        try:
-            payload = json.loads(row[0])
-        except json.JSONDecodeError:
-            return None
-        if not isinstance(payload, dict):
-            return None
-        return payload
+            if row is None:
+                return None
+            chain.append((row[0], row[1]))
+            next_id = row[2]
+
+        raw = None
+        for codec, data in reversed(chain):
+            raw = decompress_payload(codec, data, base=raw)
+            if raw is None:
+                return None
+        return raw
 
     def handle_insights(self, handle: str) -> dict[str, object] | None:
         with self._connect() as conn:
             row = conn.execute(
                 """
                 SELECT
-                    COUNT(*) as scans_count,
-                    AVG(normalized_score) as average_score,
-                    MIN(normalized_score) as min_score,
-                    MAX(normalized_score) as max_score,
-                    MIN(scanned_at) as first_scan_at,
-                    MAX(scanned_at) as last_scan_at
-                FROM scans
+                    scans_count,
+                    score_sum,
+                    min_score,
+                    max_score,
+                    first_scan_at,
+                    last_scan_at,
+                    latest_score,
+                    latest_rating
+                FROM handle_stats
                 WHERE handle = ?
                 """,
                 (handle,),
             ).fetchone()
 
-            latest_row = conn.execute(
-                """
-                SELECT normalized_score, rating
-                FROM scans
-                WHERE handle = ?
-                ORDER BY id DESC
-                LIMIT 1
-                """,
-                (handle,),
-            ).fetchone()
-
-        if row is None or row[0] == 0 or latest_row is None:
+        if row is None or row[0] == 0:
             return None
 
         return {
             "handle": handle,
             "scans_count": int(row[0]),
-            "average_score": round(float(row[1]), 2),
+            "average_score": round(float(row[1]) / int(row[0]), 2),
             "min_score": float(row[2]),
             "max_score": float(row[3]),
             "first_scan_at": row[4],
             "last_scan_at": row[5],
-            "latest_score": float(latest_row[0]),
-            "latest_rating": str(latest_row[1]),
+            "latest_score": float(row[6]),
+            "latest_rating": str(row[7]),
         }
 
+    def rebuild_handle_stats(self) -> int:
+        """Recompute every handle's aggregates from raw and rolled-up history.
+
+        Returns the handle count.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM handle_stats")
+            conn.execute(
+                """
+                INSERT INTO handle_stats (
+                    handle, scans_count, score_sum, min_score, max_score,
+                    first_scan_at, last_scan_at, latest_score, latest_rating
+                )
+                SELECT
+                    handle,
+                    SUM(scans_count),
+                    SUM(score_sum),
+                    MIN(min_score),
+                    MAX(max_score),
+                    MIN(first_scan_at),
+                    MAX(last_scan_at),
+                    COALESCE(
+                        (SELECT normalized_score FROM scans AS latest
+                         WHERE latest.handle = history.handle ORDER BY id DESC LIMIT 1),
+                        (SELECT last_score FROM scan_rollups AS latest
+                         WHERE latest.handle = history.handle
+                         ORDER BY last_scan_at DESC LIMIT 1)
+                    ),
+                    COALESCE(
+                        (SELECT rating FROM scans AS latest
+                         WHERE latest.handle = history.handle ORDER BY id DESC LIMIT 1),
+                        (SELECT last_rating FROM scan_rollups AS latest
+                         WHERE latest.handle = history.handle
+                         ORDER BY last_scan_at DESC LIMIT 1)
+                    )
+                FROM (
+                    SELECT handle, 1 AS scans_count, normalized_score AS score_sum,
+                        normalized_score AS min_score, normalized_score AS max_score,
+                        scanned_at AS first_scan_at, scanned_at AS last_scan_at
+                    FROM scans
+                    UNION ALL
+                    SELECT handle, scans_count, score_sum, min_score, max_score,
+                        first_scan_at, last_scan_at
+                    FROM scan_rollups
+                ) AS history
+                GROUP BY handle
+                """
+            )
+            count = conn.execute("SELECT COUNT(*) FROM handle_stats").fetchone()[0]
+            conn.commit()
+        return int(count)
+
     def score_series(self, handle: str, limit: int = 30) -> list[dict[str, object]]:
+        """The newest `limit` points, oldest first, from raw scans and rollups alike.
+
+        A rolled-up point carries the bucket's average score at its last scan time,
+        plus a `bucket` key naming its width ('day' or 'week').
+        """
         with self._connect() as conn:
             rows = conn.execute(
                 """
-                SELECT normalized_score, scanned_at
+                SELECT normalized_score, scanned_at, bucket FROM (
+                    SELECT normalized_score, scanned_at, NULL AS bucket
+                    FROM scans
+                    WHERE handle = ?
+                    ORDER BY id DESC
+                    LIMIT ?
+                )
+                UNION ALL
+                SELECT score, scanned_at, bucket FROM (
+                    SELECT score_sum / scans_count AS score, last_scan_at AS scanned_at, bucket
+                    FROM scan_rollups
+                    WHERE handle = ?
+                    ORDER BY last_scan_at DESC
+                    LIMIT ?
+                )
+                ORDER BY scanned_at DESC
+                LIMIT ?
+                """,
+                (handle, limit, handle, limit, limit),
+            ).fetchall()
+
+        series: list[dict[str, object]] = []
+        for score, scanned_at, bucket in reversed(rows):
+            if bucket is None:
+                series.append({"normalized_score": float(score), "scanned_at": scanned_at})
+            else:
+                series.append(
+                    {
+                        "normalized_score": round(float(score), 2),
+                        "scanned_at": scanned_at,
+                        "bucket": bucket,
+                    }
+                )
+        return series
+
+    def roll_up_scans(self, before: str, batch_size: int) -> int:
+        """Fold one batch of raw scans older than `before` into daily rollups.
+
+        Each handle's newest scan always stays raw, since reports and the analyzer's
+        fallbacks read its payload. Returns the number of scans folded; 0 when done.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                """
+                SELECT id, handle, normalized_score, rating, scanned_at
                 FROM scans
-                WHERE handle = ?
-                ORDER BY id DESC
+                WHERE scanned_at < ?
+                    AND id < (
+                        SELECT MAX(id) FROM scans AS newest WHERE newest.handle = scans.handle
+                    )
+                ORDER BY scanned_at, id
                 LIMIT ?
                 """,
-                (handle, limit),
+                (before, batch_size),
+            ).fetchall()
+            if not rows:
+                conn.rollback()
+                return 0
+
+            buckets: dict[tuple[str, str], list[object]] = {}
+            for _scan_id, handle, score, rating, scanned_at in rows:
+                day = _utc_date(scanned_at).isoformat()
+                stats = (1, score, score, score, scanned_at, scanned_at, score, rating)
+                _fold(buckets, (handle, day), stats)
+            self._merge_rollups(conn, "day", buckets)
+            scan_ids = [(row[0],) for row in rows]
+            conn.executemany("DELETE FROM scan_payloads WHERE scan_id = ?", scan_ids)
+            conn.executemany("DELETE FROM scans WHERE id = ?", scan_ids)
+            conn.commit()
+        return len(rows)
+
+    def roll_up_days(self, before: str, batch_size: int) -> int:
+        """Fold one batch of daily rollups dated before `before` into weekly ones.
+
+        Weeks start on Monday. Returns the number of daily rows folded; 0 when done.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                """
+                SELECT handle, bucket_start, scans_count, score_sum, min_score, max_score,
+                    first_scan_at, last_scan_at, last_score, last_rating
+                FROM scan_rollups
+                WHERE bucket = 'day' AND bucket_start < ?
+                ORDER BY bucket_start, handle
+                LIMIT ?
+                """,
+                (before, batch_size),
+            ).fetchall()
+            if not rows:
+                conn.rollback()
+                return 0
+
+            buckets: dict[tuple[str, str], list[object]] = {}
+            for handle, day, *stats in rows:
+                start = date.fromisoformat(day)
+                week = (start - timedelta(days=start.weekday())).isoformat()
+                _fold(buckets, (handle, week), tuple(stats))
+            self._merge_rollups(conn, "week", buckets)
+            conn.executemany(
+                "DELETE FROM scan_rollups WHERE handle = ? AND bucket = 'day' AND bucket_start = ?",
+                [(row[0], row[1]) for row in rows],
+            )
+            conn.commit()
+        return len(rows)
+
+    def _merge_rollups(
+        self,
+        conn: sqlite3.Connection,
+        bucket: str,
+        buckets: dict[tuple[str, str], list[object]],
+    ) -> None:
+        conn.executemany(
+            """
+            INSERT INTO scan_rollups (
+                handle, bucket, bucket_start, scans_count, score_sum, min_score, max_score,
+                first_scan_at, last_scan_at, last_score, last_rating
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(handle, bucket, bucket_start) DO UPDATE SET
+                scans_count = scans_count + excluded.scans_count,
+                score_sum = score_sum + excluded.score_sum,
+                min_score = MIN(min_score, excluded.min_score),
+                max_score = MAX(max_score, excluded.max_score),
+                first_scan_at = MIN(first_scan_at, excluded.first_scan_at),
+                last_score = CASE WHEN excluded.last_scan_at >= last_scan_at
+                    THEN excluded.last_score ELSE last_score END,
+                last_rating = CASE WHEN excluded.last_scan_at >= last_scan_at
+                    THEN excluded.last_rating ELSE last_rating END,
+                last_scan_at = MAX(last_scan_at, excluded.last_scan_at)
+            """,
+            [(handle, bucket, start, *stats) for (handle, start), stats in buckets.items()],
+        )
+
+    def collect_orphan_payloads(self, batch_size: int) -> int:
+        """Delete one batch of payload blobs no scan or delta refers to; returns how many.
+
+        A delta chain is released from its newest end, one link per pass.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM payload_blobs
+                WHERE id IN (
+                    SELECT id FROM payload_blobs AS blob
+                    WHERE NOT EXISTS (SELECT 1 FROM scan_payloads WHERE blob_id = blob.id)
+                        AND NOT EXISTS (
+                            SELECT 1 FROM payload_blobs AS child WHERE child.base_id = blob.id
+                        )
+                    LIMIT ?
+                )
+                """,
+                (batch_size,),
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def repo_ledger(self, handle: str) -> dict[str, object] | None:
+        with self._connect() as conn:
+            state = conn.execute(
+                "SELECT full_refresh_at FROM repo_ledger_state WHERE handle = ?",
+                (handle,),
+            ).fetchone()
+            if state is None:
+                return None
+            rows = conn.execute(
+                "SELECT name, stars, pushed_at FROM repo_ledger WHERE handle = ?",
+                (handle,),
+            ).fetchall()
+
+        return {
+            "full_refresh_at": state[0],
+            "repos": {row[0]: {"stars": int(row[1]), "pushed_at": row[2]} for row in rows},
+        }
+
+    def replace_repo_ledger(self, handle: str, repos: dict[str, dict[str, object]]) -> None:
+        refreshed_at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM repo_ledger WHERE handle = ?", (handle,))
+            self._upsert_ledger_rows(conn, handle, repos)
+            conn.execute(
+                """
+                INSERT INTO repo_ledger_state (handle, full_refresh_at) VALUES (?, ?)
+                ON CONFLICT(handle) DO UPDATE SET full_refresh_at = excluded.full_refresh_at
+                """,
+                (handle, refreshed_at),
+            )
+            conn.commit()
+
+    def update_repo_ledger(self, handle: str, repos: dict[str, dict[str, object]]) -> None:
+        with self._connect() as conn:
+            self._upsert_ledger_rows(conn, handle, repos)
+            conn.commit()
+
+    def _upsert_ledger_rows(
+        self,
+        conn: sqlite3.Connection,
+        handle: str,
+        repos: dict[str, dict[str, object]],
+    ) -> None:
+        conn.executemany(
+            """
+            INSERT INTO repo_ledger (handle, name, stars, pushed_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(handle, name) DO UPDATE
+            SET stars = excluded.stars, pushed_at = excluded.pushed_at
+            """,
+            [
+                (handle, name, int(repo.get("stars") or 0), repo.get("pushed_at"))
+                for name, repo in repos.items()
+            ],
+        )
+
+    def track_handles(self, entries: list[tuple[str, str, float]]) -> int:
+        """Add (handle, next_scan_at, interval_seconds) rows; tracked handles are kept as is."""
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO scan_schedule (handle, next_scan_at, interval_seconds)
+                VALUES (?, ?, ?)
+                """,
+                entries,
+            )
+            conn.commit()
+            return conn.total_changes - before
+
+    def scan_schedule(self) -> list[dict[str, object]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT handle, next_scan_at, interval_seconds, last_score, last_pushed_at, failures
+                FROM scan_schedule
+                ORDER BY next_scan_at
+                """
             ).fetchall()
 
         return [
-            {"normalized_score": float(row[0]), "scanned_at": row[1]}
-            for row in reversed(rows)
+            {
+                "handle": row[0],
+                "next_scan_at": row[1],
+                "interval_seconds": float(row[2]),
+                "last_score": row[3],
+                "last_pushed_at": row[4],
+                "failures": int(row[5]),
+            }
+            for row in rows
         ]
+
+    def update_schedule(
+        self,
+        handle: str,
+        next_scan_at: str,
+        interval_seconds: float,
+        last_score: float | None,
+        last_pushed_at: str | None,
+        failures: int,
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE scan_schedule
+                SET next_scan_at = ?, interval_seconds = ?, last_score = ?,
+                    last_pushed_at = ?, failures = ?
+                WHERE handle = ?
+                """,
+                (next_scan_at, interval_seconds, last_score, last_pushed_at, failures, handle),
+            )
+            conn.commit()
+
+    def create_job(self, job_id: str, handles: list[str]) -> None:
+        created_at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, total, created_at) VALUES (?, ?, ?)",
+                (job_id, len(handles), created_at),
+            )
+            conn.executemany(
+                "INSERT INTO job_handles (job_id, position, handle) VALUES (?, ?, ?)",
+                [(job_id, position, handle) for position, handle in enumerate(handles)],
+            )
+            conn.commit()
+
+    def job(self, job_id: str) -> dict[str, object] | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    jobs.id,
+                    jobs.total,
+                    jobs.created_at,
+                    jobs.finished_at,
+                    COUNT(job_results.id),
+                    COALESCE(SUM(job_results.status = 'error'), 0)
+                FROM jobs
+                LEFT JOIN job_results ON job_results.job_id = jobs.id
+                WHERE jobs.id = ?
+                GROUP BY jobs.id
+                """,
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        total, completed = int(row[1]), int(row[4])
+        if row[3] is not None:
+            status = "done"
+        else:
+            status = "running" if completed else "queued"
+        return {
+            "job_id": row[0],
+            "status": status,
+            "total": total,
+            "completed": completed,
+            "errors": int(row[5]),
+            "created_at": row[2],
+            "finished_at": row[3],
+        }
+
+    def unfinished_jobs(self) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE finished_at IS NULL ORDER BY created_at"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def pending_job_handles(self, job_id: str) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT job_handles.handle
+                FROM job_handles
+                LEFT JOIN job_results
+                    ON job_results.job_id = job_handles.job_id
+                    AND job_results.handle = job_handles.handle
+                WHERE job_handles.job_id = ? AND job_results.id IS NULL
+                ORDER BY job_handles.position
+                """,
+                (job_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def save_job_result(self, job_id: str, record: dict[str, object]) -> None:
+        """Record one handle's outcome and close the job once every handle has one."""
+        finished_at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO job_results (job_id, handle, status, record)
+                VALUES (?, ?, ?, ?)
+                """,
+                (job_id, str(record["handle"]), str(record["status"]), json.dumps(record)),
+            )
+            conn.execute(
+                """
+                UPDATE jobs SET finished_at = ?
+                WHERE id = ?
+                    AND finished_at IS NULL
+                    AND total <= (SELECT COUNT(*) FROM job_results WHERE job_id = ?)
+                """,
+                (finished_at, job_id, job_id),
+            )
+            conn.commit()
+
+    def job_results(
+        self,
+        job_id: str,
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> list[tuple[int, dict[str, object]]]:
+        """Result records in completion order, paged by the last seen result id."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, record
+                FROM job_results
+                WHERE job_id = ? AND id > ?
+                ORDER BY id
+                LIMIT ?
+                """,
+                (job_id, after_id, limit),
+            ).fetchall()
+        return [(int(row[0]), json.loads(row[1])) for row in rows]
+
+    def enqueue_handles(self, handles: list[str], now: float | None = None) -> int:
+        """Queue handles for the workers; a handle that is already pending is not added twice."""
+        enqueued_at = datetime.now(timezone.utc).isoformat()
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            before = conn.total_changes
+            for handle in handles:
+                conn.execute(
+                    """
+                    INSERT INTO work_queue (handle, visible_at, enqueued_at)
+                    SELECT ?, ?, ?
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM work_queue WHERE handle = ? AND status = 'pending'
+                    )
+                    """,
+                    (handle, now, enqueued_at, handle),
+                )
+            conn.commit()
+            return conn.total_changes - before
+
+    def claim_work(
+        self,
+        owner: str,
+        lease_seconds: float,
+        now: float | None = None,
+    ) -> dict[str, object] | None:
+        """Lease the next visible item to `owner`; it reappears if not settled in time.
+
+        `BEGIN IMMEDIATE` takes the write lock before reading, so two processes can
+        never lease the same item. `now` (epoch seconds) defaults to the wall clock.
+        An item whose lease ran out on its last allowed attempt is dead-lettered
+        rather than leased again, so a handle that crashes or hangs its worker
+        cannot cycle forever.
+        """
+        now = time.time() if now is None else now
+        finished_at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """
+                UPDATE work_queue
+                SET status = 'dead', finished_at = ?,
+                    last_error = COALESCE(last_error, 'lease expired on the final attempt')
+                WHERE status = 'pending' AND lease_owner IS NOT NULL
+                    AND visible_at <= ? AND attempts >= ?
+                """,
+                (finished_at, now, settings.queue_max_attempts),
+            )
+            row = conn.execute(
+                """
+                SELECT id, handle, attempts
+                FROM work_queue
+                WHERE status = 'pending' AND visible_at <= ?
+                ORDER BY visible_at, id
+                LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                conn.commit()
+                return None
+            conn.execute(
+                """
+                UPDATE work_queue
+                SET lease_owner = ?, visible_at = ?, attempts = attempts + 1
+                WHERE id = ?
+                """,
+                (owner, now + lease_seconds, row[0]),
+            )
+            conn.commit()
+        return {"id": int(row[0]), "handle": row[1], "attempts": int(row[2]) + 1}
+
+    def complete_work(self, item_id: int, owner: str) -> bool:
+        """Mark a leased item done; False when the lease was lost to another worker."""
+        finished_at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE work_queue
+                SET status = 'done', finished_at = ?, last_error = NULL
+                WHERE id = ? AND lease_owner = ? AND status = 'pending'
+                """,
+                (finished_at, item_id, owner),
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def fail_work(
+        self,
+        item_id: int,
+        owner: str,
+        error: str,
+        retry_in_seconds: float | None,
+        now: float | None = None,
+    ) -> bool:
+        """Release a failed item for a retry later, or dead-letter it (`retry_in_seconds=None`)."""
+        finished_at = datetime.now(timezone.utc).isoformat()
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            if retry_in_seconds is None:
+                cursor = conn.execute(
+                    """
+                    UPDATE work_queue
+                    SET status = 'dead', last_error = ?, finished_at = ?
+                    WHERE id = ? AND lease_owner = ? AND status = 'pending'
+                    """,
+                    (error, finished_at, item_id, owner),
+                )
+            else:
+                cursor = conn.execute(
+                    """
+                    UPDATE work_queue
+                    SET lease_owner = NULL, last_error = ?, visible_at = ?
+                    WHERE id = ? AND lease_owner = ? AND status = 'pending'
+                    """,
+                    (error, now + retry_in_seconds, item_id, owner),
+                )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def queue_stats(self, now: float | None = None) -> dict[str, int]:
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    COALESCE(SUM(status = 'pending' AND visible_at <= ?), 0),
+                    COALESCE(SUM(status = 'pending' AND visible_at > ?
+                        AND lease_owner IS NOT NULL), 0),
+                    COALESCE(SUM(status = 'pending' AND visible_at > ?
+                        AND lease_owner IS NULL), 0),
+                    COALESCE(SUM(status = 'done'), 0),
+                    COALESCE(SUM(status = 'dead'), 0)
+                FROM work_queue
+                """,
+                (now, now, now),
+            ).fetchone()
+        return {
+            "ready": int(row[0]),
+            "leased": int(row[1]),
+            "retrying": int(row[2]),
+            "done": int(row[3]),
+            "dead": int(row[4]),
+        }
+
+
+def _utc_date(timestamp: str) -> date:
+    return datetime.fromisoformat(timestamp).astimezone(timezone.utc).date()
+
+
+def _fold(
+    buckets: dict[tuple[str, str], list[object]],
+    key: tuple[str, str],
+    stats: tuple[object, ...],
+) -> None:
+    """Merge (count, sum, min, max, first_at, last_at, last_score, last_rating) into a bucket."""
+    current = buckets.get(key)
+    if current is None:
+        buckets[key] = list(stats)
+        return
+    count, total, low, high, first_at, last_at, last_score, last_rating = stats
+    current[0] += count
+    current[1] += total
+    current[2] = min(current[2], low)
+    current[3] = max(current[3], high)
+    current[4] = min(current[4], first_at)
+    if last_at >= current[5]:
+        current[5], current[6], current[7] = last_at, last_score, last_rating
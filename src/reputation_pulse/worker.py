@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import uuid
+from collections.abc import Awaitable, Callable
+
+from reputation_pulse.errors import InvalidHandleError, UpstreamNotFoundError
+from reputation_pulse.scan_service import ScanService
+from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+# Retrying cannot fix these, so they go straight to the dead letters.
+PERMANENT_ERRORS = (InvalidHandleError, UpstreamNotFoundError)
+
+
+def retry_delay(attempts: int) -> float:
+    return settings.queue_retry_delay_seconds * 2 ** max(attempts - 1, 0)
+
+
+class QueueWorker:
+    """Consumes the shared `work_queue` table through `ScanService`.
+
+    Any number of worker processes can point at the same database: each item is
+    leased to one worker at a time and comes back once the lease expires, so a
+    crashed worker delays its items instead of losing them. Failed items are retried
+    with exponential backoff and dead-lettered after `queue_max_attempts`, as are
+    items whose final lease expires. Queue calls run in a thread, off the event loop.
+    """
+
+    def __init__(
+        self,
+        scan_service: ScanService,
+        store: ScanStore,
+        concurrency: int | None = None,
+        lease_seconds: float | None = None,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+    ) -> None:
+        self.scan_service = scan_service
+        self.store = store
+        self.concurrency = concurrency or settings.worker_concurrency
+        self.lease_seconds = lease_seconds or settings.queue_lease_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._sleep = sleep
+        self.processed = 0
+        self.failed = 0
+
+    async def run(self, until_empty: bool = False) -> int:
+        """Process items until cancelled, or until the queue has nothing ready."""
+        consumers = [
+            self._consume(f"{self.worker_id}:{slot}", until_empty)
+            for slot in range(self.concurrency)
+        ]
+        await asyncio.gather(*consumers)
+        return self.processed
+
+    async def _consume(self, owner: str, until_empty: bool) -> None:
+        while True:
+            item = await asyncio.to_thread(self.store.claim_work, owner, self.lease_seconds)
+            if item is None:
+                if until_empty:
+                    return
+                await self._sleep(settings.queue_poll_seconds)
+                continue
+            await self._process(owner, item)
+
+    async def _process(self, owner: str, item: dict[str, object]) -> None:
+        item_id = int(item["id"])
+        attempts = int(item["attempts"])
+        try:
+            await self.scan_service.run_and_store(str(item["handle"]))
+        except Exception as exc:
+            self.failed += 1
+            error = f"{type(exc).__name__}: {exc}"
+            give_up = isinstance(exc, PERMANENT_ERRORS) or attempts >= settings.queue_max_attempts
+            retry_in = None if give_up else retry_delay(attempts)
+            await asyncio.to_thread(self.store.fail_work, item_id, owner, error, retry_in)
+            return
+        self.processed += 1
+        await asyncio.to_thread(self.store.complete_work, item_id, owner)
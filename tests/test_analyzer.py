@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
 
 from reputation_pulse.analyzer import ReputationAnalyzer
-from reputation_pulse.errors import InvalidHandleError
+from reputation_pulse.async_storage import AsyncScanStore
+from reputation_pulse.errors import CollectorError, InvalidHandleError
+from reputation_pulse.storage import ScanStore
 
 
 @pytest.mark.asyncio
@@ -39,3 +43,140 @@ async def test_analyzer_includes_web_data():
     analyzer = ReputationAnalyzer(github_collector=FakeGitHub(), rss_collector=FakeRss())
     result = await analyzer.run("g-dos")
     assert result["web"]["recent_entries_30d"] == 2
+
+
+class SlowGitHub:
+    def __init__(self, blog_url: str, delay: float = 0.1):
+        self.blog_url = blog_url
+        self.delay = delay
+
+    async def collect(self, handle: str):
+        await asyncio.sleep(self.delay)
+        return {
+            "handle": handle,
+            "followers": 1,
+            "following": 0,
+            "public_repos": 0,
+            "blog_url": self.blog_url,
+            "stars": 0,
+            "recent_repos": [],
+        }
+
+
+class SlowRss:
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.started: list[str] = []
+        self.finished: list[str] = []
+
+    async def collect(self, blog_url: str):
+        self.started.append(blog_url)
+        await asyncio.sleep(self.delay)
+        self.finished.append(blog_url)
+        return {
+            "blog_url": blog_url,
+            "feed_url": f"{blog_url}/feed",
+            "recent_entries_30d": 1,
+            "last_post_at": None,
+        }
+
+
+def _store_with_blog(tmp_path, blog_url: str) -> ScanStore:
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    store.save_scan(
+        {
+            "handle": "g-dos",
+            "github": {"blog_url": blog_url},
+            "score": {"normalized": 10.0},
+            "summary": {"rating": "Needs Attention"},
+        }
+    )
+    return store
+
+
+@pytest.mark.asyncio
+async def test_analyzer_reads_last_known_blog_while_github_loads(tmp_path):
+    rss = SlowRss()
+    analyzer = ReputationAnalyzer(
+        github_collector=SlowGitHub("https://example.com"),
+        rss_collector=rss,
+        store=AsyncScanStore(_store_with_blog(tmp_path, "https://example.com")),
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await analyzer.run("g-dos")
+    assert loop.time() - started < 0.18
+    assert rss.started == ["https://example.com"]
+    assert result["web"]["feed_url"] == "https://example.com/feed"
+
+
+@pytest.mark.asyncio
+async def test_analyzer_refetches_when_blog_url_changed(tmp_path):
+    rss = SlowRss(delay=0.05)
+    analyzer = ReputationAnalyzer(
+        github_collector=SlowGitHub("https://new.example.com", delay=0.01),
+        rss_collector=rss,
+        store=AsyncScanStore(_store_with_blog(tmp_path, "https://old.example.com")),
+    )
+
+    result = await analyzer.run("g-dos")
+    await asyncio.sleep(0)
+    assert rss.started == ["https://old.example.com", "https://new.example.com"]
+    assert rss.finished == ["https://new.example.com"]
+    assert result["web"]["blog_url"] == "https://new.example.com"
+
+
+@pytest.mark.asyncio
+async def test_analyzer_cancels_slow_feed_and_reuses_stored_value(tmp_path):
+    store = _store_with_blog(tmp_path, "https://example.com")
+    rss = SlowRss(delay=5.0)
+    analyzer = ReputationAnalyzer(
+        github_collector=SlowGitHub("https://example.com", delay=0),
+        rss_collector=rss,
+        store=AsyncScanStore(store),
+    )
+    store.save_scan(
+        {
+            "handle": "g-dos",
+            "github": {"blog_url": "https://example.com"},
+            "web": {"blog_url": "https://example.com", "recent_entries_30d": 4},
+            "score": {"normalized": 10.0},
+            "summary": {"rating": "Needs Attention"},
+        }
+    )
+
+    result = await analyzer.run("g-dos", budgets={"web": 0.05})
+    assert result["degraded"] == {"web": "stale"}
+    assert result["web"]["recent_entries_30d"] == 4
+    assert result["summary"]["degraded"] == {"web": "stale"}
+    assert rss.finished == []
+
+
+@pytest.mark.asyncio
+async def test_analyzer_marks_feed_missing_without_history():
+    analyzer = ReputationAnalyzer(
+        github_collector=SlowGitHub("https://example.com", delay=0),
+        rss_collector=SlowRss(delay=5.0),
+    )
+    result = await analyzer.run("g-dos", deadline_seconds=0.05)
+    assert result["degraded"] == {"web": "missing"}
+    assert result["web"]["recent_entries_30d"] == 0
+
+
+@pytest.mark.asyncio
+async def test_analyzer_falls_back_to_stored_github_or_fails(tmp_path):
+    slow_github = SlowGitHub("https://example.com", delay=5.0)
+    with pytest.raises(CollectorError):
+        await ReputationAnalyzer(github_collector=slow_github, rss_collector=SlowRss()).run(
+            "g-dos", budgets={"github": 0.05}
+        )
+
+    analyzer = ReputationAnalyzer(
+        github_collector=slow_github,
+        rss_collector=SlowRss(delay=0),
+        store=AsyncScanStore(_store_with_blog(tmp_path, "https://example.com")),
+    )
+    result = await analyzer.run("g-dos", budgets={"github": 0.05})
+    assert result["degraded"] == {"github": "stale"}
+    assert result["github"]["blog_url"] == "https://example.com"
@@ -1,3 +1,10 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
 from reputation_pulse import api as api_module
@@ -6,6 +13,8 @@ from reputation_pulse.errors import (
     UpstreamNotFoundError,
     UpstreamRateLimitError,
 )
+from reputation_pulse.jobs import JobManager
+from reputation_pulse.storage import ScanStore
 
 client = TestClient(api_module.app)
 
@@ -166,3 +175,84 @@ def test_series_success(monkeypatch):
     assert response.status_code == 200
     assert response.json()["handle"] == "g-dos"
     assert len(response.json()["items"]) == 1
+
+
+def test_batch_scan_job_lifecycle(monkeypatch, tmp_path):
+    async def fake_scan(handle: str):
+        if handle == "ghost":
+            raise UpstreamNotFoundError("missing")
+        return {"handle": handle}
+
+    store = ScanStore(db_path=str(tmp_path / "jobs.db"))
+    scans = SimpleNamespace(run_and_store=fake_scan)
+    monkeypatch.setattr(api_module, "jobs", JobManager(scans, store, workers=2))
+
+    with TestClient(api_module.app) as lifespan_client:
+        created = lifespan_client.post("/scans/batch", json={"handles": ["g-dos", "ghost"]})
+        assert created.status_code == 202
+        job_id = created.json()["job_id"]
+
+        streamed = lifespan_client.get(f"/jobs/{job_id}/results", params={"follow": True})
+        assert streamed.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in streamed.text.splitlines()]
+        assert {record["handle"]: record["status"] for record in records} == {
+            "g-dos": "ok",
+            "ghost": "error",
+        }
+
+        job = lifespan_client.get(f"/jobs/{job_id}").json()
+        assert job["status"] == "done"
+        assert job["errors"] == 1
+        assert job["completed"] == 2
+        assert "results" not in job
+
+        assert lifespan_client.get("/jobs/unknown").status_code == 404
+        assert lifespan_client.post("/scans/batch", json={"handles": []}).status_code == 422
+
+
+STORE_LATENCY = 0.05
+
+
+def _slow(value):
+    def call(*_args, **_kwargs):
+        time.sleep(STORE_LATENCY)
+        return value
+
+    return call
+
+
+@pytest.mark.asyncio
+async def test_concurrent_history_and_scans_do_not_serialize_on_storage(monkeypatch):
+    class QuickAnalyzer:
+        async def run(self, handle: str):
+            return {
+                "handle": handle,
+                "score": {"normalized": 10.0},
+                "summary": {"rating": "Needs Attention"},
+            }
+
+    # Every storage call blocks its thread, like a slow disk or a query waiting on a lock.
+    monkeypatch.setattr(api_module.store, "latest_scans", _slow([]))
+    monkeypatch.setattr(api_module.store, "latest_scan_for_handle", _slow(None))
+    monkeypatch.setattr(api_module.store, "save_scan", _slow(None))
+    monkeypatch.setattr(api_module.scan_service, "analyzer", QuickAnalyzer())
+
+    transport = httpx.ASGITransport(app=api_module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        requests = [http.get("/history") for _ in range(8)]
+        requests += [http.post("/scan", json={"handle": f"user-{index}"}) for index in range(8)]
+        started = time.monotonic()
+        load = asyncio.gather(*requests)
+        await asyncio.sleep(STORE_LATENCY / 5)
+        health_started = time.monotonic()
+        health = await http.get("/health")
+        health_seconds = time.monotonic() - health_started
+        responses = await load
+        elapsed = time.monotonic() - started
+
+    assert all(response.status_code == 200 for response in responses)
+    assert health.status_code == 200
+    # 24 storage calls: one after another they would take 1.2s.
+    serialized = 24 * STORE_LATENCY
+    assert elapsed < serialized / 2
+    assert health_seconds < STORE_LATENCY
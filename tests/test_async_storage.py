@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from reputation_pulse.async_storage import AsyncScanStore
+from reputation_pulse.storage import ScanStore
+
+
+def _sample_result(handle: str, score: float) -> dict[str, object]:
+    return {
+        "handle": handle,
+        "github": {"followers": 1, "stars": 1, "recent_repos": []},
+        "score": {"normalized": score},
+        "summary": {"rating": "Needs Attention", "recommendations": []},
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_store_reads_and_writes_through_the_wrapped_store(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    async_store = AsyncScanStore(store, max_workers=2)
+    try:
+        await async_store.save_scan(_sample_result("g-dos", 12.0))
+        await async_store.save_scan(_sample_result("g-dos", 18.0))
+
+        assert (await async_store.latest_scan_for_handle("g-dos"))["normalized_score"] == 18.0
+        assert await async_store.latest_result_for_handle("g-dos") == _sample_result("g-dos", 18.0)
+        assert (await async_store.handle_insights("g-dos"))["average_score"] == 15.0
+        assert len(await async_store.score_series("g-dos", limit=1)) == 1
+        assert [row["handle"] for row in await async_store.latest_scans(limit=5)] == [
+            "g-dos",
+            "g-dos",
+        ]
+    finally:
+        await async_store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_store_runs_on_a_bounded_pool_and_honours_patches(monkeypatch, tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    async_store = AsyncScanStore(store, max_workers=2)
+    threads: set[str] = set()
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_insights(handle: str) -> dict[str, object]:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+            threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return {"handle": handle}
+
+    monkeypatch.setattr(store, "handle_insights", slow_insights)
+    try:
+        results = await asyncio.gather(*(async_store.handle_insights(str(n)) for n in range(6)))
+    finally:
+        await async_store.aclose()
+
+    assert [result["handle"] for result in results] == [str(n) for n in range(6)]
+    assert peak == 2
+    assert all(name.startswith("scan-store") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_async_store_pool_stops_on_exit_and_reopens(tmp_path):
+    async_store = AsyncScanStore(ScanStore(db_path=str(tmp_path / "store.db")), max_workers=1)
+    async with async_store:
+        await async_store.save_scan(_sample_result("g-dos", 12.0))
+        executor = async_store.executor
+    assert executor._shutdown  # noqa: SLF001 - the old pool's threads were stopped
+
+    async with async_store:
+        assert (await async_store.latest_scan_for_handle("g-dos"))["normalized_score"] == 12.0
+        assert async_store.executor is not executor
+
+
+@pytest.mark.asyncio
+async def test_async_store_closes_the_retired_pools_connections(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    store.latest_scans()  # this thread's connection outlives the pool
+    async_store = AsyncScanStore(store, max_workers=2)
+
+    for _ in range(3):
+        async with async_store:
+            await asyncio.gather(*(async_store.latest_scans() for _ in range(4)))
+
+    assert len(store._connections) == 1  # noqa: SLF001 - only the test thread's is left
+    assert store.latest_scans() == []
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from reputation_pulse.batch import run_bounded, unique_handles
+from reputation_pulse.errors import UpstreamNotFoundError
+
+
+class TrackingScan:
+    def __init__(self, delay: float = 0.01, missing: frozenset[str] = frozenset()):
+        self.delay = delay
+        self.missing = missing
+        self.active = 0
+        self.peak = 0
+        self.started: list[str] = []
+
+    async def __call__(self, handle: str) -> dict[str, object]:
+        self.started.append(handle)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if handle in self.missing:
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        return {"handle": handle}
+
+
+def test_unique_handles_dedupes_by_normalized_handle():
+    assert list(unique_handles(["g-dos", "@g-dos", " g-dos ", "other", "  "])) == [
+        "g-dos",
+        "other",
+        "  ",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_limits_concurrency_and_reports_errors():
+    scan = TrackingScan(missing=frozenset({"ghost"}))
+    handles = [f"user-{index}" for index in range(10)] + ["ghost", "@user-1"]
+
+    records = [record async for record in run_bounded(handles, scan, concurrency=3)]
+
+    assert scan.peak == 3
+    assert len(records) == 11
+    failed = [record.to_dict() for record in records if not record.ok]
+    assert failed == [
+        {
+            "handle": "ghost",
+            "status": "error",
+            "error": {
+                "type": "UpstreamNotFoundError",
+                "message": "GitHub user 'ghost' was not found",
+            },
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_stops_starting_scans_for_a_slow_consumer():
+    scan = TrackingScan(delay=0)
+    handles = [f"user-{index}" for index in range(50)]
+
+    batch = run_bounded(handles, scan, concurrency=2)
+    first = await batch.__anext__()
+    await asyncio.sleep(0.05)
+    assert first.ok
+    assert len(scan.started) <= 6
+
+    await batch.aclose()
+    await asyncio.sleep(0)
+    assert len(scan.started) <= 6
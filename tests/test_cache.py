@@ -29,3 +29,28 @@ def test_cache_store_ignores_corrupt_json(tmp_path):
     path.write_text("{bad json", encoding="utf-8")
     payload = cache.get("github:g-dos", ttl_seconds=60)
     assert payload is None
+
+
+def test_cache_store_keeps_expired_entry_for_revalidation(tmp_path):
+    cache = CacheStore(base_dir=str(tmp_path))
+    path = tmp_path / "github_g-dos.json"
+    stale_payload = {
+        "stored_at": (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat(),
+        "data": {"value": 1},
+        "meta": {"validators": {"user": {"etag": '"abc"'}}},
+    }
+    path.write_text(json.dumps(stale_payload), encoding="utf-8")
+
+    entry = cache.get_entry("github:g-dos")
+    assert entry is not None
+    assert not entry.is_fresh(60)
+    assert entry.meta["validators"]["user"]["etag"] == '"abc"'
+
+    assert cache.touch("github:g-dos")
+    assert cache.get("github:g-dos", ttl_seconds=60) == {"value": 1}
+    assert cache.get_entry("github:g-dos").meta == stale_payload["meta"]
+
+
+def test_cache_store_touch_missing_entry(tmp_path):
+    cache = CacheStore(base_dir=str(tmp_path))
+    assert not cache.touch("github:missing")
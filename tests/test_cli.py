@@ -1,7 +1,10 @@
+import json
+
 from typer.testing import CliRunner
 
 import reputation_pulse.cli as cli_module
-from reputation_pulse.errors import InvalidHandleError
+from reputation_pulse.errors import InvalidHandleError, UpstreamNotFoundError
+from reputation_pulse.retention import CompactionReport
 
 runner = CliRunner()
 
@@ -29,6 +32,20 @@ def test_cli_report_invalid_handle():
     assert "Invalid handle" in result.stdout
 
 
+def test_cli_scheduler_rejects_invalid_handles(monkeypatch):
+    tracked: list[list[str]] = []
+
+    def track(_self, handles: list[str]) -> int:
+        tracked.append(handles)
+        return len(handles)
+
+    monkeypatch.setattr(cli_module.RescanScheduler, "track", track)
+    result = runner.invoke(cli_module.app, ["scheduler", "g-dos", "Bad Handle!"])
+    assert result.exit_code == 2
+    assert "Invalid handle" in result.stdout
+    assert tracked == []
+
+
 def test_cli_insights_requires_existing_scan(monkeypatch):
     monkeypatch.setattr(cli_module.store, "handle_insights", lambda _handle: None)
     result = runner.invoke(cli_module.app, ["insights", "missing"])
@@ -91,3 +108,64 @@ def test_cli_series_json(monkeypatch):
     result = runner.invoke(cli_module.app, ["series", "g-dos", "--json"])
     assert result.exit_code == 0
     assert '"handle": "g-dos"' in result.stdout
+
+
+def test_cli_scan_batch_streams_ndjson_and_skips_recent(monkeypatch, tmp_path):
+    async def fake_run(handle: str):
+        if handle == "ghost":
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        return {"handle": handle}
+
+    monkeypatch.setattr(cli_module.scan_service, "run_and_store", fake_run)
+    monkeypatch.setattr(
+        cli_module.scan_service,
+        "scanned_within",
+        lambda handle, _seconds: handle == "done",
+    )
+    handles = tmp_path / "handles.txt"
+    handles.write_text("g-dos\n@g-dos\n\nghost\ndone\n", encoding="utf-8")
+    output = tmp_path / "out.ndjson"
+
+    result = runner.invoke(
+        cli_module.app,
+        ["scan-batch", str(handles), "--output", str(output), "--skip-scanned-within", "3600"],
+    )
+
+    assert result.exit_code == 0
+    records = {
+        record["handle"]: record
+        for record in map(json.loads, output.read_text(encoding="utf-8").splitlines())
+    }
+    assert set(records) == {"g-dos", "ghost"}
+    assert records["g-dos"] == {"handle": "g-dos", "status": "ok", "result": {"handle": "g-dos"}}
+    assert records["ghost"]["error"]["type"] == "UpstreamNotFoundError"
+
+
+def test_cli_scan_batch_reads_stdin(monkeypatch):
+    async def fake_run(handle: str):
+        return {"handle": handle}
+
+    monkeypatch.setattr(cli_module.scan_service, "run_and_store", fake_run)
+    result = CliRunner(mix_stderr=False).invoke(cli_module.app, ["scan-batch"], input="a\nb\n")
+
+    assert result.exit_code == 0
+    handles = sorted(json.loads(line)["handle"] for line in result.stdout.splitlines())
+    assert handles == ["a", "b"]
+    assert "Scanned 2 handles" in result.stderr
+
+
+def test_cli_compact_reports_an_unfinished_run(monkeypatch):
+    calls = []
+
+    def fake_compact(_store, batch_size=None, max_batches=None):
+        calls.append((batch_size, max_batches))
+        return CompactionReport(
+            scans_rolled_up=3, days_rolled_up=1, payloads_removed=2, complete=False
+        )
+
+    monkeypatch.setattr(cli_module, "compact_history", fake_compact)
+    result = runner.invoke(cli_module.app, ["compact", "--batch-size", "50", "--max-batches", "4"])
+    assert result.exit_code == 0
+    assert calls == [(50, 4)]
+    assert "Rolled up 3 scans into days and 1 days into weeks" in result.stdout
+    assert "run again to continue" in result.stdout
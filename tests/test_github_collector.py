@@ -1,26 +1,46 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 import reputation_pulse.collectors.github as github_module
+from reputation_pulse.cache import CacheEntry
 from reputation_pulse.collectors.github import GitHubCollector
+from reputation_pulse.collectors.rate_limit import GitHubRateLimiter
 from reputation_pulse.errors import UpstreamNotFoundError, UpstreamRateLimitError
+from reputation_pulse.storage import ScanStore
 
 
 class FakeCache:
-    def __init__(self, cached=None):
+    def __init__(self, cached=None, meta=None, age_seconds: int = 0):
         self.cached = cached
+        self.meta = meta or {}
+        self.age_seconds = age_seconds
         self.saved = None
+        self.saved_meta = None
+        self.touched = False
 
-    def get(self, _key: str, _ttl: int):
-        return self.cached
+    def get_entry(self, _key: str):
+        if self.cached is None:
+            return None
+        stored_at = datetime.now(timezone.utc) - timedelta(seconds=self.age_seconds)
+        return CacheEntry(data=self.cached, stored_at=stored_at, meta=self.meta)
 
-    def set(self, _key: str, data):
+    def set(self, _key: str, data, meta=None):
         self.saved = data
+        self.saved_meta = meta
+
+    def touch(self, _key: str):
+        self.touched = True
+        return True
 
 
 class FakeResponse:
-    def __init__(self, status_code: int, payload: object):
+    def __init__(self, status_code: int, payload: object, headers=None):
         self.status_code = status_code
         self._payload = payload
+        self.headers = headers or {}
 
     def json(self):
         return self._payload
@@ -119,3 +139,261 @@ async def test_collect_uses_cache_hit(monkeypatch):
     )
     result = await GitHubCollector(cache=FakeCache(cached=cached)).collect("g-dos")
     assert result["stars"] == 12
+
+
+class PagedClient:
+    def __init__(self, user: dict[str, object], pages: dict[int, list[dict[str, object]]]):
+        self.user = user
+        self.pages = pages
+        self.requested_pages: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, _url: str, params=None, **_kwargs):
+        if params is None:
+            return FakeResponse(200, self.user)
+        page = params["page"]
+        self.requested_pages.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later pages answer first so the merge order is actually exercised.
+        await asyncio.sleep(0.01 * (len(self.pages) - page))
+        self.in_flight -= 1
+        return FakeResponse(200, self.pages.get(page, []))
+
+
+def _repos(prefix: str, count: int, stars: int = 1) -> list[dict[str, object]]:
+    return [
+        {"name": f"{prefix}-{idx}", "pushed_at": "2024-01-01T00:00:00Z", "stargazers_count": stars}
+        for idx in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_collect_fetches_expected_pages_concurrently(monkeypatch):
+    pages = {1: _repos("a", 100), 2: _repos("b", 100), 3: _repos("c", 50, stars=2)}
+    client = PagedClient({"followers": 1, "public_repos": 250}, pages)
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    result = await GitHubCollector(cache=FakeCache()).collect("g-dos")
+    assert sorted(client.requested_pages) == [1, 2, 3]
+    assert client.max_in_flight > 1
+    assert result["stars"] == 300
+
+
+@pytest.mark.asyncio
+async def test_collect_stops_merging_at_first_short_page(monkeypatch):
+    pages = {1: _repos("a", 100), 2: _repos("b", 10), 3: _repos("c", 100, stars=5)}
+    client = PagedClient({"followers": 1, "public_repos": 300}, pages)
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    result = await GitHubCollector(cache=FakeCache()).collect("g-dos")
+    assert result["stars"] == 110
+
+
+class RecordingClient(FakeClient):
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.sent_headers: list[dict[str, str]] = []
+
+    async def get(self, *_args, headers=None, **_kwargs):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_collect_stores_validators_next_to_data(monkeypatch):
+    responses = [
+        FakeResponse(200, {"followers": 3, "public_repos": 1}, headers={"ETag": '"user-v1"'}),
+        FakeResponse(
+            200,
+            [{"name": "a", "pushed_at": "2024-01-03T00:00:00Z", "stargazers_count": 7}],
+            headers={"ETag": '"repos-v1"', "Last-Modified": "Wed, 03 Jan 2024 00:00:00 GMT"},
+        ),
+    ]
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: FakeClient(responses))
+
+    cache = FakeCache()
+    await GitHubCollector(cache=cache).collect("g-dos")
+    assert cache.saved_meta["validators"]["user"] == {"etag": '"user-v1"'}
+    assert cache.saved_meta["validators"]["repos:1"]["last_modified"].startswith("Wed")
+    assert cache.saved_meta["repo_pages"]["1"][0]["stargazers_count"] == 7
+
+
+@pytest.mark.asyncio
+async def test_collect_revalidates_expired_entry_with_304(monkeypatch):
+    cached = {"handle": "g-dos", "followers": 3, "stars": 7, "recent_repos": []}
+    meta = {
+        "validators": {"user": {"etag": '"user-v1"'}, "repos:1": {"etag": '"repos-v1"'}},
+        "user": {"followers": 3, "public_repos": 1},
+        "repo_pages": {"1": [{"name": "a", "pushed_at": None, "stargazers_count": 7}]},
+    }
+    client = RecordingClient([FakeResponse(304, None), FakeResponse(304, None)])
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    cache = FakeCache(cached=cached, meta=meta, age_seconds=3600)
+    result = await GitHubCollector(cache=cache).collect("g-dos")
+    assert result is cached
+    assert cache.touched
+    assert cache.saved is None
+    assert client.sent_headers[0]["If-None-Match"] == '"user-v1"'
+    assert client.sent_headers[1]["If-None-Match"] == '"repos-v1"'
+
+
+@pytest.mark.asyncio
+async def test_collect_merges_changed_pages_with_not_modified_ones(monkeypatch):
+    cached = {"handle": "g-dos", "followers": 3, "stars": 7, "recent_repos": []}
+    meta = {
+        "validators": {"user": {"etag": '"user-v1"'}, "repos:1": {"etag": '"repos-v1"'}},
+        "user": {"followers": 3, "public_repos": 1},
+        "repo_pages": {"1": [{"name": "a", "pushed_at": None, "stargazers_count": 7}]},
+    }
+    responses = [
+        FakeResponse(304, None),
+        FakeResponse(200, [{"name": "a", "pushed_at": None, "stargazers_count": 9}]),
+    ]
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: FakeClient(responses))
+
+    cache = FakeCache(cached=cached, meta=meta, age_seconds=3600)
+    result = await GitHubCollector(cache=cache).collect("g-dos")
+    assert result["followers"] == 3
+    assert result["stars"] == 9
+    assert not cache.touched
+    assert cache.saved["stars"] == 9
+
+
+@pytest.mark.asyncio
+async def test_collect_retries_rate_limited_request_on_another_token(monkeypatch):
+    responses = [
+        FakeResponse(429, {}, headers={"Retry-After": "30"}),
+        FakeResponse(200, {"followers": 1, "public_repos": 0}),
+        FakeResponse(200, []),
+    ]
+    client = RecordingClient(responses)
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    limiter = GitHubRateLimiter(["token-a", "token-b"], reserve=0)
+    result = await GitHubCollector(cache=FakeCache(), rate_limiter=limiter).collect("g-dos")
+    assert result["followers"] == 1
+    first, second = (headers["Authorization"] for headers in client.sent_headers[:2])
+    assert first != second
+
+
+class PushedOrderClient(RecordingClient):
+    def __init__(self, user: dict[str, object], pushed_pages, full_pages=None):
+        super().__init__([])
+        self.user = user
+        self.pushed_pages = pushed_pages
+        self.full_pages = full_pages or {}
+        self.sent_params: list[dict[str, object]] = []
+
+    async def get(self, *_args, params=None, headers=None, **_kwargs):
+        self.sent_headers.append(headers or {})
+        if params is None:
+            return FakeResponse(200, self.user)
+        self.sent_params.append(params)
+        pages = self.pushed_pages if params.get("sort") == "pushed" else self.full_pages
+        page = pages.get(params["page"], [])
+        if isinstance(page, FakeResponse):
+            return page
+        return FakeResponse(200, page, headers={"ETag": f'"p{params["page"]}"'})
+
+
+def _ledger_store(tmp_path, repos):
+    store = ScanStore(db_path=str(tmp_path / "ledger.db"))
+    store.replace_repo_ledger("g-dos", repos)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_collect_refreshes_incrementally_from_ledger(monkeypatch, tmp_path):
+    store = _ledger_store(
+        tmp_path,
+        {
+            "old": {"stars": 10, "pushed_at": "2023-01-01T00:00:00Z"},
+            "mid": {"stars": 4, "pushed_at": "2023-06-01T00:00:00Z"},
+        },
+    )
+    pushed = {
+        1: [
+            {"name": "new", "pushed_at": "2024-02-01T00:00:00Z", "stargazers_count": 1},
+            {"name": "mid", "pushed_at": "2023-06-01T00:00:00Z", "stargazers_count": 6},
+        ]
+        + _repos("tail", 98),
+    }
+    client = PushedOrderClient({"followers": 1, "public_repos": 101}, pushed)
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    result = await GitHubCollector(cache=FakeCache(), ledger=store).collect("g-dos")
+    assert [params["page"] for params in client.sent_params] == [1]
+    assert client.sent_params[0]["sort"] == "pushed"
+    assert result["stars"] == 10 + 6 + 1 + 98
+    assert result["recent_repos"][0]["name"] == "new"
+    assert store.repo_ledger("g-dos")["repos"]["mid"]["stars"] == 6
+
+
+@pytest.mark.asyncio
+async def test_collect_falls_back_to_full_listing_when_ledger_drifts(monkeypatch, tmp_path):
+    store = _ledger_store(
+        tmp_path,
+        {
+            "deleted": {"stars": 50, "pushed_at": "2022-01-01T00:00:00Z"},
+            "kept": {"stars": 2, "pushed_at": "2023-01-01T00:00:00Z"},
+        },
+    )
+    kept = {"name": "kept", "pushed_at": "2023-01-01T00:00:00Z", "stargazers_count": 2}
+    client = PushedOrderClient(
+        {"followers": 1, "public_repos": 1},
+        pushed_pages={1: [kept]},
+        full_pages={1: [kept]},
+    )
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    result = await GitHubCollector(cache=FakeCache(), ledger=store).collect("g-dos")
+    assert result["stars"] == 2
+    assert set(store.repo_ledger("g-dos")["repos"]) == {"kept"}
+
+
+@pytest.mark.asyncio
+async def test_collect_keeps_incremental_refresh_past_the_listing_cap(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        github_module,
+        "settings",
+        replace(github_module.settings, github_max_repo_pages=2, github_repos_per_page=2),
+    )
+    # The full listing stopped at the cap: 4 of the user's 9 repos.
+    store = _ledger_store(
+        tmp_path,
+        {repo["name"]: {"stars": 1, "pushed_at": repo["pushed_at"]} for repo in _repos("a", 4)},
+    )
+    pushed = {
+        1: [
+            {"name": "new", "pushed_at": "2024-02-01T00:00:00Z", "stargazers_count": 3},
+            {"name": "a-0", "pushed_at": "2024-01-01T00:00:00Z", "stargazers_count": 1},
+        ],
+    }
+    client = PushedOrderClient({"followers": 1, "public_repos": 9}, pushed)
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    result = await GitHubCollector(cache=FakeCache(), ledger=store).collect("g-dos")
+    assert [params.get("sort") for params in client.sent_params] == ["pushed"]
+    assert result["stars"] == 4 + 3
+    assert "new" in store.repo_ledger("g-dos")["repos"]
+
+
+@pytest.mark.asyncio
+async def test_collect_stops_on_not_modified_pushed_page(monkeypatch, tmp_path):
+    store = _ledger_store(tmp_path, {"a": {"stars": 3, "pushed_at": "2024-01-01T00:00:00Z"}})
+    cached = {"handle": "g-dos", "followers": 1, "stars": 3, "recent_repos": []}
+    meta = {
+        "validators": {"user": {"etag": '"u"'}, "pushed:1": {"etag": '"p1"'}},
+        "user": {"followers": 1, "public_repos": 1},
+    }
+    client = RecordingClient([FakeResponse(304, None), FakeResponse(304, None)])
+    monkeypatch.setattr(github_module.httpx, "AsyncClient", lambda **_kwargs: client)
+
+    cache = FakeCache(cached=cached, meta=meta, age_seconds=3600)
+    result = await GitHubCollector(cache=cache, ledger=store).collect("g-dos")
+    assert result is cached
+    assert cache.touched
+    assert client.sent_headers[1]["If-None-Match"] == '"p1"'
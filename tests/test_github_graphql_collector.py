@@ -0,0 +1,142 @@
+import json
+from dataclasses import replace
+
+import httpx
+import pytest
+
+import reputation_pulse.collectors.github_graphql as graphql_module
+from reputation_pulse.collectors.github_graphql import GitHubGraphQLCollector
+from reputation_pulse.errors import CollectorError, UpstreamNotFoundError, UpstreamRateLimitError
+from reputation_pulse.http_client import SharedHttpClient
+from reputation_pulse.runtime import build_github_collector
+
+
+class FakeCache:
+    def __init__(self):
+        self.saved = None
+
+    def get(self, _key: str, _ttl: int):
+        return None
+
+    def set(self, _key: str, data):
+        self.saved = data
+
+
+class StubGraphQLServer:
+    """Minimal stand-in for https://api.github.com/graphql."""
+
+    def __init__(self, pages: list[list[int]], errors=None, status_code: int = 200):
+        self.pages = pages
+        self.errors = errors
+        self.status_code = status_code
+        self.requests: list[dict[str, object]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append(body)
+        assert request.headers["Authorization"] == "Bearer test-token"
+        if self.errors:
+            payload = {"data": {"user": None}, "errors": self.errors}
+            return httpx.Response(self.status_code, json=payload)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={})
+
+        cursor = body["variables"].get("cursor")
+        index = 0 if cursor is None else int(cursor)
+        repositories = {
+            "totalCount": sum(len(page) for page in self.pages),
+            "pageInfo": {
+                "hasNextPage": index + 1 < len(self.pages),
+                "endCursor": str(index + 1),
+            },
+            "nodes": [{"stargazerCount": stars} for stars in self.pages[index]],
+        }
+        if cursor is not None:
+            return httpx.Response(200, json={"data": {"user": {"repositories": repositories}}})
+        user = {
+            "createdAt": "2020-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+            "websiteUrl": "https://example.com",
+            "followers": {"totalCount": 42},
+            "following": {"totalCount": 7},
+            "recent": {
+                "nodes": [
+                    {"name": "newest", "pushedAt": "2024-01-03T00:00:00Z", "stargazerCount": 5},
+                    {"name": "older", "pushedAt": "2024-01-02T00:00:00Z", "stargazerCount": 1},
+                ]
+            },
+            "repositories": repositories,
+        }
+        return httpx.Response(200, json={"data": {"user": user}})
+
+
+@pytest.fixture(autouse=True)
+def _token(monkeypatch):
+    monkeypatch.setattr(
+        graphql_module,
+        "settings",
+        replace(graphql_module.settings, github_tokens=("test-token",)),
+    )
+
+
+def _collector(server: StubGraphQLServer) -> GitHubGraphQLCollector:
+    http = SharedHttpClient(transport=httpx.MockTransport(server))
+    return GitHubGraphQLCollector(cache=FakeCache(), http=http)
+
+
+@pytest.mark.asyncio
+async def test_graphql_collect_single_round_trip():
+    server = StubGraphQLServer(pages=[[5, 1, 3]])
+    result = await _collector(server).collect("g-dos")
+
+    assert len(server.requests) == 1
+    assert result["followers"] == 42
+    assert result["following"] == 7
+    assert result["public_repos"] == 3
+    assert result["blog_url"] == "https://example.com"
+    assert result["stars"] == 9
+    assert [repo["name"] for repo in result["recent_repos"]] == ["newest", "older"]
+
+
+@pytest.mark.asyncio
+async def test_graphql_collect_paginates_stars_only_when_needed():
+    server = StubGraphQLServer(pages=[[10] * 3, [1] * 2, [4]])
+    result = await _collector(server).collect("g-dos")
+
+    assert len(server.requests) == 3
+    assert [request["variables"].get("cursor") for request in server.requests] == [None, "1", "2"]
+    assert result["stars"] == 36
+    assert result["public_repos"] == 6
+
+
+@pytest.mark.asyncio
+async def test_graphql_collect_maps_not_found():
+    server = StubGraphQLServer(pages=[[]], errors=[{"type": "NOT_FOUND", "message": "nope"}])
+    with pytest.raises(UpstreamNotFoundError):
+        await _collector(server).collect("missing")
+
+
+@pytest.mark.asyncio
+async def test_graphql_collect_maps_rate_limit():
+    server = StubGraphQLServer(pages=[[]], status_code=403)
+    with pytest.raises(UpstreamRateLimitError):
+        await _collector(server).collect("g-dos")
+
+
+@pytest.mark.asyncio
+async def test_graphql_collect_requires_token(monkeypatch):
+    monkeypatch.setattr(
+        graphql_module,
+        "settings",
+        replace(graphql_module.settings, github_tokens=()),
+    )
+    with pytest.raises(CollectorError):
+        await _collector(StubGraphQLServer(pages=[[]])).collect("g-dos")
+
+
+def test_build_github_collector_selects_backend():
+    http = SharedHttpClient()
+    assert isinstance(build_github_collector(http, backend="graphql"), GitHubGraphQLCollector)
+    assert not isinstance(build_github_collector(http, backend="rest"), GitHubGraphQLCollector)
+    with pytest.raises(ValueError):
+        build_github_collector(http, backend="soap")
@@ -11,3 +11,9 @@ def test_normalize_handle_removes_at_prefix():
 def test_normalize_handle_rejects_blank():
     with pytest.raises(InvalidHandleError):
         normalize_handle("   ")
+
+
+@pytest.mark.parametrize("raw", ["Bad Handle!", "-leading", "a/b", "x" * 40])
+def test_normalize_handle_rejects_malformed_handles(raw):
+    with pytest.raises(InvalidHandleError):
+        normalize_handle(raw)
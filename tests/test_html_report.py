@@ -47,3 +47,17 @@ def test_render_html_report_with_series_has_svg():
     html = render_html_report(result, score_series=series)
     assert "<svg" in html
     assert "Score History" in html
+
+
+def test_render_html_report_flags_degraded_signals():
+    result = {
+        "handle": "g-dos",
+        "github": {"followers": 1, "stars": 1},
+        "score": {"normalized": 10.0},
+        "summary": {"rating": "ok", "recommendations": []},
+        "degraded": {"web": "stale"},
+    }
+    html = render_html_report(result)
+    assert "Partial result" in html
+    assert "Blog/RSS: did not answer in time; showing the last stored value" in html
+    assert "Partial result" not in render_html_report({**result, "degraded": {}})
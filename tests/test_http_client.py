@@ -0,0 +1,45 @@
+import httpx
+import pytest
+
+from reputation_pulse.http_client import (
+    SharedHttpClient,
+    conditional_headers,
+    response_validators,
+)
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_until_closed():
+    http = SharedHttpClient(transport=httpx.MockTransport(lambda _request: httpx.Response(200)))
+    first = await http.open()
+    assert http.client is first
+
+    await http.aclose()
+    assert first.is_closed
+    assert http.client is not first
+    await http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_context_manager_closes_pool():
+    http = SharedHttpClient(transport=httpx.MockTransport(lambda _request: httpx.Response(204)))
+    async with http as shared:
+        client = shared.client
+        response = await client.get("https://example.com")
+        assert response.status_code == 204
+    assert client.is_closed
+
+
+def test_validators_round_trip_into_conditional_headers():
+    response = httpx.Response(200, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2026"})
+    validators = response_validators(response)
+    assert validators == {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2026"}
+
+    base = {"Accept": "application/json"}
+    assert conditional_headers(base, validators) == {
+        "Accept": "application/json",
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2026",
+    }
+    assert conditional_headers(base, None) is base
+    assert response_validators(httpx.Response(200)) == {}
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+import reputation_pulse.jobs as jobs_module
+from reputation_pulse.errors import UpstreamNotFoundError
+from reputation_pulse.jobs import JobManager
+from reputation_pulse.storage import ScanStore
+
+
+class FakeScanService:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def run_and_store(self, handle: str) -> dict[str, object]:
+        self.calls.append(handle)
+        await asyncio.sleep(0)
+        if handle == "ghost":
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        return {"handle": handle}
+
+
+async def _wait_until_done(manager: JobManager, job_id: str) -> dict[str, object]:
+    for _ in range(200):
+        job = manager.store.job(job_id)
+        if job["status"] == "done":
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+@pytest.mark.asyncio
+async def test_job_manager_runs_jobs_and_streams_results(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    manager = JobManager(FakeScanService(), store, workers=2)
+    await manager.start()
+    try:
+        job = await manager.submit(["a", "ghost", "@a", "b"])
+        assert job["total"] == 3
+        followed = [record async for record in manager.results(job["job_id"], follow=True)]
+        done = await _wait_until_done(manager, job["job_id"])
+    finally:
+        await manager.stop()
+
+    assert done["completed"] == 3
+    assert done["errors"] == 1
+    assert sorted(record["handle"] for record in followed) == ["a", "b", "ghost"]
+
+
+@pytest.mark.asyncio
+async def test_job_manager_resumes_unfinished_jobs(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    store.create_job("job-1", ["a", "b", "c"])
+    store.save_job_result("job-1", {"handle": "a", "status": "ok", "result": {}})
+
+    scans = FakeScanService()
+    manager = JobManager(scans, store, workers=1)
+    await manager.start()
+    try:
+        await _wait_until_done(manager, "job-1")
+    finally:
+        await manager.stop()
+
+    assert scans.calls == ["b", "c"]
+    assert store.unfinished_jobs() == []
+
+
+def test_job_manager_builds_its_queue_on_the_loop_that_starts_it(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    scans = FakeScanService()
+    # Built outside any running loop, as the API module does at import time.
+    manager = JobManager(scans, store, workers=1)
+
+    async def run_job(handles: list[str], start_first: bool) -> None:
+        if start_first:
+            await manager.start()
+        job = await manager.submit(handles)
+        if not start_first:
+            await manager.start()
+        try:
+            await _wait_until_done(manager, job["job_id"])
+        finally:
+            await manager.stop()
+
+    asyncio.run(run_job(["a"], start_first=False))
+    asyncio.run(run_job(["b"], start_first=True))
+
+    assert scans.calls == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_job_manager_retries_a_result_the_store_rejected(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(
+        jobs_module,
+        "settings",
+        replace(jobs_module.settings, job_save_retry_seconds=0),
+    )
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    save_job_result = store.save_job_result
+    failures = [sqlite3.OperationalError("database is locked")]
+
+    def flaky_save(job_id: str, record: dict[str, object]) -> None:
+        if failures:
+            raise failures.pop()
+        save_job_result(job_id, record)
+
+    monkeypatch.setattr(store, "save_job_result", flaky_save)
+    scans = FakeScanService()
+    manager = JobManager(scans, store, workers=1)
+    await manager.start()
+    try:
+        with caplog.at_level(logging.ERROR, logger="reputation_pulse.jobs"):
+            job = await manager.submit(["a", "b"])
+            done = await _wait_until_done(manager, job["job_id"])
+    finally:
+        await manager.stop()
+
+    assert done["completed"] == 2
+    assert scans.calls == ["a", "b"]
+    assert "database is locked" in caplog.text
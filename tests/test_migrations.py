@@ -0,0 +1,84 @@
+import sqlite3
+
+from reputation_pulse.migrations import LATEST_VERSION, migrate, schema_version
+from reputation_pulse.storage import ScanStore
+
+
+def _plan(store: ScanStore, sql: str, params: tuple[object, ...]) -> str:
+    with store._connect() as conn:  # noqa: SLF001 - intentional white-box test
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " | ".join(str(row[-1]) for row in rows)
+
+
+def test_migrate_upgrades_unversioned_database_in_place(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        """
+        CREATE TABLE scans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            handle TEXT NOT NULL,
+            normalized_score REAL NOT NULL,
+            rating TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            scanned_at TEXT NOT NULL
+        )
+        """
+    )
+    legacy.execute(
+        "INSERT INTO scans (handle, normalized_score, rating, payload, scanned_at) "
+        "VALUES ('g-dos', 12.0, 'Stable', '{\"handle\": \"g-dos\"}', '2026-01-01T00:00:00+00:00')"
+    )
+    legacy.commit()
+    legacy.close()
+
+    store = ScanStore(db_path=db_path)
+    with store._connect() as conn:  # noqa: SLF001 - intentional white-box test
+        assert schema_version(conn) == LATEST_VERSION
+        assert migrate(conn) == LATEST_VERSION
+    assert store.latest_scan_for_handle("g-dos")["normalized_score"] == 12.0
+    assert store.handle_insights("g-dos")["scans_count"] == 1
+    assert store.latest_result_for_handle("g-dos") == {"handle": "g-dos"}
+    with store._connect() as conn:  # noqa: SLF001 - intentional white-box test
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(scans)")]
+    assert "payload" not in columns
+
+
+def test_history_queries_use_indexes(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+
+    latest = _plan(
+        store,
+        "SELECT handle, normalized_score, rating, scanned_at FROM scans "
+        "WHERE handle = ? ORDER BY id DESC LIMIT 1",
+        ("g-dos",),
+    )
+    assert "USING COVERING INDEX idx_scans_handle_id" in latest
+    assert "TEMP B-TREE" not in latest
+
+    series = _plan(
+        store,
+        "SELECT normalized_score, scanned_at FROM scans WHERE handle = ? ORDER BY id DESC LIMIT ?",
+        ("g-dos", 30),
+    )
+    assert "USING COVERING INDEX idx_scans_handle_id" in series
+
+    payload = _plan(
+        store,
+        "SELECT scan_payloads.blob_id FROM "
+        "(SELECT id FROM scans WHERE handle = ? ORDER BY id DESC LIMIT 1) AS latest "
+        "LEFT JOIN scan_payloads ON scan_payloads.scan_id = latest.id",
+        ("g-dos",),
+    )
+    assert "USING COVERING INDEX idx_scans_handle_id" in payload
+    assert "SEARCH scan_payloads USING INTEGER PRIMARY KEY" in payload
+
+    insights = _plan(store, "SELECT * FROM handle_stats WHERE handle = ?", ("g-dos",))
+    assert "USING INDEX sqlite_autoindex_handle_stats_1 (handle=?)" in insights
+
+    window = _plan(
+        store,
+        "SELECT COUNT(*) FROM scans WHERE scanned_at >= ?",
+        ("2026-01-01",),
+    )
+    assert "idx_scans_scanned_at" in window
@@ -0,0 +1,35 @@
+import json
+from dataclasses import replace
+
+import reputation_pulse.payloads as payloads_module
+from reputation_pulse.payloads import decode_payload, encode_payload
+
+RESULT = {
+    "handle": "g-dos",
+    "github": {"followers": 10, "stars": 5, "recent_repos": [{"name": "pulse"}]},
+    "summary": {"rating": "Needs Attention", "recommendations": []},
+}
+
+
+def test_payload_round_trips_with_and_without_dictionary(monkeypatch):
+    codec, data = encode_payload(RESULT)
+    assert codec == "zlib-d1"
+    assert decode_payload(codec, data) == RESULT
+    assert len(data) < len(json.dumps(RESULT))
+
+    monkeypatch.setattr(
+        payloads_module,
+        "settings",
+        replace(payloads_module.settings, payload_shared_dictionary=False),
+    )
+    plain_codec, plain = encode_payload(RESULT)
+    assert plain_codec == "zlib"
+    assert decode_payload(plain_codec, plain) == RESULT
+    assert len(data) < len(plain)
+
+
+def test_decode_payload_rejects_unknown_or_corrupt_data():
+    codec, data = encode_payload(RESULT)
+    assert decode_payload("brotli", data) is None
+    assert decode_payload(codec, data[:-4] + b"junk") is None
+    assert decode_payload("zlib", data) is None
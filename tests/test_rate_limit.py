@@ -0,0 +1,96 @@
+import httpx
+import pytest
+
+from reputation_pulse.collectors.rate_limit import GitHubRateLimiter
+from reputation_pulse.errors import UpstreamRateLimitError
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status_code: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers)
+
+
+def _limiter(tokens, clock: FakeClock, reserve: int = 0, max_wait: float = 600.0):
+    return GitHubRateLimiter(
+        tokens,
+        reserve=reserve,
+        max_wait_seconds=max_wait,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+@pytest.mark.asyncio
+async def test_limiter_rotates_to_credential_with_most_budget():
+    clock = FakeClock()
+    limiter = _limiter(["a", "b"], clock)
+    first = await limiter.acquire()
+    limiter.observe(
+        first,
+        _response(**{"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "2000"}),
+    )
+    second = await limiter.acquire()
+    assert {first.token, second.token} == {"a", "b"}
+    assert second.auth_headers() == {"Authorization": f"Bearer {second.token}"}
+
+
+@pytest.mark.asyncio
+async def test_limiter_waits_for_reset_before_budget_runs_out():
+    clock = FakeClock()
+    limiter = _limiter(["a"], clock, reserve=1)
+    budget = await limiter.acquire()
+    limiter.observe(
+        budget,
+        _response(
+            **{"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "1030"}
+        ),
+    )
+
+    again = await limiter.acquire()
+    assert clock.sleeps == [30.0]
+    assert again.remaining == 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_raises_when_wait_exceeds_budget():
+    clock = FakeClock()
+    limiter = _limiter(["a"], clock, max_wait=10.0)
+    budget = await limiter.acquire()
+    limiter.observe(
+        budget,
+        _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"}),
+    )
+
+    with pytest.raises(UpstreamRateLimitError):
+        await limiter.acquire()
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_limiter_honours_retry_after_on_secondary_limit():
+    clock = FakeClock()
+    limiter = _limiter(["a", "b"], clock)
+    blocked = await limiter.acquire()
+    assert limiter.observe(blocked, _response(403, **{"Retry-After": "20"}))
+
+    other = await limiter.acquire()
+    assert other.token != blocked.token
+    assert not limiter.observe(other, _response(403))
+
+
+def test_limiter_without_tokens_is_anonymous():
+    limiter = GitHubRateLimiter(())
+    assert not limiter.authenticated
+    assert limiter.budgets[0].auth_headers() == {}
@@ -38,3 +38,16 @@ def test_build_summary_adds_web_recommendation():
         web_data={"blog_url": "https://example.com", "recent_entries_30d": 0},
     )
     assert any("blog" in item.lower() for item in summary["recommendations"])
+
+
+def test_build_summary_skips_blog_advice_when_feed_missing():
+    github_data = {"followers": 100, "stars": 200, "public_repos": 5, "recent_repos": [{}]}
+    score = ReputationScore(followers=100, stars=200, recent_repos=1, normalized=50.0)
+    summary = build_summary(
+        github_data,
+        score,
+        web_data={"blog_url": "https://example.com", "recent_entries_30d": 0},
+        degraded={"web": "missing"},
+    )
+    assert summary["degraded"] == {"web": "missing"}
+    assert not any("blog" in item.lower() for item in summary["recommendations"])
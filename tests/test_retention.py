@@ -0,0 +1,149 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import reputation_pulse.storage as storage_module
+from reputation_pulse.retention import compact, retention_cutoffs
+from reputation_pulse.storage import ScanStore
+
+NOW = datetime(2026, 6, 17, 12, 0, tzinfo=timezone.utc)
+
+HISTORY = [
+    ("2025-01-07T10:00:00+00:00", 10.0),
+    ("2025-01-09T10:00:00+00:00", 20.0),
+    ("2026-03-02T08:00:00+00:00", 30.0),
+    ("2026-03-02T20:00:00+00:00", 40.0),
+    ("2026-06-10T09:00:00+00:00", 50.0),
+    ("2026-06-16T09:00:00+00:00", 60.0),
+]
+
+
+def _sample_result(handle: str, score: float) -> dict[str, object]:
+    return {
+        "handle": handle,
+        "github": {"followers": 1, "stars": 1, "recent_repos": []},
+        "score": {"normalized": score},
+        "summary": {"rating": f"Rated {score:g}", "recommendations": []},
+        "trend": {"direction": "new", "delta": 0.0},
+    }
+
+
+def _save_at(store: ScanStore, handle: str, score: float, scanned_at: str) -> None:
+    store.save_scan(_sample_result(handle, score))
+    with store._connect() as conn:  # noqa: SLF001 - backdate the scan just written
+        conn.execute(
+            "UPDATE scans SET scanned_at = ? WHERE id = (SELECT MAX(id) FROM scans)",
+            (scanned_at,),
+        )
+        conn.commit()
+
+
+def _store_with_history(tmp_path, handle: str = "g-dos") -> ScanStore:
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    for scanned_at, score in HISTORY:
+        _save_at(store, handle, score, scanned_at)
+    store.rebuild_handle_stats()
+    return store
+
+
+def _count(store: ScanStore, table: str) -> int:
+    with store._connect() as conn:  # noqa: SLF001 - intentional white-box test
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _no_pause(_seconds: float) -> None:
+    return None
+
+
+def test_retention_cutoffs_fall_on_bucket_boundaries():
+    raw_before, daily_before = retention_cutoffs(NOW)
+    assert raw_before == "2026-05-18T00:00:00+00:00"
+    # 365 days back is Tuesday 2025-06-17; its week began on the Monday.
+    assert daily_before == "2025-06-16"
+
+
+def test_compact_downsamples_old_scans_into_days_and_weeks(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        storage_module,
+        "settings",
+        replace(storage_module.settings, payload_max_delta_depth=0),
+    )
+    store = _store_with_history(tmp_path)
+    insights = store.handle_insights("g-dos")
+
+    report = compact(store, now=NOW, sleep=_no_pause)
+
+    assert (report.scans_rolled_up, report.days_rolled_up) == (4, 2)
+    assert report.payloads_removed == 4
+    assert report.complete
+    assert store.score_series("g-dos") == [
+        {"normalized_score": 15.0, "scanned_at": "2025-01-09T10:00:00+00:00", "bucket": "week"},
+        {"normalized_score": 35.0, "scanned_at": "2026-03-02T20:00:00+00:00", "bucket": "day"},
+        {"normalized_score": 50.0, "scanned_at": "2026-06-10T09:00:00+00:00"},
+        {"normalized_score": 60.0, "scanned_at": "2026-06-16T09:00:00+00:00"},
+    ]
+    assert store.score_series("g-dos", limit=2)[0]["normalized_score"] == 50.0
+    assert store.handle_insights("g-dos") == insights
+    store.rebuild_handle_stats()
+    assert store.handle_insights("g-dos") == insights
+    assert insights["scans_count"] == 6
+    assert insights["first_scan_at"] == "2025-01-07T10:00:00+00:00"
+
+    again = compact(store, now=NOW, sleep=_no_pause)
+    assert (again.scans_rolled_up, again.days_rolled_up, again.payloads_removed) == (0, 0, 0)
+
+
+def test_compact_keeps_each_handles_newest_scan_and_its_delta_chain(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    for scanned_at, score in HISTORY[:4]:
+        _save_at(store, "g-dos", score, scanned_at)
+    _save_at(store, "other", 70.0, "2025-02-01T00:00:00+00:00")
+
+    compact(store, now=NOW, sleep=_no_pause)
+
+    assert store.latest_scan_for_handle("g-dos")["normalized_score"] == 40.0
+    assert store.latest_result_for_handle("g-dos") == _sample_result("g-dos", 40.0)
+    assert store.latest_result_for_handle("other") == _sample_result("other", 70.0)
+    assert _count(store, "scans") == 2
+    assert store.score_series("other") == [
+        {"normalized_score": 70.0, "scanned_at": "2025-02-01T00:00:00+00:00"}
+    ]
+
+
+def test_compact_resumes_after_max_batches(tmp_path):
+    store = _store_with_history(tmp_path)
+    pauses: list[float] = []
+
+    partial = compact(store, now=NOW, batch_size=1, max_batches=2, sleep=pauses.append)
+    assert partial.scans_rolled_up == 2
+    assert not partial.complete
+    assert len(pauses) == 2
+
+    rest = compact(store, now=NOW, batch_size=1, sleep=_no_pause)
+    assert rest.complete
+    assert partial.scans_rolled_up + rest.scans_rolled_up == 4
+    assert [point.get("bucket") for point in store.score_series("g-dos")] == [
+        "week",
+        "day",
+        None,
+        None,
+    ]
+
+
+def test_compact_releases_the_write_lock_between_batches(monkeypatch, tmp_path):
+    store = _store_with_history(tmp_path)
+    monkeypatch.setattr(
+        storage_module,
+        "settings",
+        replace(storage_module.settings, sqlite_busy_timeout_ms=1),
+    )
+    writer = ScanStore(db_path=store.db_path)
+    saved: list[float] = []
+
+    def save_between_batches(_seconds: float) -> None:
+        # Raises "database is locked" if a compaction transaction were still open.
+        writer.save_scan(_sample_result("writer", 1.0))
+        saved.append(_seconds)
+
+    compact(store, now=NOW, batch_size=1, sleep=save_between_batches)
+    assert len(saved) >= 4
+    assert store.handle_insights("writer")["scans_count"] == len(saved)
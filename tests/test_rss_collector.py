@@ -1,59 +1,429 @@
+import asyncio
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 
+import httpx
 import pytest
 
 import reputation_pulse.collectors.rss as rss_module
-from reputation_pulse.collectors.rss import RssCollector
+from reputation_pulse.cache import CacheStore
+from reputation_pulse.collectors.rss import RssCollector, discover_feed_links
+from reputation_pulse.http_client import SharedHttpClient
 
 
-class FakeResponse:
-    def __init__(self, status_code: int, text: str):
-        self.status_code = status_code
-        self.text = text
+class StubSite:
+    """Answers per URL after a configurable delay and records cancellations."""
 
+    def __init__(self, routes: dict[str, tuple[float, httpx.Response]]):
+        self.routes = routes
+        self.requested: list[str] = []
+        self.cancelled: list[str] = []
 
-class FakeClient:
-    def __init__(self, responses):
-        self.responses = responses
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url).rstrip("/")
+        self.requested.append(url)
+        delay, response = self.routes.get(url, (0.0, httpx.Response(404, text="missing")))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        return response
 
-    async def __aenter__(self):
-        return self
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return None
+def _ok(body: str) -> tuple[float, httpx.Response]:
+    return 0.0, httpx.Response(200, text=body)
 
-    async def get(self, *_args, **_kwargs):
-        return self.responses.pop(0)
+
+def _rfc822(days_ago: int) -> str:
+    moment = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return moment.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+
+def _feed_xml(days_ago: int = 0) -> str:
+    return f"<rss><channel><item><pubDate>{_rfc822(days_ago)}</pubDate></item></channel></rss>"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CacheStore(base_dir=str(tmp_path))
+
+
+def _collector(site: StubSite, cache: CacheStore) -> RssCollector:
+    return RssCollector(http=SharedHttpClient(transport=httpx.MockTransport(site)), cache=cache)
 
 
 @pytest.mark.asyncio
-async def test_rss_collector_parses_recent_entries(monkeypatch):
-    now = datetime.now(timezone.utc)
-    recent = now.strftime("%a, %d %b %Y %H:%M:%S GMT")
-    old = (now - timedelta(days=120)).strftime("%a, %d %b %Y %H:%M:%S GMT")
+async def test_rss_collector_parses_recent_entries(cache):
     xml = (
         "<rss><channel>"
-        f"<item><pubDate>{recent}</pubDate></item>"
-        f"<item><pubDate>{old}</pubDate></item>"
+        f"<item><pubDate>{_rfc822(0)}</pubDate></item>"
+        f"<item><pubDate>{_rfc822(120)}</pubDate></item>"
         "</channel></rss>"
     )
+    site = StubSite({"https://example.com/feed": _ok(xml)})
+    result = await _collector(site, cache).collect("https://example.com/feed")
+    assert result["recent_entries_30d"] == 1
+    assert result["feed_url"] == "https://example.com/feed"
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_handles_missing_feed(cache):
+    result = await _collector(StubSite({}), cache).collect("https://example.com")
+    assert result["recent_entries_30d"] == 0
+    assert result["feed_url"] == ""
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_prefers_candidates_in_priority_order(cache):
+    site = StubSite(
+        {
+            "https://example.com/feed": (0.05, httpx.Response(200, text=_feed_xml(1))),
+            "https://example.com/atom.xml": _ok(_feed_xml(2)),
+        }
+    )
+    result = await _collector(site, cache).collect("https://example.com")
+    assert result["feed_url"] == "https://example.com/feed"
+    assert result["blog_url"] == "https://example.com"
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_deadline_cancels_slow_candidates(monkeypatch, cache):
     monkeypatch.setattr(
-        rss_module.httpx,
-        "AsyncClient",
-        lambda **_kwargs: FakeClient([FakeResponse(200, xml)]),
+        rss_module,
+        "settings",
+        replace(rss_module.settings, rss_scan_deadline_seconds=0.05),
     )
-    result = await RssCollector().collect("https://example.com/feed")
+    site = StubSite(
+        {
+            "https://example.com/feed": (5.0, httpx.Response(200, text=_feed_xml())),
+            "https://example.com/rss.xml": _ok(_feed_xml(3)),
+        }
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await _collector(site, cache).collect("https://example.com")
+    await asyncio.sleep(0)
+
+    assert loop.time() - started < 1.0
+    assert result["feed_url"] == "https://example.com/rss.xml"
+    assert site.cancelled == ["https://example.com/feed"]
+
+
+def test_discover_feed_links_reads_alternate_link_tags():
+    html = """
+    <html><head>
+      <link rel="stylesheet" href="/style.css">
+      <link rel="alternate" type="application/atom+xml" href="/posts.atom">
+      <link rel="Alternate" type="application/rss+xml; charset=utf-8" href="https://cdn.example.com/rss">
+      <link rel="alternate" type="text/html" href="/fr/">
+    </head></html>
+    """
+    assert discover_feed_links(html, "https://example.com/blog/") == [
+        "https://example.com/posts.atom",
+        "https://cdn.example.com/rss",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_follows_link_tag_and_remembers_location(monkeypatch, cache):
+    monkeypatch.setattr(
+        rss_module,
+        "settings",
+        replace(rss_module.settings, rss_cache_ttl_seconds=0),
+    )
+    homepage = '<html><head><link rel="alternate" type="application/rss+xml" href="/p.xml">'
+    site = StubSite(
+        {
+            "https://example.com": _ok(homepage),
+            "https://example.com/p.xml": _ok(_feed_xml(1)),
+        }
+    )
+
+    collector = _collector(site, cache)
+    result = await collector.collect("example.com")
+    assert result["feed_url"] == "https://example.com/p.xml"
     assert result["recent_entries_30d"] == 1
-    assert result["feed_url"] == "https://example.com/feed"
+
+    site.requested.clear()
+    again = await collector.collect("https://example.com/")
+    assert again["feed_url"] == "https://example.com/p.xml"
+    assert site.requested == ["https://example.com/p.xml"]
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_remembers_feed_locations_per_blog_not_per_host(cache):
+    def homepage(feed_path: str) -> tuple[float, httpx.Response]:
+        link = f'<link rel="alternate" type="application/rss+xml" href="{feed_path}">'
+        return _ok(f"<html><head>{link}</head></html>")
+
+    site = StubSite(
+        {
+            "https://medium.com/@alice": homepage("/feed/@alice"),
+            "https://medium.com/feed/@alice": _ok(_feed_xml(1)),
+            "https://medium.com/@bob": homepage("/feed/@bob"),
+            "https://medium.com/feed/@bob": _ok(_feed_xml(2)),
+        }
+    )
+    collector = _collector(site, cache)
+
+    alice = await collector.collect("https://medium.com/@alice")
+    bob = await collector.collect("https://medium.com/@bob")
+    carol = await collector.collect("https://medium.com/@carol")
+
+    assert alice["feed_url"] == "https://medium.com/feed/@alice"
+    assert bob["feed_url"] == "https://medium.com/feed/@bob"
+    assert carol["feed_url"] == ""
+    # Carol's cached "no feed" is hers alone.
+    assert cache.get_entry("rss-location:medium.com/@carol").data == {"feed_url": ""}
+    assert await collector.collect("https://medium.com/@bob") == bob
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_skips_hosts_cached_without_feed(cache):
+    site = StubSite({})
+    collector = _collector(site, cache)
+    await collector.collect("https://example.com")
+
+    site.routes["https://example.com/feed"] = _ok(_feed_xml())
+    result = await collector.collect("https://example.com")
+    assert result["feed_url"] == ""
+    assert result["blog_url"] == "https://example.com"
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_reads_atom_and_dublin_core_dates(cache):
+    xml = (
+        '<feed xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<entry><updated>{datetime.now(timezone.utc).isoformat()}</updated></entry>"
+        "<entry><published>2020-01-01T00:00:00Z</published></entry>"
+        "<entry><dc:date>2021-01-01T00:00:00Z</dc:date></entry>"
+        "<updated>2019-01-01T00:00:00Z</updated>"
+        "</feed>"
+    )
+    site = StubSite({"https://example.com/atom.xml": _ok(xml)})
+    result = await _collector(site, cache).collect("https://example.com/atom.xml")
+    assert result["recent_entries_30d"] == 1
+    assert result["last_post_at"].startswith(str(datetime.now(timezone.utc).year))
+
+
+class ChunkedFeed:
+    """Streams a feed entry by entry and counts how much of it was consumed."""
+
+    def __init__(self, entries: list[str], tail: str = "</channel></rss>"):
+        self.chunks = [b"<rss><channel>", *(entry.encode() for entry in entries), tail.encode()]
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_stops_once_entries_leave_the_window(cache):
+    entries = [f"<item><pubDate>{_rfc822(day)}</pubDate></item>" for day in (1, 2, 40)]
+    entries += [f"<item><pubDate>{_rfc822(40 + day)}</pubDate></item>" for day in range(50)]
+    feed = ChunkedFeed(entries)
+    site = StubSite({"https://example.com/feed": (0.0, httpx.Response(200, content=feed))})
+
+    result = await _collector(site, cache).collect("https://example.com/feed")
+    assert result["recent_entries_30d"] == 2
+    assert result["last_post_at"][:10] == (
+        datetime.now(timezone.utc) - timedelta(days=1)
+    ).date().isoformat()
+    assert feed.sent < len(feed.chunks) / 2
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_reads_unsorted_feeds_to_the_end(cache):
+    entries = [f"<item><pubDate>{_rfc822(day)}</pubDate></item>" for day in (60, 50, 70, 80)]
+    entries += [f"<item><pubDate>{_rfc822(100 + day)}</pubDate></item>" for day in range(10)]
+    entries.append(f"<item><pubDate>{_rfc822(3)}</pubDate></item>")
+    feed = ChunkedFeed(entries)
+    site = StubSite({"https://example.com/feed": (0.0, httpx.Response(200, content=feed))})
+
+    result = await _collector(site, cache).collect("https://example.com/feed")
+    assert result["recent_entries_30d"] == 1
+    assert feed.sent == len(feed.chunks)
 
 
 @pytest.mark.asyncio
-async def test_rss_collector_handles_missing_feed(monkeypatch):
+async def test_rss_collector_caps_bytes_read_per_feed(monkeypatch, cache):
     monkeypatch.setattr(
-        rss_module.httpx,
-        "AsyncClient",
-        lambda **_kwargs: FakeClient([FakeResponse(404, "missing")] * 5),
+        rss_module,
+        "settings",
+        replace(rss_module.settings, rss_max_feed_bytes=200),
     )
-    result = await RssCollector().collect("https://example.com")
+    entries = [f"<item><pubDate>{_rfc822(1)}</pubDate></item>" for _ in range(100)]
+    feed = ChunkedFeed(entries)
+    site = StubSite({"https://example.com/feed": (0.0, httpx.Response(200, content=feed))})
+
+    result = await _collector(site, cache).collect("https://example.com/feed")
+    assert 0 < result["recent_entries_30d"] < 100
+    assert feed.sent < 10
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_rejects_malformed_feed(cache):
+    site = StubSite({"https://example.com/feed": _ok("<rss><channel><item>")})
+    result = await _collector(site, cache).collect("https://example.com/feed")
+    assert result["feed_url"] == ""
+
+
+class RevalidatingFeed:
+    """Serves one feed with an ETag and answers 304 when the client already has it.
+
+    Conditional requests can be slowed down by `revalidation_delay` or failed with
+    `revalidation_status`.
+    """
+
+    def __init__(self, body: str, etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.conditional: list[str | None] = []
+        self.revalidation_delay = 0.0
+        self.revalidation_status: int | None = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if str(request.url) != "https://example.com/feed":
+            return httpx.Response(404)
+        sent = request.headers.get("If-None-Match")
+        self.conditional.append(sent)
+        if sent is not None:
+            await asyncio.sleep(self.revalidation_delay)
+            if self.revalidation_status is not None:
+                return httpx.Response(self.revalidation_status)
+        if sent == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, text=self.body, headers={"ETag": self.etag})
+
+
+def _revalidating_collector(feed: RevalidatingFeed, cache: CacheStore) -> RssCollector:
+    return RssCollector(http=SharedHttpClient(transport=httpx.MockTransport(feed)), cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_serves_fresh_results_from_cache(cache):
+    feed = RevalidatingFeed(_feed_xml(1))
+    collector = _revalidating_collector(feed, cache)
+
+    first = await collector.collect("https://example.com/feed")
+    second = await collector.collect("https://EXAMPLE.com/feed/")
+    assert second["recent_entries_30d"] == first["recent_entries_30d"] == 1
+    assert second["blog_url"] == "https://EXAMPLE.com/feed/"
+    assert feed.conditional == [None]
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_revalidates_stale_results(monkeypatch, cache):
+    monkeypatch.setattr(
+        rss_module,
+        "settings",
+        replace(rss_module.settings, rss_cache_ttl_seconds=0),
+    )
+    feed = RevalidatingFeed(_feed_xml(1))
+    collector = _revalidating_collector(feed, cache)
+    await collector.collect("https://example.com/feed")
+
+    key = "rss:example.com/feed"
+    stored = cache.get_entry(key)
+    # Pretend the only recent post was read long ago: it has since left the window.
+    aged = (datetime.now(timezone.utc) - timedelta(days=31)).isoformat()
+    cache.set(key, {**stored.data, "recent_entries": [aged]}, meta=stored.meta)
+
+    result = await collector.collect("https://example.com/feed")
+    assert feed.conditional == [None, '"v1"']
     assert result["recent_entries_30d"] == 0
+    assert cache.get_entry(key).data["recent_entries"] == [aged]
+
+    feed.etag = '"v2"'
+    refreshed = await collector.collect("https://example.com/feed")
+    assert refreshed["recent_entries_30d"] == 1
+    assert cache.get_entry(key).meta == {"validators": {"etag": '"v2"'}}
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_does_not_remember_a_missing_feed_after_server_errors(cache):
+    site = StubSite({"https://example.com": (0.0, httpx.Response(503))})
+    site.routes.update(
+        {f"https://example.com{path}": (0.0, httpx.Response(503)) for path in ("/feed", "/rss")}
+    )
+    collector = _collector(site, cache)
+
+    result = await collector.collect("https://example.com")
+    assert result["feed_url"] == ""
+    assert cache.get_entry("rss-location:example.com") is None
+    assert cache.get_entry("rss:example.com") is None
+
+    site.routes["https://example.com/feed"] = _ok(_feed_xml(1))
+    recovered = await collector.collect("https://example.com")
+    assert recovered["feed_url"] == "https://example.com/feed"
+    assert recovered["recent_entries_30d"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_treats_transport_errors_as_inconclusive(cache):
+    async def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    http = SharedHttpClient(transport=httpx.MockTransport(refuse))
+    result = await RssCollector(http=http, cache=cache).collect("https://example.com")
+    assert result["feed_url"] == ""
+    assert cache.get_entry("rss-location:example.com") is None
+
+
+async def _stale_cached_feed(monkeypatch, cache, feed: RevalidatingFeed) -> RssCollector:
+    monkeypatch.setattr(
+        rss_module,
+        "settings",
+        replace(rss_module.settings, rss_cache_ttl_seconds=0, rss_scan_deadline_seconds=0.05),
+    )
+    collector = _revalidating_collector(feed, cache)
+    first = await collector.collect("https://example.com/feed")
+    assert first["recent_entries_30d"] == 1
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_keeps_cached_result_when_revalidation_is_slow(monkeypatch, cache):
+    feed = RevalidatingFeed(_feed_xml(1))
+    collector = await _stale_cached_feed(monkeypatch, cache, feed)
+    stored = cache.get_entry("rss:example.com/feed")
+
+    feed.revalidation_delay = 1.0
+    for _ in range(2):
+        result = await collector.collect("https://example.com/feed")
+        assert result["feed_url"] == "https://example.com/feed"
+        assert result["recent_entries_30d"] == 1
+    assert cache.get_entry("rss:example.com/feed") == stored
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_keeps_cached_result_when_revalidation_fails(monkeypatch, cache):
+    feed = RevalidatingFeed(_feed_xml(1))
+    collector = await _stale_cached_feed(monkeypatch, cache, feed)
+    stored = cache.get_entry("rss:example.com/feed")
+
+    feed.revalidation_status = 503
+    result = await collector.collect("https://example.com/feed")
+    assert result["recent_entries_30d"] == 1
+    assert cache.get_entry("rss:example.com/feed") == stored
+
+    feed.revalidation_status = None
+    assert (await collector.collect("https://example.com/feed"))["recent_entries_30d"] == 1
+    assert feed.conditional == [None, '"v1"', '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_rss_collector_does_not_cache_a_discovery_cut_short(monkeypatch, cache):
+    monkeypatch.setattr(
+        rss_module,
+        "settings",
+        replace(rss_module.settings, rss_scan_deadline_seconds=0.05),
+    )
+    site = StubSite({"https://example.com/feed": (1.0, httpx.Response(200, text=_feed_xml()))})
+    result = await _collector(site, cache).collect("https://example.com")
     assert result["feed_url"] == ""
+    assert cache.get_entry("rss:example.com") is None
@@ -1,10 +1,18 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from reputation_pulse.scan_service import ScanService
 
 
 class DummyAnalyzer:
+    def __init__(self) -> None:
+        self.calls = 0
+
     async def run(self, _handle: str) -> dict[str, object]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
         return {
             "handle": "g-dos",
             "github": {"followers": 10, "stars": 5, "recent_repos": []},
@@ -14,14 +22,20 @@ class DummyAnalyzer:
 
 
 class DummyStore:
-    def __init__(self) -> None:
+    def __init__(self, scanned_at: str | None = None) -> None:
         self.saved = None
+        self.saves = 0
+        self.scanned_at = scanned_at or "2026-01-01T00:00:00+00:00"
 
     def latest_scan_for_handle(self, _handle: str):
-        return {"normalized_score": 10.0}
+        return {"normalized_score": 10.0, "scanned_at": self.scanned_at}
+
+    def latest_result_for_handle(self, _handle: str):
+        return {"handle": "g-dos", "stored": True}
 
     def save_scan(self, result: dict[str, object]) -> None:
         self.saved = result
+        self.saves += 1
 
 
 @pytest.mark.asyncio
@@ -31,3 +45,60 @@ async def test_scan_service_adds_trend_and_saves():
     result = await service.run_and_store("g-dos")
     assert result["trend"]["direction"] == "up"
     assert store.saved is not None
+
+
+@pytest.mark.asyncio
+async def test_scan_service_coalesces_concurrent_scans_of_same_handle():
+    analyzer = DummyAnalyzer()
+    store = DummyStore()
+    service = ScanService(analyzer=analyzer, store=store)
+
+    results = await asyncio.gather(
+        service.run_and_store("g-dos"),
+        service.run_and_store("@g-dos"),
+        service.run_and_store(" g-dos "),
+    )
+    assert analyzer.calls == 1
+    assert store.saves == 1
+    assert all(result["trend"]["direction"] == "up" for result in results)
+    assert results[0] is not results[1]
+
+    await service.run_and_store("g-dos")
+    assert analyzer.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_service_returns_recent_stored_result_within_window():
+    analyzer = DummyAnalyzer()
+    store = DummyStore(scanned_at=datetime.now(timezone.utc).isoformat())
+    service = ScanService(analyzer=analyzer, store=store, recent_scan_window_seconds=60)
+
+    result = await service.run_and_store("g-dos")
+    assert result == {"handle": "g-dos", "stored": True}
+    assert analyzer.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_scan_service_rescans_outside_window():
+    analyzer = DummyAnalyzer()
+    scanned_at = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+    service = ScanService(
+        analyzer=analyzer,
+        store=DummyStore(scanned_at=scanned_at),
+        recent_scan_window_seconds=60,
+    )
+
+    await service.run_and_store("g-dos")
+    assert analyzer.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_scan_service_run_many_saves_each_result():
+    store = DummyStore()
+    service = ScanService(analyzer=DummyAnalyzer(), store=store)
+
+    records = [record async for record in service.run_many(["a", "b", "@a", ""], concurrency=2)]
+
+    assert sorted(record.handle for record in records) == ["", "a", "b"]
+    assert [record.error_type for record in records if not record.ok] == ["InvalidHandleError"]
+    assert store.saves == 2
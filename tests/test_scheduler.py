@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from reputation_pulse.errors import InvalidHandleError, UpstreamNotFoundError
+from reputation_pulse.scheduler import RescanScheduler, ScheduledHandle, next_interval
+from reputation_pulse.settings import settings
+from reputation_pulse.storage import ScanStore
+
+DAY = 86400.0
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(0)
+        self.now += seconds
+
+
+class ScriptedScans:
+    """Returns a fixed score per handle (a list is consumed one scan at a time)."""
+
+    def __init__(self, clock: FakeClock, scores: dict[str, object]):
+        self.clock = clock
+        self.scores = scores
+        self.calls: list[tuple[str, float]] = []
+
+    async def run_and_store(self, handle: str) -> dict[str, object]:
+        self.calls.append((handle, self.clock.now))
+        score = self.scores[handle]
+        if isinstance(score, list):
+            score = score.pop(0)
+        if score is None:
+            raise UpstreamNotFoundError(f"GitHub user '{handle}' was not found")
+        return {"handle": handle, "github": {"recent_repos": []}, "score": {"normalized": score}}
+
+
+def _result(score: float, pushed_at: str | None = None) -> dict[str, object]:
+    repos = [{"pushed_at": pushed_at}] if pushed_at else []
+    return {"github": {"recent_repos": repos}, "score": {"normalized": score}}
+
+
+def test_next_interval_adapts_to_change():
+    entry = ScheduledHandle(0.0, "g-dos", interval_seconds=DAY, last_score=10.0)
+    assert next_interval(entry, _result(10.0)) == 2 * DAY
+    assert next_interval(entry, _result(15.0)) == DAY / 2
+    assert next_interval(entry, _result(10.0, pushed_at="2026-01-01T00:00:00Z")) == DAY / 2
+
+    fresh = ScheduledHandle(0.0, "new", interval_seconds=DAY)
+    assert next_interval(fresh, _result(10.0)) == DAY
+
+    dormant = ScheduledHandle(0.0, "old", interval_seconds=settings.scheduler_max_interval_seconds)
+    dormant.last_score = 10.0
+    assert next_interval(dormant, _result(10.0)) == settings.scheduler_max_interval_seconds
+
+
+def test_scheduler_refuses_to_track_malformed_handles(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    scheduler = RescanScheduler(ScriptedScans(FakeClock(), {}), store)
+
+    with pytest.raises(InvalidHandleError):
+        scheduler.track(["g-dos", "Bad Handle!"])
+    assert store.scan_schedule() == []
+
+    assert scheduler.track([" @g-dos ", "g-dos"]) == 1
+    assert [row["handle"] for row in store.scan_schedule()] == ["g-dos"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rescans_active_handles_more_often_and_persists(tmp_path):
+    clock = FakeClock()
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    scans = ScriptedScans(
+        clock,
+        {"active": [10.0, 20.0, 30.0, 40.0, 50.0], "dormant": 10.0, "ghost": None},
+    )
+    scheduler = RescanScheduler(scans, store, concurrency=2, clock=clock, sleep=clock.sleep)
+    assert scheduler.track(["active", "dormant", "@active", "ghost"]) == 3
+    assert scheduler.track(["active"]) == 0
+
+    await scheduler.run(max_scans=8)
+
+    handles = [handle for handle, _ in scans.calls]
+    assert handles.count("active") > handles.count("dormant")
+    schedule = {row["handle"]: row for row in store.scan_schedule()}
+    assert schedule["active"]["interval_seconds"] < DAY
+    assert schedule["dormant"]["interval_seconds"] > DAY
+    assert schedule["ghost"]["failures"] >= 1
+
+    resumed = RescanScheduler(scans, store, clock=clock, sleep=clock.sleep)
+    resumed.load()
+    soonest = min(schedule.values(), key=lambda row: row["next_scan_at"])
+    assert resumed._heap[0].handle == soonest["handle"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_paces_scan_starts(tmp_path):
+    clock = FakeClock()
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    scans = ScriptedScans(clock, {f"user-{index}": 10.0 for index in range(4)})
+    scheduler = RescanScheduler(
+        scans, store, concurrency=4, scans_per_minute=6, clock=clock, sleep=clock.sleep
+    )
+    scheduler.track(scans.scores)
+
+    await scheduler.run(max_scans=4)
+
+    starts = [started for _, started in scans.calls]
+    assert [round(later - earlier) for earlier, later in zip(starts, starts[1:])] == [10, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_picks_up_handles_tracked_while_running(tmp_path):
+    clock = FakeClock()
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    scans = ScriptedScans(clock, {"early": 10.0, "late": 20.0})
+    poll = settings.scheduler_idle_poll_seconds
+    started_at = clock.now
+    tracked_at: list[float] = []
+
+    async def sleep_then_track(seconds: float) -> None:
+        await clock.sleep(seconds)
+        # Once "early" is back in the heap, due a day out, another process tracks "late".
+        if not tracked_at and clock.now - started_at >= 2 * poll:
+            RescanScheduler(scans, store, clock=clock).track(["late"])
+            tracked_at.append(clock.now)
+
+    scheduler = RescanScheduler(scans, store, clock=clock, sleep=sleep_then_track)
+    scheduler.track(["early"])
+    await scheduler.run(max_scans=2)
+
+    assert [handle for handle, _ in scans.calls] == ["early", "late"]
+    assert scans.calls[1][1] - tracked_at[0] <= poll
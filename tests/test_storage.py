@@ -1,3 +1,9 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import reputation_pulse.storage as storage_module
 from reputation_pulse.storage import ScanStore
 
 
@@ -49,13 +55,22 @@ def test_store_handle_insights(tmp_path):
 def test_store_latest_result_handles_corrupt_payload(tmp_path):
     db_path = tmp_path / "store.db"
     store = ScanStore(db_path=str(db_path))
+    store.save_scan(_sample_result("g-dos", 12.0))
     with store._connect() as conn:  # noqa: SLF001 - intentional white-box test
-        conn.execute(
+        cursor = conn.execute(
             """
-            INSERT INTO scans (handle, normalized_score, rating, payload, scanned_at)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO scans (handle, normalized_score, rating, scanned_at)
+            VALUES (?, ?, ?, ?)
             """,
-            ("g-dos", 10.0, "Stable", "{bad", "2026-01-01T00:00:00+00:00"),
+            ("g-dos", 10.0, "Stable", "2026-01-01T00:00:00+00:00"),
+        )
+        blob = conn.execute(
+            "INSERT INTO payload_blobs (digest, codec, data) VALUES (?, 'zlib', ?)",
+            (b"bad", b"{bad"),
+        )
+        conn.execute(
+            "INSERT INTO scan_payloads (scan_id, blob_id) VALUES (?, ?)",
+            (cursor.lastrowid, blob.lastrowid),
         )
         conn.commit()
 
@@ -74,3 +89,126 @@ def test_store_score_series_orders_oldest_to_newest(tmp_path):
     assert len(series) == 2
     assert series[0]["normalized_score"] == 20.0
     assert series[1]["normalized_score"] == 30.0
+
+
+def test_store_repo_ledger_replace_and_update(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    assert store.repo_ledger("g-dos") is None
+
+    store.replace_repo_ledger("g-dos", {"a": {"stars": 1, "pushed_at": "2024-01-01T00:00:00Z"}})
+    store.update_repo_ledger("g-dos", {"b": {"stars": 2, "pushed_at": None}})
+    store.update_repo_ledger("g-dos", {"a": {"stars": 5, "pushed_at": "2024-02-01T00:00:00Z"}})
+
+    ledger = store.repo_ledger("g-dos")
+    assert ledger["full_refresh_at"]
+    assert ledger["repos"] == {
+        "a": {"stars": 5, "pushed_at": "2024-02-01T00:00:00Z"},
+        "b": {"stars": 2, "pushed_at": None},
+    }
+
+    store.replace_repo_ledger("g-dos", {})
+    assert store.repo_ledger("g-dos")["repos"] == {}
+
+
+def test_store_reuses_one_wal_connection_per_thread(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    with store._connect() as first, store._connect() as second:  # noqa: SLF001
+        assert first is second
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other = pool.submit(lambda: store._connect().__enter__()).result()  # noqa: SLF001
+    assert other is not first
+    store.close()
+
+
+def test_store_readers_are_not_blocked_by_open_write(tmp_path):
+    db_path = str(tmp_path / "store.db")
+    writer = ScanStore(db_path=db_path)
+    reader = ScanStore(db_path=db_path)
+    writer.save_scan(_sample_result("g-dos", 10.0))
+
+    with writer._connect() as conn:  # noqa: SLF001 - hold the write lock mid-transaction
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("UPDATE scans SET normalized_score = 99")
+        started = time.monotonic()
+        assert reader.latest_scan_for_handle("g-dos")["normalized_score"] == 10.0
+        assert time.monotonic() - started < 1.0
+    assert writer.latest_scan_for_handle("g-dos")["normalized_score"] == 10.0
+
+
+def test_store_handle_stats_match_a_rebuild(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    for score in (10.0, 30.0, 5.0):
+        store.save_scan(_sample_result("g-dos", score))
+    store.save_scan(_sample_result("other", 50.0))
+
+    incremental = store.handle_insights("g-dos")
+    assert incremental["scans_count"] == 3
+    assert incremental["average_score"] == 15.0
+    assert incremental["min_score"] == 5.0
+    assert incremental["latest_score"] == 5.0
+
+    assert store.rebuild_handle_stats() == 2
+    assert store.handle_insights("g-dos") == incremental
+    assert store.handle_insights("missing") is None
+
+
+def _blobs(store: ScanStore) -> list[tuple[str, int]]:
+    with store._connect() as conn:  # noqa: SLF001 - intentional white-box test
+        return conn.execute("SELECT codec, depth FROM payload_blobs ORDER BY id").fetchall()
+
+
+def test_store_keeps_identical_payloads_once(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    store.save_scan(_sample_result("g-dos", 12.0))
+    store.save_scan(_sample_result("g-dos", 12.0))
+    store.save_scan(_sample_result("other", 12.0))
+
+    assert len(_blobs(store)) == 2
+    assert store.latest_result_for_handle("g-dos") == _sample_result("g-dos", 12.0)
+
+
+def test_store_writes_rescans_as_bounded_delta_chains(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        storage_module,
+        "settings",
+        replace(storage_module.settings, payload_max_delta_depth=2),
+    )
+    store = ScanStore(db_path=str(tmp_path / "store.db"))
+    repos = [{"name": f"repo-{index}", "pushed_at": "2026-01-01T00:00:00Z"} for index in range(40)]
+    for score in (10.0, 11.0, 12.0, 13.0, 14.0):
+        result = _sample_result("g-dos", score)
+        result["github"]["recent_repos"] = repos
+        store.save_scan(result)
+
+    assert _blobs(store) == [
+        ("zlib-d1", 0),
+        ("zlib-delta", 1),
+        ("zlib-delta", 2),
+        ("zlib-d1", 0),
+        ("zlib-delta", 1),
+    ]
+    latest = store.latest_result_for_handle("g-dos")
+    assert latest["score"]["normalized"] == 14.0
+    assert latest["github"]["recent_repos"] == repos
+
+
+def test_store_concurrent_writers_share_identical_payloads(tmp_path):
+    db_path = str(tmp_path / "store.db")
+    stores = [ScanStore(db_path=db_path), ScanStore(db_path=db_path)]
+    rounds = 100
+    barrier = threading.Barrier(len(stores), timeout=10)
+
+    def save_all(store: ScanStore) -> None:
+        for index in range(rounds):
+            barrier.wait()
+            store.save_scan(_sample_result("g-dos", float(index)))
+
+    with ThreadPoolExecutor(max_workers=len(stores)) as pool:
+        for future in [pool.submit(save_all, store) for store in stores]:
+            future.result()
+
+    assert stores[0].handle_insights("g-dos")["scans_count"] == rounds * len(stores)
+    assert len(_blobs(stores[0])) == rounds
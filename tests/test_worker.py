@@ -0,0 +1,140 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+import reputation_pulse.storage as storage_module
+import reputation_pulse.worker as worker_module
+from reputation_pulse.errors import CollectorError, UpstreamNotFoundError
+from reputation_pulse.storage import ScanStore
+from reputation_pulse.worker import QueueWorker
+
+
+class FlakyScanService:
+    def __init__(self, failures: dict[str, Exception]):
+        self.failures = failures
+        self.calls: list[str] = []
+
+    async def run_and_store(self, handle: str) -> dict[str, object]:
+        self.calls.append(handle)
+        if handle in self.failures:
+            raise self.failures[handle]
+        return {"handle": handle}
+
+
+def test_queue_leases_each_item_once_across_connections(tmp_path):
+    db_path = str(tmp_path / "queue.db")
+    ScanStore(db_path=db_path).enqueue_handles([f"user-{index}" for index in range(40)])
+
+    def drain(owner: str) -> list[int]:
+        store = ScanStore(db_path=db_path)
+        claimed = []
+        while (item := store.claim_work(owner, lease_seconds=60)) is not None:
+            claimed.append(item["id"])
+        return claimed
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        batches = list(pool.map(drain, ["a", "b", "c", "d"]))
+
+    claimed = [item_id for batch in batches for item_id in batch]
+    assert sorted(claimed) == list(range(1, 41))
+
+
+def test_queue_expired_lease_is_claimed_again(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "queue.db"))
+    assert store.enqueue_handles(["g-dos", "g-dos"], now=1000.0) == 1
+
+    first = store.claim_work("a", lease_seconds=30, now=1000.0)
+    assert store.claim_work("b", lease_seconds=60, now=1029.0) is None
+    assert store.queue_stats(now=1029.0)["leased"] == 1
+    second = store.claim_work("b", lease_seconds=60, now=1030.0)
+
+    assert second["id"] == first["id"]
+    assert second["attempts"] == 2
+    assert not store.complete_work(first["id"], "a")
+    assert store.complete_work(second["id"], "b")
+    assert store.queue_stats(now=1030.0)["done"] == 1
+
+
+def test_queue_failed_item_waits_out_its_retry_delay(tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "queue.db"))
+    store.enqueue_handles(["g-dos"], now=1000.0)
+    item = store.claim_work("a", lease_seconds=60, now=1000.0)
+
+    assert store.fail_work(item["id"], "a", "CollectorError: boom", 30, now=1010.0)
+    assert store.queue_stats(now=1010.0)["retrying"] == 1
+    assert store.claim_work("b", lease_seconds=60, now=1039.0) is None
+    assert store.claim_work("b", lease_seconds=60, now=1040.0)["attempts"] == 2
+
+
+def test_queue_dead_letters_an_item_whose_final_lease_expires(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        storage_module,
+        "settings",
+        replace(storage_module.settings, queue_max_attempts=2),
+    )
+    store = ScanStore(db_path=str(tmp_path / "queue.db"))
+    store.enqueue_handles(["hangs", "g-dos"], now=1000.0)
+
+    assert store.claim_work("a", lease_seconds=30, now=1000.0)["handle"] == "hangs"
+    assert store.claim_work("b", lease_seconds=30, now=1000.0)["handle"] == "g-dos"
+    assert store.complete_work(2, "b")
+    assert store.claim_work("c", lease_seconds=30, now=1030.0)["attempts"] == 2
+    # The second and final lease runs out as well: dead-letter instead of leasing again.
+    assert store.claim_work("d", lease_seconds=30, now=1060.0) is None
+    assert store.queue_stats(now=1060.0) == {
+        "ready": 0,
+        "leased": 0,
+        "retrying": 0,
+        "done": 1,
+        "dead": 1,
+    }
+    assert not store.complete_work(1, "c")
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_queue_calls_off_the_event_loop(monkeypatch, tmp_path):
+    store = ScanStore(db_path=str(tmp_path / "queue.db"))
+    store.enqueue_handles(["g-dos", "flaky"])
+    loop_thread = threading.current_thread()
+    threads: list[threading.Thread] = []
+
+    def recording(method):
+        def call(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return method(*args, **kwargs)
+
+        return call
+
+    for name in ("claim_work", "complete_work", "fail_work"):
+        monkeypatch.setattr(store, name, recording(getattr(store, name)))
+
+    scans = FlakyScanService({"flaky": CollectorError("boom")})
+    await QueueWorker(scans, store, concurrency=1).run(until_empty=True)
+
+    # claim, complete, claim, fail, then the claim that finds nothing ready
+    assert len(threads) == 5
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_then_dead_letters(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        worker_module,
+        "settings",
+        replace(worker_module.settings, queue_max_attempts=2, queue_retry_delay_seconds=0),
+    )
+    store = ScanStore(db_path=str(tmp_path / "queue.db"))
+    store.enqueue_handles(["g-dos", "ghost", "flaky"])
+    scans = FlakyScanService(
+        {"ghost": UpstreamNotFoundError("missing"), "flaky": CollectorError("boom")}
+    )
+
+    queue_worker = QueueWorker(scans, store, concurrency=2)
+    processed = await queue_worker.run(until_empty=True)
+
+    assert processed == 1
+    assert scans.calls.count("ghost") == 1
+    assert scans.calls.count("flaky") == 2
+    assert store.queue_stats() == {"ready": 0, "leased": 0, "retrying": 0, "done": 1, "dead": 2}